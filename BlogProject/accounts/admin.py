@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
-from .models import Profile, User
+from .models import OutboxEmail, Profile, User
 
 
 class CustomUserAdmin(UserAdmin):
@@ -51,3 +51,10 @@ class CustomUserAdmin(UserAdmin):
 
 admin.site.register(User, CustomUserAdmin)
 admin.site.register(Profile)
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "sent_date")
+    list_filter = ("status",)
+    search_fields = ("subject",)
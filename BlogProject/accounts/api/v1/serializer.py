@@ -3,8 +3,10 @@ from django.contrib.auth.password_validation import validate_password
 from django.core import exceptions
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from ...authentication import check_login_busy
 from ...models import Profile, User
 
 
@@ -55,6 +57,7 @@ class CustomAuthTokenSerializer(serializers.Serializer):
             # The authenticate call simply returns None for is_active=False
             # users. (Assuming the default ModelBackend authentication backend.)
             if not user:
+                check_login_busy(self.context.get("request"))
                 msg = _("Unable to log in with provided credentials.")
                 raise serializers.ValidationError(msg, code="authorization")
             if not user.is_verified:
@@ -71,7 +74,13 @@ class CustomAuthTokenSerializer(serializers.Serializer):
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
     def validate(self, attrs):
-        validated_data = super(CustomTokenObtainPairSerializer, self).validate(attrs)
+        try:
+            validated_data = super(CustomTokenObtainPairSerializer, self).validate(
+                attrs
+            )
+        except AuthenticationFailed:
+            check_login_busy(self.context.get("request"))
+            raise
         if not self.user.is_verified:
             msg = _("User is not verified.")
             raise serializers.ValidationError(msg, code="authorization")
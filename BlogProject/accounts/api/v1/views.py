@@ -1,6 +1,5 @@
 import jwt
 from django.conf import settings
-from mail_templated import EmailMessage
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
@@ -19,13 +18,14 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView,
 )
 
+from accounts.emails import activation_email, reset_password_email
 from accounts.models import Profile, User
+from accounts.outbox import queue_email
 from accounts.services import (
     generate_activation_token,
     generate_reset_password_token,
 )
 
-from ..utils import EmailThread
 from .serializer import (
     ActivationResendSerializer,
     ChangePasswordSerializer,
@@ -54,23 +54,15 @@ class RegistrationApiView(GenericAPIView):
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-
-        user_email = serializer.validated_data["email"]
-        user_obj = get_object_or_404(User, email=user_email)
+        user_obj = serializer.save()
+        user_email = user_obj.email
 
         token = generate_activation_token(user_obj)
         activation_link = request.build_absolute_uri(
             reverse("accounts:api-v1:activation", kwargs={"token": token})
         )
 
-        email_obj = EmailMessage(
-            template_name="email/activation_email.html",
-            context={"activation_link": activation_link},
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user_email],
-        )
-        EmailThread(email_obj).start()
+        queue_email(activation_email(user_email, activation_link))
 
         return Response({"email": user_email}, status=status.HTTP_201_CREATED)
 
@@ -112,7 +104,11 @@ class CustomDiscardAuthToken(APIView):
     swagger_description = {"post": "Deletes the current user's DRF token."}
 
     def post(self, request):
-        request.user.auth_token.delete()
+        if isinstance(request.auth, Token):
+            # token authentication: the token is known, no need to load it
+            request.auth.delete()
+        else:
+            request.user.auth_token.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -187,7 +183,7 @@ class ChangePasswordApiView(GenericAPIView):
 
             # set_password also hashes the password that the user will get
             self.object.set_password(serializer.data.get("new_password"))
-            self.object.save()
+            self.object.save(update_fields=["password", "updated_date"])
 
             response = {
                 "status": "success",
@@ -224,13 +220,7 @@ class ResetPasswordRequestApiView(GenericAPIView):
                 )
             )
 
-            email_obj = EmailMessage(
-                template_name="email/reset_password_email.html",
-                context={"reset_link": reset_link},
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[user.email],
-            )
-            EmailThread(email_obj).start()
+            queue_email(reset_password_email(user.email, reset_link))
 
         return Response(
             {"detail": "If the email exists, a reset link has been sent."},
@@ -270,7 +260,7 @@ class ResetPasswordConfirmApiView(GenericAPIView):
         serializer.is_valid(raise_exception=True)
 
         user.set_password(serializer.validated_data["password"])
-        user.save()
+        user.save(update_fields=["password", "updated_date"])
 
         return Response(
             {"detail": "Password reset successfully"},
@@ -283,7 +273,8 @@ class ResetPasswordConfirmApiView(GenericAPIView):
 # -----------------------------
 class ProfileApiView(RetrieveUpdateAPIView):
     serializer_class = ProfileSerializer
-    queryset = Profile.objects.all()
+    # the serializer shows user.email
+    queryset = Profile.objects.select_related("user")
 
     swagger_tags = ["Accounts / Profile"]
     swagger_summary = {
@@ -299,7 +290,8 @@ class ProfileApiView(RetrieveUpdateAPIView):
 
     def get_object(self):
         queryset = self.get_queryset()
-        return get_object_or_404(queryset, user=self.request.user)
+        # by id: request.user may be a CachedUser, not loaded yet
+        return get_object_or_404(queryset, user_id=self.request.user.id)
 
 
 # -----------------------------
@@ -329,15 +321,17 @@ class ActivationApiView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user_obj = get_object_or_404(User, id=user_id)
-        if user_obj.is_verified:
-            return Response({"details": "Your account has already been verified."})
+        if User.objects.mark_verified(user_id):
+            return Response(
+                {
+                    "details": "Your account has been verified "
+                    "and activated successfully."
+                }
+            )
 
-        user_obj.is_verified = True
-        user_obj.save()
-        return Response(
-            {"details": "Your account has been verified and activated successfully."}
-        )
+        # nothing updated: either verified already or no such user
+        get_object_or_404(User.objects.only("id"), id=user_id)
+        return Response({"details": "Your account has already been verified."})
 
 
 class ActivationResendApiView(GenericAPIView):
@@ -360,13 +354,7 @@ class ActivationResendApiView(GenericAPIView):
             reverse("accounts:api-v1:activation", kwargs={"token": token})
         )
 
-        email_obj = EmailMessage(
-            template_name="email/activation_email.html",
-            context={"activation_link": activation_link},
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user_obj.email],
-        )
-        EmailThread(email_obj).start()
+        queue_email(activation_email(user_obj.email, activation_link))
 
         return Response(
             {"details": "Your activation code has been resent successfully."},
@@ -396,12 +384,6 @@ class TestEmailSend(APIView):
             reverse("accounts:api-v1:activation", kwargs={"token": token})
         )
 
-        email_obj = EmailMessage(
-            template_name="email/activation_email.html",
-            context={"activation_link": activation_link},
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[email],
-        )
-        EmailThread(email_obj).start()
+        queue_email(activation_email(email, activation_link))
 
         return Response(f"The activation email was sent to {email} ...")
@@ -0,0 +1,221 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import (
+    BaseAuthentication,
+    BasicAuthentication,
+    SessionAuthentication,
+    TokenAuthentication,
+    get_authorization_header,
+)
+from rest_framework.authtoken.models import Token
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import User
+
+# cached value of a token that does not exist, so bad tokens are cached too
+MISSING = "missing"
+
+
+def user_cache_key(user_id):
+    return f"accounts:auth:user:{user_id}"
+
+
+def token_cache_key(key):
+    # the key is a credential: never store it in clear in cache keys
+    return f"accounts:auth:token:{hashlib.sha256(key.encode()).hexdigest()}"
+
+
+def get_cached_user_state(user_id):
+    """
+    Return whether the user is active, from a cache entry living
+    AUTH_CACHE_TIMEOUT seconds, or None if it does not exist. Only this
+    flag is cached, never the user (its password hash included); entries
+    are dropped by the signals of accounts.signals on every user write.
+    """
+    key = user_cache_key(user_id)
+    state = cache.get(key)
+    if state is None:
+        is_active = (
+            User.objects.filter(pk=user_id).values_list("is_active", flat=True).first()
+        )
+        state = MISSING if is_active is None else is_active
+        cache.set(key, state, settings.AUTH_CACHE_TIMEOUT)
+    return None if state == MISSING else state
+
+
+class CachedUser(SimpleLazyObject):
+    """
+    request.user of the cached authentications: the id and is_active come
+    from the cache, so authenticating and checks such as IsAuthenticated
+    run no query. The user, with its profile, is loaded on first use of
+    any other attribute.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, user_id, is_active):
+        super().__init__(lambda: User.objects.select_related("profile").get(pk=user_id))
+        # set on the proxy itself, so reading them does not load the user
+        self.__dict__.update(id=user_id, pk=user_id, is_active=is_active)
+
+    def __bool__(self):
+        # `request.user and request.user.is_authenticated` (IsAuthenticated)
+        return True
+
+
+def invalidate_cached_user(user_id):
+    cache.delete(user_cache_key(user_id))
+
+
+def invalidate_cached_token(key):
+    cache.delete(token_cache_key(key))
+
+
+class LoginThrottled(exceptions.Throttled):
+    default_detail = _("Too many logins in progress, try again shortly.")
+
+
+def check_login_busy(request):
+    """
+    Raise LoginThrottled (429) if authenticate() failed on `request`
+    because the password hashing pool was saturated (backends.LoginBusy).
+    """
+    if getattr(request, "login_busy", False):
+        raise LoginThrottled(wait=1)
+
+
+class PooledBasicAuthentication(BasicAuthentication):
+    """BasicAuthentication answering 429 when the hashing pool is full."""
+
+    def authenticate_credentials(self, userid, password, request=None):
+        try:
+            return super().authenticate_credentials(userid, password, request)
+        except exceptions.AuthenticationFailed:
+            check_login_busy(request)
+            raise
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication resolving token -> user id -> is_active from the
+    cache, so authenticating a request does not query the database; the
+    user is a CachedUser. Discarding a token drops its entry.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        user_id = cache.get(cache_key)
+        if user_id is None:
+            # cold cache: the token and its user's state in one query
+            token = (
+                Token.objects.filter(key=key)
+                .values_list("user_id", "user__is_active")
+                .first()
+            )
+            user_id = token[0] if token else MISSING
+            cache.set(cache_key, user_id, settings.AUTH_CACHE_TIMEOUT)
+            if token:
+                cache.set(
+                    user_cache_key(user_id), token[1], settings.AUTH_CACHE_TIMEOUT
+                )
+
+        is_active = None if user_id == MISSING else get_cached_user_state(user_id)
+        if is_active is None:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+        if not is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+
+        # request.auth, enough to delete the token without loading it
+        return (CachedUser(user_id, is_active), Token(key=key, user_id=user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication checking the user of a valid token against the
+    cached is_active; the user is a CachedUser.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        is_active = get_cached_user_state(user_id)
+        if is_active is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if jwt_settings.CHECK_USER_IS_ACTIVE and not is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        user = CachedUser(user_id, is_active)
+        # loads the user: the password hash is never cached
+        if jwt_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            jwt_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
+
+
+class HeaderAuthentication(BaseAuthentication):
+    """
+    Pick the one authenticator matching the scheme of the Authorization
+    header instead of trying every class in turn. Requests without the
+    header fall back to the Django session, if `session` is set; an
+    unknown scheme leaves the request anonymous.
+
+    Subclasses narrow `schemes` and `session` into per-view profiles.
+    """
+
+    # lowercase Authorization scheme -> authentication class
+    schemes = {
+        "basic": PooledBasicAuthentication,
+        "token": CachedTokenAuthentication,
+        "bearer": CachedJWTAuthentication,
+    }
+    session = SessionAuthentication
+
+    def __init__(self):
+        self.backends = {scheme: backend() for scheme, backend in self.schemes.items()}
+        self.session_backend = self.session() if self.session else None
+
+    def authenticate(self, request):
+        header = get_authorization_header(request).split(maxsplit=1)
+        if not header:
+            if self.session_backend is None:
+                return None
+            return self.session_backend.authenticate(request)
+
+        scheme = header[0].decode("latin-1").lower()
+        backend = self.backends.get(scheme)
+        if backend is None:
+            return None
+        return backend.authenticate(request)
+
+    def authenticate_header(self, request):
+        # with sessions, answer 403 like SessionAuthentication listed first
+        if self.session_backend is not None:
+            return None
+        return next(iter(self.backends.values())).authenticate_header(request)
+
+
+class StatelessAuthentication(HeaderAuthentication):
+    """
+    Token and JWT only: never loads the session and never hashes a
+    password (Basic), for hot API paths used by non-browser clients.
+    """
+
+    schemes = {
+        "token": CachedTokenAuthentication,
+        "bearer": CachedJWTAuthentication,
+    }
+    session = None
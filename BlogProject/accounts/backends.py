@@ -0,0 +1,131 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+
+from .hashers import check_and_rehash, setup_worker
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+
+class LoginBusy(PermissionDenied):
+    """
+    The hashing pool is saturated. A PermissionDenied, so authenticate()
+    stops and returns None for every caller (admin login included); the
+    DRF login paths answer 429 instead, see authentication.check_login_busy.
+    """
+
+
+def mark_login_busy(request):
+    if request is not None:
+        request.login_busy = True
+
+
+class PasswordHashingPool:
+    """
+    Password checks run in LOGIN_HASH_WORKERS processes, off the request
+    workers. At most LOGIN_HASH_QUEUE_DEPTH checks wait for a free process;
+    past that, or after LOGIN_HASH_TIMEOUT seconds, LoginBusy is raised
+    instead of piling up CPU bound work. A pool broken by a dead process
+    is replaced. With LOGIN_HASH_WORKERS = 0 checks run inline.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executor = None
+        self.slots = None
+
+    def start(self):
+        """Start the pool if needed; return (executor, slots) as started."""
+        with self.lock:
+            if self.executor is None:
+                workers = settings.LOGIN_HASH_WORKERS
+                if self.slots is None:
+                    self.slots = threading.BoundedSemaphore(
+                        workers + settings.LOGIN_HASH_QUEUE_DEPTH
+                    )
+                self.executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    # a fresh interpreter rather than a fork of a threaded one
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=setup_worker,
+                )
+            return self.executor, self.slots
+
+    def shutdown(self):
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+            self.executor = self.slots = None
+
+    def discard(self, executor):
+        """Drop a broken executor; the next check starts a new one."""
+        with self.lock:
+            if self.executor is executor:
+                self.executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def check(self, password, encoded):
+        """Return (is_correct, new_encoded), see hashers.check_and_rehash."""
+        if settings.LOGIN_HASH_WORKERS <= 0:
+            return check_and_rehash(password, encoded)
+
+        # read under the lock: discard() and shutdown() may reset the
+        # attributes at any time, the check keeps using this pair
+        executor, slots = self.start()
+        if not slots.acquire(blocking=False):
+            raise LoginBusy
+        try:
+            future = executor.submit(check_and_rehash, password, encoded)
+            return future.result(timeout=settings.LOGIN_HASH_TIMEOUT)
+        except FutureTimeout:
+            future.cancel()
+            raise LoginBusy
+        except BrokenProcessPool:
+            logger.exception("Password hashing pool broken, restarting it")
+            self.discard(executor)
+            return check_and_rehash(password, encoded)
+        finally:
+            slots.release()
+
+
+hashing_pool = PasswordHashingPool()
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    ModelBackend verifying passwords in the hashing pool. Used by every
+    authenticate() call: token and JWT logins, Basic auth, admin login.
+    A saturated pool fails the login (LoginBusy) and marks the request.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        user = User._default_manager.filter(**{User.USERNAME_FIELD: username}).first()
+        # a missing user costs one hash too (timing, Django #20760)
+        try:
+            is_correct, new_encoded = hashing_pool.check(
+                password, user.password if user else None
+            )
+        except LoginBusy:
+            mark_login_busy(request)
+            raise
+        if not (is_correct and self.user_can_authenticate(user)):
+            return None
+
+        if new_encoded:
+            # hasher settings changed since the password was set
+            user.password = new_encoded
+            user.save(update_fields=["password"])
+        return user
@@ -0,0 +1,41 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.template.loader import get_template
+from mail_templated import EmailMessage
+
+ACTIVATION_TEMPLATE = "email/activation_email.html"
+RESET_PASSWORD_TEMPLATE = "email/reset_password_email.html"
+
+
+@lru_cache(maxsize=None)
+def get_email_template(template_name):
+    """
+    Compiled email template, loaded once per process. Rendering a message
+    then only substitutes its context, whether or not Django's cached
+    template loader is enabled (it is not with DEBUG = True).
+    """
+    return get_template(template_name)
+
+
+def render_email(template_name, context, to):
+    """Build and render a mail_templated message from the cached template."""
+    email_obj = EmailMessage(
+        template_name=template_name,
+        context=context,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=to,
+    )
+    email_obj.template = get_email_template(template_name)
+    email_obj.render()
+    return email_obj
+
+
+def activation_email(email, activation_link):
+    return render_email(
+        ACTIVATION_TEMPLATE, {"activation_link": activation_link}, [email]
+    )
+
+
+def reset_password_email(email, reset_link):
+    return render_email(RESET_PASSWORD_TEMPLATE, {"reset_link": reset_link}, [email])
@@ -0,0 +1,40 @@
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    UNUSABLE_PASSWORD_PREFIX,
+    PBKDF2PasswordHasher,
+    make_password,
+    verify_password,
+)
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 with the iteration count of PASSWORD_HASH_ITERATIONS. Same
+    algorithm name as Django's hasher, so existing hashes keep verifying
+    and are re-hashed at the next login when the cost changes.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS
+
+
+def setup_worker():
+    """Initializer of the password hashing processes."""
+    django.setup()
+
+
+def check_and_rehash(password, encoded):
+    """
+    Verify `password` against `encoded` (None for a missing user, which
+    still costs one hash) and return (is_correct, new_encoded). The new
+    hash is only computed when the password is correct and the hasher
+    settings changed. Runs in the hashing pool.
+    """
+    # an unusable password still runs the default hasher once
+    encoded = encoded or UNUSABLE_PASSWORD_PREFIX
+    is_correct, must_update = verify_password(password, encoded)
+    if is_correct and must_update:
+        return True, make_password(password)
+    return is_correct, None
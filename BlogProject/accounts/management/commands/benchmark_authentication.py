@@ -0,0 +1,71 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import CachedJWTAuthentication, CachedTokenAuthentication
+from accounts.models import User
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per-request cost of the stock and the cached Token and "
+        "JWT authentication classes. The user is created inside a "
+        "transaction that is rolled back, so the database is left untouched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=2000, help="Requests per authenticator"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    email="benchmark@authentication.local", password="Benchmark123!"
+                )
+                token = Token.objects.create(user=user)
+                headers = {
+                    "token": f"Token {token.key}",
+                    "jwt": f"Bearer {AccessToken.for_user(user)}",
+                }
+                for label, authenticator, scheme in (
+                    ("TokenAuthentication", TokenAuthentication(), "token"),
+                    ("CachedTokenAuthentication", CachedTokenAuthentication(), "token"),
+                    ("JWTAuthentication", JWTAuthentication(), "jwt"),
+                    ("CachedJWTAuthentication", CachedJWTAuthentication(), "jwt"),
+                ):
+                    self.measure(label, authenticator, headers[scheme], options)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def measure(self, label, authenticator, header, options):
+        cache.clear()
+        factory = APIRequestFactory()
+        count = options["requests"]
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for _ in range(count):
+                request = Request(factory.get("/", HTTP_AUTHORIZATION=header))
+                authenticator.authenticate(request)
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{label:<26} {elapsed / count * 1e6:8.1f} us/request"
+            f"  {len(queries) / count:5.2f} queries/request"
+        )
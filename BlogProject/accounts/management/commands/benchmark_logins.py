@@ -0,0 +1,69 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+from accounts.hashers import check_and_rehash, setup_worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password checks per second, the CPU bound part of a login, "
+        "inline and in hashing pools of increasing size, at the current "
+        "PASSWORD_HASH_ITERATIONS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--logins", type=int, default=40, help="Password checks per run"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            nargs="+",
+            default=[1, 2, os.cpu_count()],
+            help="Pool sizes to measure",
+        )
+
+    def handle(self, *args, **options):
+        logins = options["logins"]
+        password = "Benchmark123!"
+        encoded = make_password(password)
+        self.stdout.write(
+            f"PBKDF2 iterations {settings.PASSWORD_HASH_ITERATIONS}, "
+            f"{os.cpu_count()} cores"
+        )
+
+        started = time.perf_counter()
+        for _ in range(logins):
+            check_and_rehash(password, encoded)
+        self.report("inline", logins, time.perf_counter() - started, 1)
+
+        for workers in sorted(set(options["workers"])):
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=setup_worker,
+            ) as executor:
+                # start the processes before timing
+                list(
+                    executor.map(check_and_rehash, [password] * workers, [""] * workers)
+                )
+                started = time.perf_counter()
+                list(
+                    executor.map(
+                        check_and_rehash, [password] * logins, [encoded] * logins
+                    )
+                )
+                elapsed = time.perf_counter() - started
+            self.report(f"pool of {workers}", logins, elapsed, workers)
+
+    def report(self, label, logins, elapsed, cores):
+        rate = logins / elapsed
+        self.stdout.write(
+            f"{label:<12} {rate:8.1f} logins/s  {rate / cores:8.1f} logins/s per core"
+        )
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.urls import reverse
+
+from accounts.emails import activation_email
+from accounts.models import User
+from accounts.outbox import queue_emails
+from accounts.services import generate_activation_token
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue a new activation email for every active, unverified user. "
+        "The template is compiled once and the emails are stored in the "
+        "outbox in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            required=True,
+            help="Scheme and host the activation links point to, "
+            "e.g. https://blog.example.com",
+        )
+
+    def handle(self, *args, **options):
+        base_url = options["base_url"].rstrip("/")
+        users = (
+            User.objects.filter(is_active=True, is_verified=False)
+            .only("id", "email")
+            .order_by("id")
+        )
+
+        queued = 0
+        batch = []
+        for user in users.iterator(chunk_size=settings.EMAIL_OUTBOX_BATCH_SIZE):
+            path = reverse(
+                "accounts:api-v1:activation",
+                kwargs={"token": generate_activation_token(user)},
+            )
+            batch.append(activation_email(user.email, base_url + path))
+            if len(batch) == settings.EMAIL_OUTBOX_BATCH_SIZE:
+                queued += self.queue(batch)
+                batch = []
+        queued += self.queue(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Queued {queued} activation emails."))
+
+    def queue(self, batch):
+        # one transaction per batch: its emails are handed to the
+        # delivery pool as soon as it commits
+        with transaction.atomic():
+            return len(queue_emails(batch))
@@ -0,0 +1,34 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from accounts.outbox import deliver_due_emails
+
+
+class Command(BaseCommand):
+    help = (
+        "Send the due emails of the outbox in batches. Useful from cron, or "
+        "as the only sender when EMAIL_OUTBOX_WORKERS is 0."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling every EMAIL_OUTBOX_POLL_INTERVAL seconds",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent = 0
+            # a full batch means more may be due right away
+            while True:
+                batch = deliver_due_emails()
+                sent += batch
+                if batch < settings.EMAIL_OUTBOX_BATCH_SIZE:
+                    break
+            self.stdout.write(self.style.SUCCESS(f"Sent {sent} emails."))
+            if not options["loop"]:
+                break
+            time.sleep(settings.EMAIL_OUTBOX_POLL_INTERVAL)
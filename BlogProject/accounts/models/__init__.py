@@ -1,2 +1,3 @@
+from .outbox import *
 from .profile import *
 from .user import *
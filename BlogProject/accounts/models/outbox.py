@@ -0,0 +1,58 @@
+from django.core.mail import EmailMultiAlternatives
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxEmail(models.Model):
+    """
+    A rendered email waiting for (or done with) delivery.
+
+    Rows are written on the request thread and sent by the delivery pool
+    in accounts.outbox, so queued mail survives a process restart. A
+    delivery is at least once: see accounts.outbox.claim.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+        ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    # set when the message has an HTML alternative to the plain body
+    html = models.TextField(blank=True)
+    # True when `body` itself is HTML (template without a plain text part)
+    is_html = models.BooleanField(default=False)
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField()
+
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_date = models.DateTimeField(auto_now_add=True)
+    sent_date = models.DateTimeField(null=True, blank=True)
+
+    def to_message(self, connection=None):
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=self.to,
+            connection=connection,
+        )
+        if self.is_html:
+            message.content_subtype = "html"
+        if self.html:
+            message.attach_alternative(self.html, "text/html")
+        return message
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
@@ -3,7 +3,8 @@ from django.contrib.auth.models import (
     BaseUserManager,
     PermissionsMixin,
 )
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 
 class UserManager(BaseUserManager):
@@ -41,6 +42,44 @@ class UserManager(BaseUserManager):
 
         return self.create_user(email, password, **extra_fields)
 
+    def bulk_create_with_profiles(self, users, profiles=None, batch_size=1000):
+        """
+        Save unsaved `users` and a profile for each of them with one batched
+        INSERT per table, in a single transaction. `profiles` optionally
+        gives the profile fields of each user, in the same order.
+
+        Passwords are not hashed here: set them beforehand (set_password
+        or make_password). No post_save signal is sent.
+        """
+        # imported here: the profile module imports this one
+        from .profile import Profile
+
+        if profiles is None:
+            profiles = [{} for _ in users]
+        if len(profiles) != len(users):
+            raise ValueError("Expected one profile per user")
+
+        for user in users:
+            user.email = self.normalize_email(user.email)
+        with transaction.atomic(using=self.db):
+            users = self.bulk_create(users, batch_size=batch_size)
+            Profile.objects.using(self.db).bulk_create(
+                [Profile(user=user, **fields) for user, fields in zip(users, profiles)],
+                batch_size=batch_size,
+            )
+        return users
+
+    def mark_verified(self, user_id):
+        """
+        Verify a user with a single conditional UPDATE, without loading it.
+        Return False if there is no such unverified user.
+        """
+        return bool(
+            self.filter(id=user_id, is_verified=False).update(
+                is_verified=True, updated_date=timezone.now()
+            )
+        )
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     """
@@ -0,0 +1,215 @@
+import logging
+import os
+import queue
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+# a claimed email is due again after this long if its outcome was never
+# recorded (worker died, or a send outlasted the lease): it may be sent again
+CLAIM_LEASE = timedelta(minutes=5)
+
+
+def queue_email(email_obj):
+    """
+    Render `email_obj` (a mail_templated or plain Django EmailMessage),
+    store it in the outbox and hand it to the delivery pool once the
+    surrounding transaction commits. Never blocks on SMTP.
+    """
+    return queue_emails([email_obj])[0]
+
+
+def queue_emails(email_objs):
+    """
+    Batched queue_email(): the messages are stored with bulk INSERTs of
+    EMAIL_OUTBOX_BATCH_SIZE rows and delivered by the pool in batches.
+    """
+    outbox_emails = OutboxEmail.objects.bulk_create(
+        [build_outbox_email(email_obj) for email_obj in email_objs],
+        batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+    )
+    ids = [outbox_email.id for outbox_email in outbox_emails]
+
+    def submit():
+        for email_id in ids:
+            delivery_pool.submit(email_id)
+
+    transaction.on_commit(submit)
+    return outbox_emails
+
+
+def build_outbox_email(email_obj):
+    if hasattr(email_obj, "render") and not email_obj.is_rendered:
+        email_obj.render()
+
+    html = next(
+        (
+            content
+            for content, mimetype in email_obj.alternatives
+            if mimetype == "text/html"
+        ),
+        "",
+    )
+    return OutboxEmail(
+        subject=email_obj.subject,
+        body=email_obj.body,
+        html=html,
+        is_html=email_obj.content_subtype == "html",
+        from_email=email_obj.from_email,
+        to=list(email_obj.to),
+    )
+
+
+def claim(email_id, now):
+    """
+    Take the right to send one due email for CLAIM_LEASE, so two workers
+    (or processes) do not send a row concurrently. Delivery is at least
+    once, not exactly once: a worker dying after the SMTP server accepted
+    the message but before marking the row sent, or a send outlasting the
+    lease, leaves the row due again and it is sent a second time.
+    """
+    return OutboxEmail.objects.filter(
+        id=email_id,
+        status=OutboxEmail.Status.PENDING,
+        next_attempt_at__lte=now,
+    ).update(next_attempt_at=now + CLAIM_LEASE, attempts=F("attempts") + 1)
+
+
+def record_failure(email, error):
+    """Schedule a retry with exponential backoff, or give up."""
+    if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        changes = {"status": OutboxEmail.Status.FAILED}
+        logger.error("Giving up on outbox email %s: %s", email.id, error)
+    else:
+        backoff = settings.EMAIL_OUTBOX_RETRY_BACKOFF * 2 ** (email.attempts - 1)
+        changes = {"next_attempt_at": timezone.now() + timedelta(seconds=backoff)}
+        logger.warning("Outbox email %s failed, retrying: %s", email.id, error)
+    OutboxEmail.objects.filter(id=email.id).update(last_error=str(error), **changes)
+
+
+def deliver_due_emails(ids=None):
+    """
+    Send up to EMAIL_OUTBOX_BATCH_SIZE due emails (only `ids`, if given)
+    over a single backend connection. Return the number sent.
+    """
+    now = timezone.now()
+    due = OutboxEmail.objects.filter(
+        status=OutboxEmail.Status.PENDING, next_attempt_at__lte=now
+    )
+    if ids is not None:
+        due = due.filter(id__in=ids)
+    candidates = due.order_by("next_attempt_at").values_list("id", flat=True)
+    claimed = [
+        email_id
+        for email_id in candidates[: settings.EMAIL_OUTBOX_BATCH_SIZE]
+        if claim(email_id, now)
+    ]
+    emails = list(OutboxEmail.objects.filter(id__in=claimed))
+    if not emails:
+        return 0
+
+    sent = 0
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as error:
+        for email in emails:
+            record_failure(email, error)
+        return 0
+
+    try:
+        for email in emails:
+            try:
+                email.to_message(connection).send()
+            except Exception as error:
+                record_failure(email, error)
+                continue
+            OutboxEmail.objects.filter(id=email.id).update(
+                status=OutboxEmail.Status.SENT, sent_date=timezone.now(), last_error=""
+            )
+            sent += 1
+    finally:
+        connection.close()
+    return sent
+
+
+class EmailDeliveryPool:
+    """
+    A fixed set of worker threads fed by a bounded queue of outbox ids.
+
+    Workers batch whatever is queued into one connection, and sweep the
+    outbox for due rows (retries, mail left over from a restart) whenever
+    the queue stays empty for EMAIL_OUTBOX_POLL_INTERVAL seconds. A full
+    queue is backpressure, not an error: the row simply waits in the
+    outbox for the next sweep. With EMAIL_OUTBOX_WORKERS = 0 no thread is
+    started and the `send_outbox_emails` command does the delivery.
+
+    The WSGI/ASGI entry points start the pool as the server loads the
+    application, so a restarted process resumes sweeping without waiting
+    for new mail; other processes (commands, tests) start it on submit().
+    """
+
+    def __init__(self):
+        self.queue = None
+        self.pid = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            # threads do not survive a fork (e.g. gunicorn --preload)
+            if self.queue is not None and self.pid == os.getpid():
+                return
+            if settings.EMAIL_OUTBOX_WORKERS <= 0:
+                return
+            self.queue = queue.Queue(maxsize=settings.EMAIL_OUTBOX_QUEUE_SIZE)
+            self.pid = os.getpid()
+            for number in range(settings.EMAIL_OUTBOX_WORKERS):
+                threading.Thread(
+                    target=self.work, name=f"email-outbox-{number}", daemon=True
+                ).start()
+
+    def submit(self, email_id):
+        """Queue an outbox id for delivery; return False if it has to wait."""
+        self.start()
+        if self.queue is None:
+            return False
+        try:
+            self.queue.put_nowait(email_id)
+        except queue.Full:
+            return False
+        return True
+
+    def next_batch(self):
+        """Wait for queued ids; None means "sweep the outbox" instead."""
+        try:
+            ids = [self.queue.get(timeout=settings.EMAIL_OUTBOX_POLL_INTERVAL)]
+        except queue.Empty:
+            return None
+        while len(ids) < settings.EMAIL_OUTBOX_BATCH_SIZE:
+            try:
+                ids.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return ids
+
+    def work(self):
+        while True:
+            ids = self.next_batch()
+            try:
+                deliver_due_emails(ids)
+            except Exception:
+                logger.exception("Email outbox worker failed")
+            finally:
+                close_old_connections()
+
+
+delivery_pool = EmailDeliveryPool()
@@ -1,10 +1,52 @@
-from django.db.models.signals import post_save
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
 
+from .authentication import invalidate_cached_token, invalidate_cached_user
+from .emails import get_email_template
 from .models import Profile, User
 
+# set while the caller creates profiles itself (see skip_profile_creation)
+_skip_profile_creation = ContextVar("skip_profile_creation", default=False)
+
+
+@contextmanager
+def skip_profile_creation():
+    """
+    Do not create a profile for users saved in this block: the caller
+    provisions profiles itself, e.g. with their fields in one INSERT.
+    """
+    token = _skip_profile_creation.set(True)
+    try:
+        yield
+    finally:
+        _skip_profile_creation.reset(token)
+
 
 @receiver(post_save, sender=User)
-def create_profile(sender, instance, created, **kwargs):
-    if created:
+def create_profile(sender, instance, created, raw=False, **kwargs):
+    # raw: loaddata, where fixtures carry their own profiles
+    if created and not raw and not _skip_profile_creation.get():
         Profile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_auth_cache(sender, instance, **kwargs):
+    # covers deactivation, which saves the user
+    invalidate_cached_user(instance.pk)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_token_auth_cache(sender, instance, **kwargs):
+    invalidate_cached_token(instance.key)
+
+
+@receiver(setting_changed)
+def clear_email_templates(setting, **kwargs):
+    if setting == "TEMPLATES":
+        get_email_template.cache_clear()
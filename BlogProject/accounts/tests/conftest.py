@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 from accounts.models import User
@@ -10,6 +11,12 @@ def api_client():
     return APIClient()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache (cached authenticated users)."""
+    cache.clear()
+
+
 @pytest.fixture
 def user(db):
     """Unverified user by default."""
@@ -25,19 +32,16 @@ def verified_user(db):
     return u
 
 
-@pytest.fixture
-def mock_email_thread_start(monkeypatch):
+@pytest.fixture(autouse=True)
+def no_outbox_workers(settings):
     """
-    Prevent background email thread from running.
-    We patch EmailThread.start() to a no-op so tests are deterministic.
+    Keep queued emails in the outbox: no delivery thread is started, so
+    tests decide when mail is sent by calling deliver_due_emails().
     """
-    from accounts.api.utils import EmailThread
-
-    calls = {"count": 0}
+    settings.EMAIL_OUTBOX_WORKERS = 0
 
-    def _fake_start(self):
-        calls["count"] += 1
-        return None
 
-    monkeypatch.setattr(EmailThread, "start", _fake_start, raising=True)
-    return calls
+@pytest.fixture(autouse=True)
+def inline_password_checks(settings):
+    """Check login passwords on the test thread, not in hashing processes."""
+    settings.LOGIN_HASH_WORKERS = 0
@@ -1,7 +1,7 @@
 import pytest
 from django.urls import reverse
 
-from accounts.models import User
+from accounts.models import OutboxEmail, User
 from accounts.services import generate_activation_token
 
 
@@ -37,20 +37,16 @@ class TestActivationFlow:
         assert resp.status_code == 200
         assert "already" in str(resp.data).lower()
 
-    def test_activation_resend_nonexistent_user_returns_400(
-        self, api_client, mock_email_thread_start
-    ):
+    def test_activation_resend_nonexistent_user_returns_400(self, api_client):
         """Resend should return 400 if user does not exist."""
         url = reverse("accounts:api-v1:activation-resend")
 
         resp = api_client.post(url, {"email": "missing@test.com"}, format="json")
 
         assert resp.status_code == 400
-        assert mock_email_thread_start["count"] == 0
+        assert OutboxEmail.objects.count() == 0
 
-    def test_activation_resend_verified_user_returns_400(
-        self, api_client, mock_email_thread_start
-    ):
+    def test_activation_resend_verified_user_returns_400(self, api_client):
         """Resend should return 400 if user is already verified."""
         user = User.objects.create_user(email="v2@test.com", password="Pass12345/")
         user.is_verified = True
@@ -60,11 +56,9 @@ class TestActivationFlow:
         resp = api_client.post(url, {"email": user.email}, format="json")
 
         assert resp.status_code == 400
-        assert mock_email_thread_start["count"] == 0
+        assert OutboxEmail.objects.count() == 0
 
-    def test_activation_resend_unverified_user_sends_email_200(
-        self, api_client, mock_email_thread_start
-    ):
+    def test_activation_resend_unverified_user_sends_email_200(self, api_client):
         """Resend should send email for unverified user and return 200."""
         user = User.objects.create_user(email="u3@test.com", password="Pass12345/")
         assert user.is_verified is False
@@ -73,4 +67,4 @@ class TestActivationFlow:
         resp = api_client.post(url, {"email": user.email}, format="json")
 
         assert resp.status_code == 200
-        assert mock_email_thread_start["count"] == 1
+        assert OutboxEmail.objects.count() == 1
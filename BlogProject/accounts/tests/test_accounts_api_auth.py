@@ -2,7 +2,7 @@ import pytest
 from django.urls import reverse
 from rest_framework.authtoken.models import Token
 
-from accounts.models import User
+from accounts.models import OutboxEmail, User
 
 
 @pytest.mark.django_db
@@ -14,13 +14,11 @@ class TestRegistrationAndAuth:
     - JWT create/refresh/verify
     """
 
-    def test_registration_creates_user_and_sends_email(
-        self, api_client, mock_email_thread_start
-    ):
+    def test_registration_creates_user_and_sends_email(self, api_client):
         """
         Registration should:
         - create a user
-        - send activation email (we mock EmailThread.start)
+        - send activation email (queued in the outbox)
         - return 201 with {email: ...}
         """
         url = reverse("accounts:api-v1:registration")
@@ -35,11 +33,9 @@ class TestRegistrationAndAuth:
         assert resp.status_code == 201
         assert resp.data["email"] == "new@test.com"
         assert User.objects.filter(email="new@test.com").exists()
-        assert mock_email_thread_start["count"] == 1
+        assert OutboxEmail.objects.count() == 1
 
-    def test_registration_password_mismatch_returns_400(
-        self, api_client, mock_email_thread_start
-    ):
+    def test_registration_password_mismatch_returns_400(self, api_client):
         """Registration should return 400 if passwords do not match."""
         url = reverse("accounts:api-v1:registration")
         payload = {
@@ -52,7 +48,7 @@ class TestRegistrationAndAuth:
 
         assert resp.status_code == 400
         assert "detail" in resp.data
-        assert mock_email_thread_start["count"] == 0
+        assert OutboxEmail.objects.count() == 0
 
     def test_token_login_unverified_user_returns_400(self, api_client, user):
         """
@@ -0,0 +1,237 @@
+import base64
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import (
+    StatelessAuthentication,
+    token_cache_key,
+    user_cache_key,
+)
+from accounts.models import User
+from accounts.services import generate_reset_password_token
+
+PASSWORD = "Pass12345/"
+
+
+@pytest.fixture
+def token(verified_user):
+    return Token.objects.create(user=verified_user)
+
+
+@pytest.fixture
+def profile_url():
+    return reverse("accounts:api-v1:profile")
+
+
+@pytest.mark.django_db
+class TestCachedTokenAuthentication:
+    def test_second_request_does_not_query_for_auth(
+        self, api_client, token, profile_url, django_assert_num_queries
+    ):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        # token with the user's is_active, profile for the view
+        with django_assert_num_queries(2):
+            assert api_client.get(profile_url).status_code == 200
+        # profile for the view only
+        with django_assert_num_queries(1):
+            assert api_client.get(profile_url).status_code == 200
+
+    def test_invalid_token_is_rejected_and_cached(
+        self, api_client, profile_url, django_assert_num_queries
+    ):
+        api_client.credentials(HTTP_AUTHORIZATION="Token " + "0" * 40)
+
+        with django_assert_num_queries(1):
+            assert api_client.get(profile_url).status_code in (401, 403)
+        with django_assert_num_queries(0):
+            assert api_client.get(profile_url).status_code in (401, 403)
+
+    def test_discarded_token_is_rejected(self, api_client, token, profile_url):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        assert api_client.get(profile_url).status_code == 200
+
+        resp = api_client.post(reverse("accounts:api-v1:token-logout"))
+        assert resp.status_code == 204
+        assert not Token.objects.filter(key=token.key).exists()
+
+        assert api_client.get(profile_url).status_code in (401, 403)
+
+    def test_deactivated_user_is_rejected(
+        self, api_client, token, verified_user, profile_url
+    ):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        assert api_client.get(profile_url).status_code == 200
+
+        verified_user.is_active = False
+        verified_user.save()
+
+        assert api_client.get(profile_url).status_code in (401, 403)
+
+    def test_only_user_state_is_cached(
+        self, api_client, token, verified_user, profile_url
+    ):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        assert api_client.get(profile_url).status_code == 200
+
+        # never the user itself, which carries the password hash
+        assert cache.get(user_cache_key(verified_user.id)) is True
+        assert cache.get(token_cache_key(token.key)) == verified_user.id
+
+    def test_profile_change_is_seen(
+        self, api_client, token, verified_user, profile_url
+    ):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        assert api_client.get(profile_url).status_code == 200
+
+        verified_user.profile.first_name = "Changed"
+        verified_user.profile.save()
+
+        resp = api_client.get(profile_url)
+        assert resp.wsgi_request.user.profile.first_name == "Changed"
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    def test_second_request_does_not_query_for_auth(
+        self, api_client, verified_user, profile_url, django_assert_num_queries
+    ):
+        access = AccessToken.for_user(verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        # user's is_active, profile for the view
+        with django_assert_num_queries(2):
+            assert api_client.get(profile_url).status_code == 200
+        with django_assert_num_queries(1):
+            assert api_client.get(profile_url).status_code == 200
+
+    def test_deleted_user_is_rejected(self, api_client, verified_user, profile_url):
+        access = AccessToken.for_user(verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        assert api_client.get(profile_url).status_code == 200
+
+        User.objects.filter(id=verified_user.id).delete()
+
+        assert api_client.get(profile_url).status_code in (401, 403)
+
+    def test_password_change_refreshes_cached_user(self, api_client, verified_user):
+        access = AccessToken.for_user(verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        url = reverse("accounts:api-v1:change-password")
+        payload = {
+            "old_password": PASSWORD,
+            "new_password": "NewPass12345/",
+            "new_password1": "NewPass12345/",
+        }
+
+        assert api_client.put(url, payload, format="json").status_code == 200
+        # the old password is checked against the refreshed user
+        assert api_client.put(url, payload, format="json").status_code == 400
+
+    def test_password_reset_refreshes_cached_user(self, api_client, verified_user):
+        access = AccessToken.for_user(verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        api_client.get(reverse("accounts:api-v1:profile"))
+
+        url = reverse(
+            "accounts:api-v1:reset-password-confirm",
+            kwargs={"token": generate_reset_password_token(verified_user)},
+        )
+        payload = {"password": "NewPass12345/", "password1": "NewPass12345/"}
+        assert api_client.post(url, payload, format="json").status_code == 200
+
+        resp = api_client.get(reverse("accounts:api-v1:profile"))
+        assert resp.wsgi_request.user.check_password("NewPass12345/")
+
+
+@pytest.fixture
+def no_password_hashing(monkeypatch):
+    def fail(self, raw_password):
+        raise AssertionError("password hashed")
+
+    monkeypatch.setattr(User, "check_password", fail)
+
+
+@pytest.fixture
+def no_session_authentication(monkeypatch):
+    def fail(self, request):
+        raise AssertionError("session authentication ran")
+
+    monkeypatch.setattr(SessionAuthentication, "authenticate", fail)
+
+
+@pytest.mark.django_db
+class TestHeaderAuthentication:
+    def test_token_header_runs_token_authentication_only(
+        self,
+        api_client,
+        token,
+        profile_url,
+        no_password_hashing,
+        no_session_authentication,
+    ):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        assert api_client.get(profile_url).status_code == 200
+
+    def test_bearer_header_runs_jwt_authentication_only(
+        self,
+        api_client,
+        verified_user,
+        profile_url,
+        no_password_hashing,
+        no_session_authentication,
+    ):
+        access = AccessToken.for_user(verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        assert api_client.get(profile_url).status_code == 200
+
+    def test_scheme_is_case_insensitive(self, api_client, token, profile_url):
+        api_client.credentials(HTTP_AUTHORIZATION=f"token {token.key}")
+
+        assert api_client.get(profile_url).status_code == 200
+
+    def test_basic_header_is_still_supported(
+        self, api_client, verified_user, profile_url
+    ):
+        credentials = base64.b64encode(f"{verified_user.email}:{PASSWORD}".encode())
+        api_client.credentials(HTTP_AUTHORIZATION=f"Basic {credentials.decode()}")
+
+        assert api_client.get(profile_url).status_code == 200
+
+    def test_session_without_header(self, client, verified_user, profile_url):
+        client.force_login(verified_user)
+
+        assert client.get(profile_url).status_code == 200
+
+    def test_unknown_scheme_is_anonymous(
+        self, api_client, no_password_hashing, no_session_authentication
+    ):
+        api_client.credentials(HTTP_AUTHORIZATION="Digest whatever")
+
+        response = api_client.put(reverse("accounts:api-v1:change-password"), {})
+
+        assert response.status_code == 403
+
+
+class TestStatelessAuthentication:
+    def test_ignores_session_and_basic(
+        self, rf, no_password_hashing, no_session_authentication
+    ):
+        authenticator = StatelessAuthentication()
+
+        assert authenticator.authenticate(Request(rf.get("/"))) is None
+        request = Request(rf.get("/", HTTP_AUTHORIZATION="Basic dTpw"))
+        assert authenticator.authenticate(request) is None
+
+    def test_challenges_with_token_scheme(self, rf):
+        request = Request(rf.get("/"))
+
+        assert StatelessAuthentication().authenticate_header(request) == "Token"
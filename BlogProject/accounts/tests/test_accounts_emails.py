@@ -0,0 +1,101 @@
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+
+from accounts import emails
+from accounts.emails import activation_email, get_email_template, reset_password_email
+from accounts.models import OutboxEmail, User
+from accounts.outbox import deliver_due_emails, queue_emails
+
+
+@pytest.fixture(autouse=True)
+def email_settings(settings):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    settings.EMAIL_OUTBOX_BATCH_SIZE = 2
+    get_email_template.cache_clear()
+
+
+@pytest.fixture
+def template_loads(monkeypatch):
+    loaded = []
+    original = emails.get_template
+
+    def counting_get_template(template_name):
+        loaded.append(template_name)
+        return original(template_name)
+
+    monkeypatch.setattr(emails, "get_template", counting_get_template)
+    return loaded
+
+
+class TestTemplatedEmails:
+    def test_template_is_loaded_once(self, template_loads):
+        first = activation_email("a@test.com", "http://testserver/one/")
+        second = activation_email("b@test.com", "http://testserver/two/")
+
+        assert template_loads == [emails.ACTIVATION_TEMPLATE]
+        assert "http://testserver/one/" in first.body
+        assert "http://testserver/two/" in second.body
+        assert first.subject == second.subject
+        assert first.to == ["a@test.com"]
+
+    def test_each_template_is_cached_separately(self, template_loads):
+        activation_email("a@test.com", "http://testserver/one/")
+        reset = reset_password_email("a@test.com", "http://testserver/reset/")
+
+        assert template_loads == [
+            emails.ACTIVATION_TEMPLATE,
+            emails.RESET_PASSWORD_TEMPLATE,
+        ]
+        assert "http://testserver/reset/" in reset.body
+
+    def test_cache_is_cleared_when_templates_change(self, settings, template_loads):
+        activation_email("a@test.com", "http://testserver/one/")
+        settings.TEMPLATES = [{**settings.TEMPLATES[0]}]
+        activation_email("a@test.com", "http://testserver/one/")
+
+        assert len(template_loads) == 2
+
+
+@pytest.mark.django_db
+class TestBulkEmails:
+    def test_queue_emails_batches_inserts(self, django_assert_num_queries):
+        messages = [
+            activation_email(f"u{i}@test.com", f"http://testserver/{i}/")
+            for i in range(5)
+        ]
+
+        # batch size 2: three INSERTs
+        with django_assert_num_queries(3):
+            queued = queue_emails(messages)
+
+        assert all(email.id for email in queued)
+        assert OutboxEmail.objects.count() == 5
+
+    def test_resend_activation_command(self):
+        unverified = [
+            User.objects.create_user(email=f"u{i}@test.com", password="Pass12345/")
+            for i in range(3)
+        ]
+        User.objects.create_user(
+            email="verified@test.com", password="Pass12345/", is_verified=True
+        )
+        User.objects.create_user(
+            email="inactive@test.com", password="Pass12345/", is_active=False
+        )
+
+        out = StringIO()
+        call_command(
+            "resend_activation_emails", base_url="https://blog.test/", stdout=out
+        )
+        while deliver_due_emails():
+            pass
+
+        assert "Queued 3 activation emails." in out.getvalue()
+        assert sorted(m.to[0] for m in mail.outbox) == [u.email for u in unverified]
+        for message in mail.outbox:
+            html = message.body
+            assert 'href="https://blog.test/' in html
+            assert "/activation/confirm/" in html
@@ -0,0 +1,167 @@
+import base64
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import identify_hasher
+from django.urls import reverse
+
+from accounts.backends import hashing_pool
+
+PASSWORD = "Pass12345/"
+
+
+@pytest.fixture
+def pool(settings):
+    settings.LOGIN_HASH_WORKERS = 1
+    settings.LOGIN_HASH_QUEUE_DEPTH = 0
+    yield hashing_pool
+    hashing_pool.shutdown()
+
+
+def login(api_client, email, password=PASSWORD):
+    return api_client.post(
+        reverse("accounts:api-v1:token-login"),
+        {"email": email, "password": password},
+        format="json",
+    )
+
+
+def iterations(user):
+    user.refresh_from_db()
+    return identify_hasher(user.password).decode(user.password)["iterations"]
+
+
+@pytest.mark.django_db
+class TestLoginHashing:
+    def test_cost_follows_setting(self, settings, django_user_model):
+        settings.PASSWORD_HASH_ITERATIONS = 1000
+        user = django_user_model.objects.create_user(
+            email="cheap@test.com", password=PASSWORD
+        )
+
+        assert iterations(user) == 1000
+
+    def test_login_rehashes_when_cost_changes(
+        self, api_client, settings, verified_user
+    ):
+        settings.PASSWORD_HASH_ITERATIONS = 1000
+        assert iterations(verified_user) != 1000
+
+        assert login(api_client, verified_user.email).status_code == 200
+
+        assert iterations(verified_user) == 1000
+        assert login(api_client, verified_user.email).status_code == 200
+
+    def test_wrong_password_is_not_rehashed(self, api_client, settings, verified_user):
+        before = iterations(verified_user)
+        settings.PASSWORD_HASH_ITERATIONS = 1000
+
+        assert login(api_client, verified_user.email, "Wrong12345/").status_code == 400
+
+        assert iterations(verified_user) == before
+
+    def test_unknown_user_is_rejected(self, api_client):
+        assert login(api_client, "missing@test.com").status_code == 400
+
+    def test_saturated_pool_returns_429(self, api_client, pool, verified_user):
+        pool.start()
+        # the only slot is taken by a login in progress
+        pool.slots.acquire()
+        try:
+            resp = login(api_client, verified_user.email)
+        finally:
+            pool.slots.release()
+
+        assert resp.status_code == 429
+        assert "Retry-After" in resp.headers
+
+    def test_saturated_pool_returns_429_for_jwt(self, api_client, pool, verified_user):
+        pool.start()
+        pool.slots.acquire()
+        try:
+            resp = api_client.post(
+                reverse("accounts:api-v1:jwt-create"),
+                {"email": verified_user.email, "password": PASSWORD},
+                format="json",
+            )
+        finally:
+            pool.slots.release()
+
+        assert resp.status_code == 429
+
+    def test_login_through_hashing_process(self, api_client, pool, verified_user):
+        assert login(api_client, verified_user.email).status_code == 200
+        assert login(api_client, verified_user.email, "Wrong12345/").status_code == 400
+
+    def test_saturated_pool_returns_429_for_basic_auth(
+        self, api_client, pool, verified_user
+    ):
+        credentials = base64.b64encode(f"{verified_user.email}:{PASSWORD}".encode())
+        pool.start()
+        pool.slots.acquire()
+        try:
+            resp = api_client.get(
+                reverse("accounts:api-v1:profile"),
+                HTTP_AUTHORIZATION=f"Basic {credentials.decode()}",
+            )
+        finally:
+            pool.slots.release()
+
+        assert resp.status_code == 429
+
+    def test_saturated_pool_fails_plain_authenticate(self, client, pool, admin_user):
+        # outside DRF (admin login form) a busy pool is a failed login, not a 500
+        pool.start()
+        pool.slots.acquire()
+        try:
+            user = authenticate(email=admin_user.email, password="password")
+            resp = client.post(
+                reverse("admin:login"),
+                {"username": admin_user.email, "password": "password"},
+            )
+        finally:
+            pool.slots.release()
+
+        assert user is None
+        assert resp.status_code == 200
+
+    def test_slow_check_times_out_with_429(
+        self, api_client, pool, settings, verified_user
+    ):
+        # starting the hashing process alone takes longer than that
+        settings.LOGIN_HASH_TIMEOUT = 0.000001
+
+        assert login(api_client, verified_user.email).status_code == 429
+
+    def test_broken_pool_is_replaced(self, api_client, pool, verified_user):
+        pool.start()
+        broken = pool.executor
+
+        def submit(*args):
+            raise BrokenProcessPool("a worker died")
+
+        broken.submit = submit
+        # the check that found the pool broken runs inline
+        assert login(api_client, verified_user.email).status_code == 200
+        assert pool.executor is None
+
+        assert login(api_client, verified_user.email).status_code == 200
+        assert pool.executor not in (None, broken)
+
+    def test_check_survives_concurrent_reset(self, pool, monkeypatch, verified_user):
+        start, started = pool.start, []
+
+        def start_then_reset():
+            started.extend(start())
+            # another thread discards the pool right after this one started it
+            pool.executor = pool.slots = None
+            return tuple(started)
+
+        monkeypatch.setattr(pool, "start", start_then_reset)
+        try:
+            is_correct, _ = pool.check(PASSWORD, verified_user.password)
+        finally:
+            started[0].shutdown()
+
+        assert is_correct
@@ -1,6 +1,8 @@
 import pytest
+from django.contrib.auth.hashers import make_password
 
 from accounts.models import Profile, User
+from accounts.signals import skip_profile_creation
 
 
 @pytest.mark.django_db
@@ -46,6 +48,49 @@ class TestUserManager:
             )
 
 
+@pytest.mark.django_db
+class TestBulkProvisioning:
+    """Users and profiles created in batches, without the post_save signal."""
+
+    def test_creates_users_and_profiles_in_two_inserts(self, django_assert_num_queries):
+        password = make_password("Pass12345/")
+        users = [User(email=f"bulk{i}@Test.com", password=password) for i in range(5)]
+        profiles = [{"first_name": f"First {i}"} for i in range(5)]
+
+        # the two INSERTs in a transaction (a savepoint inside the test's own)
+        with django_assert_num_queries(4) as queries:
+            created = User.objects.bulk_create_with_profiles(users, profiles)
+
+        inserts = [q for q in queries.captured_queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 2
+        assert all(user.pk for user in created)
+        assert created[0].email == "bulk0@test.com"
+        assert [p.first_name for p in Profile.objects.order_by("user_id")] == [
+            f"First {i}" for i in range(5)
+        ]
+        assert created[4].check_password("Pass12345/")
+
+    def test_profiles_are_optional(self):
+        User.objects.bulk_create_with_profiles([User(email="a@test.com")])
+
+        assert Profile.objects.filter(user__email="a@test.com").exists()
+
+    def test_profile_count_must_match(self):
+        with pytest.raises(ValueError):
+            User.objects.bulk_create_with_profiles([User(email="a@test.com")], [])
+
+        assert not User.objects.exists()
+
+    def test_skip_profile_creation(self):
+        with skip_profile_creation():
+            user = User.objects.create_user(email="skip@test.com", password="x")
+        Profile.objects.create(user=user, first_name="Only", description="one")
+        after = User.objects.create_user(email="after@test.com", password="x")
+
+        assert Profile.objects.get(user=user).first_name == "Only"
+        assert Profile.objects.filter(user=after).exists()
+
+
 @pytest.mark.django_db
 class TestProfileModel:
     """Unit tests for Profile model behavior."""
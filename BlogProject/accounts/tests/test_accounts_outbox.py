@@ -0,0 +1,209 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+from mail_templated import EmailMessage
+
+from accounts.models import OutboxEmail
+from accounts.outbox import EmailDeliveryPool, deliver_due_emails, queue_email
+
+
+@pytest.fixture(autouse=True)
+def locmem_backend(settings):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 3
+    settings.EMAIL_OUTBOX_RETRY_BACKOFF = 10
+
+
+def activation_email(to):
+    return EmailMessage(
+        template_name="email/activation_email.html",
+        context={"activation_link": "http://testserver/activate/"},
+        from_email="noreply@test.local",
+        to=[to],
+    )
+
+
+def make_due(email):
+    OutboxEmail.objects.filter(id=email.id).update(next_attempt_at=timezone.now())
+
+
+@pytest.mark.django_db
+class TestOutbox:
+    def test_queue_email_stores_rendered_message(self):
+        outbox_email = queue_email(activation_email("a@test.com"))
+
+        outbox_email.refresh_from_db()
+        assert outbox_email.status == OutboxEmail.Status.PENDING
+        assert outbox_email.to == ["a@test.com"]
+        assert outbox_email.subject
+        assert "http://testserver/activate/" in outbox_email.body + outbox_email.html
+        assert mail.outbox == []
+
+    def test_queue_email_submits_after_commit(
+        self, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        submitted = []
+        monkeypatch.setattr(
+            "accounts.outbox.delivery_pool.submit", submitted.append, raising=True
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            outbox_email = queue_email(activation_email("a@test.com"))
+            assert submitted == []
+
+        assert submitted == [outbox_email.id]
+
+    def test_deliver_sends_batch_over_one_connection(self, monkeypatch):
+        opened = []
+        original_open = EmailBackend.open
+
+        def counting_open(self):
+            opened.append(self)
+            return original_open(self)
+
+        monkeypatch.setattr(EmailBackend, "open", counting_open)
+        emails = [queue_email(activation_email(f"u{i}@test.com")) for i in range(3)]
+
+        assert deliver_due_emails() == 3
+
+        assert len(opened) == 1
+        assert sorted(m.to[0] for m in mail.outbox) == [
+            "u0@test.com",
+            "u1@test.com",
+            "u2@test.com",
+        ]
+        for email in emails:
+            email.refresh_from_db()
+            assert email.status == OutboxEmail.Status.SENT
+            assert email.attempts == 1
+            assert email.sent_date is not None
+
+    def test_deliver_keeps_html_alternative(self):
+        message = EmailMultiAlternatives(
+            subject="Hi", body="plain", from_email="x@test.local", to=["a@test.com"]
+        )
+        message.attach_alternative("<p>html</p>", "text/html")
+        queue_email(message)
+
+        deliver_due_emails()
+
+        assert mail.outbox[0].body == "plain"
+        assert mail.outbox[0].alternatives[0][0] == "<p>html</p>"
+
+    def test_deliver_only_given_ids(self):
+        first = queue_email(activation_email("a@test.com"))
+        queue_email(activation_email("b@test.com"))
+
+        assert deliver_due_emails([first.id]) == 1
+        assert [m.to for m in mail.outbox] == [["a@test.com"]]
+
+    def test_sent_email_is_not_sent_again(self):
+        queue_email(activation_email("a@test.com"))
+
+        deliver_due_emails()
+        assert deliver_due_emails() == 0
+        assert len(mail.outbox) == 1
+
+    def test_failure_retries_with_exponential_backoff(self, monkeypatch):
+        def fail(self, messages):
+            raise ConnectionError("smtp down")
+
+        monkeypatch.setattr(EmailBackend, "send_messages", fail)
+        email = queue_email(activation_email("a@test.com"))
+
+        before = timezone.now()
+        assert deliver_due_emails() == 0
+        email.refresh_from_db()
+        assert email.status == OutboxEmail.Status.PENDING
+        assert email.last_error == "smtp down"
+        assert email.next_attempt_at >= before + timedelta(seconds=10)
+        # not due yet
+        assert deliver_due_emails() == 0
+
+        make_due(email)
+        before = timezone.now()
+        deliver_due_emails()
+        email.refresh_from_db()
+        assert email.attempts == 2
+        assert email.next_attempt_at >= before + timedelta(seconds=20)
+
+        make_due(email)
+        deliver_due_emails()
+        email.refresh_from_db()
+        assert email.attempts == 3
+        assert email.status == OutboxEmail.Status.FAILED
+
+    def test_retry_succeeds_after_failure(self, monkeypatch):
+        original = EmailBackend.send_messages
+        monkeypatch.setattr(EmailBackend, "send_messages", lambda self, messages: 1 / 0)
+        email = queue_email(activation_email("a@test.com"))
+        deliver_due_emails()
+
+        monkeypatch.setattr(EmailBackend, "send_messages", original)
+        make_due(email)
+        assert deliver_due_emails() == 1
+
+        email.refresh_from_db()
+        assert email.status == OutboxEmail.Status.SENT
+        assert email.last_error == ""
+        assert len(mail.outbox) == 1
+
+    def test_command_sends_due_emails(self):
+        queue_email(activation_email("a@test.com"))
+        call_command("send_outbox_emails", stdout=StringIO())
+
+        assert len(mail.outbox) == 1
+
+
+class TestEmailDeliveryPool:
+    def test_no_workers_leaves_email_in_outbox(self, settings):
+        settings.EMAIL_OUTBOX_WORKERS = 0
+        pool = EmailDeliveryPool()
+
+        assert pool.submit(1) is False
+        assert pool.queue is None
+
+    def test_full_queue_applies_backpressure(self, settings, monkeypatch):
+        settings.EMAIL_OUTBOX_WORKERS = 1
+        settings.EMAIL_OUTBOX_QUEUE_SIZE = 2
+        # no real threads: ids stay queued
+        monkeypatch.setattr("accounts.outbox.threading.Thread.start", lambda self: None)
+        pool = EmailDeliveryPool()
+
+        assert pool.submit(1) is True
+        assert pool.submit(2) is True
+        assert pool.submit(3) is False
+
+    def test_start_again_after_fork(self, settings, monkeypatch):
+        settings.EMAIL_OUTBOX_WORKERS = 2
+        started = []
+        monkeypatch.setattr(
+            "accounts.outbox.threading.Thread.start", lambda self: started.append(1)
+        )
+        pool = EmailDeliveryPool()
+        pool.start()
+        pool.start()
+        assert len(started) == 2
+
+        # a forked child inherits the queue but none of the threads
+        monkeypatch.setattr("accounts.outbox.os.getpid", lambda: pool.pid + 1)
+        pool.start()
+
+        assert len(started) == 4
+
+    def test_next_batch_drains_up_to_batch_size(self, settings, monkeypatch):
+        settings.EMAIL_OUTBOX_WORKERS = 1
+        settings.EMAIL_OUTBOX_BATCH_SIZE = 2
+        monkeypatch.setattr("accounts.outbox.threading.Thread.start", lambda self: None)
+        pool = EmailDeliveryPool()
+        for email_id in (1, 2, 3):
+            pool.submit(email_id)
+
+        assert pool.next_batch() == [1, 2]
+        assert pool.next_batch() == [3]
@@ -0,0 +1,188 @@
+import pytest
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from accounts.models import User
+from accounts.services import (
+    generate_activation_token,
+    generate_reset_password_token,
+)
+
+PASSWORD = "Pass12345/"
+
+
+@pytest.mark.django_db
+class TestAccountsQueryCounts:
+    """
+    Pin every accounts endpoint to the queries it needs. A new query in
+    one of these flows has to be a deliberate change of the count here.
+    """
+
+    def test_registration(self, api_client, django_assert_num_queries):
+        payload = {"email": "new@test.com", "password": PASSWORD, "password1": PASSWORD}
+
+        # unique email check, user INSERT, profile INSERT, outbox INSERT
+        with django_assert_num_queries(4):
+            resp = api_client.post(
+                reverse("accounts:api-v1:registration"), payload, format="json"
+            )
+
+        assert resp.status_code == 201
+
+    def test_activation_confirm(self, api_client, user, django_assert_num_queries):
+        url = reverse(
+            "accounts:api-v1:activation",
+            kwargs={"token": generate_activation_token(user)},
+        )
+
+        # conditional UPDATE only
+        with django_assert_num_queries(1):
+            resp = api_client.get(url)
+
+        assert resp.status_code == 200
+        user.refresh_from_db()
+        assert user.is_verified is True
+
+    def test_activation_confirm_already_verified(
+        self, api_client, verified_user, django_assert_num_queries
+    ):
+        url = reverse(
+            "accounts:api-v1:activation",
+            kwargs={"token": generate_activation_token(verified_user)},
+        )
+
+        # UPDATE matching no row, then the existence check
+        with django_assert_num_queries(2):
+            resp = api_client.get(url)
+
+        assert resp.status_code == 200
+        assert "already" in str(resp.data)
+
+    def test_activation_confirm_deleted_user_404(
+        self, api_client, user, django_assert_num_queries
+    ):
+        url = reverse(
+            "accounts:api-v1:activation",
+            kwargs={"token": generate_activation_token(user)},
+        )
+        User.objects.filter(id=user.id).delete()
+
+        with django_assert_num_queries(2):
+            resp = api_client.get(url)
+
+        assert resp.status_code == 404
+
+    def test_activation_resend(self, api_client, user, django_assert_num_queries):
+        # user lookup, outbox INSERT
+        with django_assert_num_queries(2):
+            resp = api_client.post(
+                reverse("accounts:api-v1:activation-resend"),
+                {"email": user.email},
+                format="json",
+            )
+
+        assert resp.status_code == 200
+
+    def test_token_login(self, api_client, verified_user, django_assert_num_queries):
+        Token.objects.create(user=verified_user)
+
+        # user lookup, token lookup, profile lookup
+        with django_assert_num_queries(3):
+            resp = api_client.post(
+                reverse("accounts:api-v1:token-login"),
+                {"email": verified_user.email, "password": PASSWORD},
+                format="json",
+            )
+
+        assert resp.status_code == 200
+
+    def test_token_logout(self, api_client, verified_user, django_assert_num_queries):
+        token = Token.objects.create(user=verified_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        # token and user lookup, token DELETE
+        with django_assert_num_queries(2):
+            resp = api_client.post(reverse("accounts:api-v1:token-logout"))
+
+        assert resp.status_code == 204
+
+    def test_jwt_create(self, api_client, verified_user, django_assert_num_queries):
+        # user lookup
+        with django_assert_num_queries(1):
+            resp = api_client.post(
+                reverse("accounts:api-v1:jwt-create"),
+                {"email": verified_user.email, "password": PASSWORD},
+                format="json",
+            )
+
+        assert resp.status_code == 200
+
+    def test_change_password(
+        self, api_client, verified_user, django_assert_num_queries
+    ):
+        api_client.force_authenticate(verified_user)
+        payload = {
+            "old_password": PASSWORD,
+            "new_password": "NewPass12345/",
+            "new_password1": "NewPass12345/",
+        }
+
+        # password UPDATE
+        with django_assert_num_queries(1):
+            resp = api_client.put(
+                reverse("accounts:api-v1:change-password"), payload, format="json"
+            )
+
+        assert resp.status_code == 200
+
+    def test_reset_password_request(
+        self, api_client, verified_user, django_assert_num_queries
+    ):
+        # user lookup, outbox INSERT
+        with django_assert_num_queries(2):
+            resp = api_client.post(
+                reverse("accounts:api-v1:reset-password"),
+                {"email": verified_user.email},
+                format="json",
+            )
+
+        assert resp.status_code == 200
+
+    def test_reset_password_confirm(
+        self, api_client, verified_user, django_assert_num_queries
+    ):
+        url = reverse(
+            "accounts:api-v1:reset-password-confirm",
+            kwargs={"token": generate_reset_password_token(verified_user)},
+        )
+        payload = {"password": "NewPass12345/", "password1": "NewPass12345/"}
+
+        # user lookup, password UPDATE
+        with django_assert_num_queries(2):
+            resp = api_client.post(url, payload, format="json")
+
+        assert resp.status_code == 200
+
+    def test_profile_retrieve(
+        self, api_client, verified_user, django_assert_num_queries
+    ):
+        api_client.force_authenticate(verified_user)
+
+        # profile lookup, joined with its user for the email
+        with django_assert_num_queries(1):
+            resp = api_client.get(reverse("accounts:api-v1:profile"))
+
+        assert resp.status_code == 200
+
+    def test_profile_update(self, api_client, verified_user, django_assert_num_queries):
+        api_client.force_authenticate(verified_user)
+
+        # profile lookup, profile UPDATE
+        with django_assert_num_queries(2):
+            resp = api_client.patch(
+                reverse("accounts:api-v1:profile"),
+                {"first_name": "New"},
+                format="json",
+            )
+
+        assert resp.status_code == 200
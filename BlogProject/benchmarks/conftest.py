@@ -0,0 +1,109 @@
+"""
+In-process micro-benchmarks of the post API hot paths (pytest-benchmark).
+
+They are left out of the default test run; run them against the test
+database of the current settings (SQLite or PostgreSQL) with:
+
+    pytest benchmarks                               # print the timings
+    pytest benchmarks --benchmark-autosave          # store them as JSON
+    pytest benchmarks --benchmark-compare           # against the last saved
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:10%
+
+Saved runs go to .benchmarks/ under the current directory, named after
+the commit they measured. Data-dependent benchmarks run once per dataset
+size; pick the sizes with --bench-sizes 100,1000,10000.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from blog.models import Category, Post
+from blog.seeding import generate_posts
+
+DEFAULT_SIZES = "100,1000,10000"
+# one author per this many posts, with Zipf-distributed posts per author
+POSTS_PER_AUTHOR = 20
+CATEGORY_COUNT = 10
+SEED = 52
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-sizes",
+        default=DEFAULT_SIZES,
+        help="Comma-separated post counts the dataset benchmarks run with",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = [
+            int(size) for size in metafunc.config.getoption("bench_sizes").split(",")
+        ]
+        metafunc.parametrize("size", sizes, ids=[f"{size}posts" for size in sizes])
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every benchmark with an empty cache (cached post counts etc.)."""
+    cache.clear()
+
+
+@pytest.fixture
+def dataset(db, size):
+    """
+    Create `size` generated posts (see blog.seeding) over skewed authors
+    and categories; return the profiles and categories they belong to.
+    """
+    password = make_password("Bench12345/")
+    authors = range(max(size // POSTS_PER_AUTHOR, 1))
+    users = User.objects.bulk_create_with_profiles(
+        [User(email=f"bench{i}@test.com", password=password) for i in authors],
+        [{"first_name": f"Author{i}", "last_name": "Bench"} for i in authors],
+    )
+    profiles = [user.profile for user in users]
+    categories = Category.objects.bulk_create(
+        Category(name=f"Category {i}") for i in range(CATEGORY_COUNT)
+    )
+    now = timezone.now()
+    posts = [
+        Post(
+            title=title,
+            content=content,
+            status=status,
+            author=profiles[author],
+            category=categories[category],
+            published_date=now - timedelta(days=age),
+        )
+        for title, content, status, age, author, category in generate_posts(
+            SEED, 0, size, len(profiles), len(categories), 1.1, 1.0
+        )
+    ]
+    for post in posts:
+        post.brief_content = post.first_sentence()
+    Post.objects.bulk_create(posts, batch_size=1000)
+    return SimpleNamespace(profiles=profiles, categories=categories, size=size)
+
+
+@pytest.fixture
+def api_request():
+    """
+    Return a factory of DRF requests: api_request("get", path, data, user).
+    """
+    factory = APIRequestFactory()
+
+    def _api_request(method="get", path="/api/v1/blog/post/", data=None, user=None):
+        django_request = getattr(factory, method)(path, data)
+        if user is not None:
+            force_authenticate(django_request, user=user)
+        return Request(django_request)
+
+    return _api_request
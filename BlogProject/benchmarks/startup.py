@@ -0,0 +1,121 @@
+"""
+Startup cost of the WSGI application per settings profile.
+
+Each run is a fresh interpreter (so nothing is cached in sys.modules)
+that imports core.wsgi, timing `get_wsgi_application()`, then sends one
+request straight to the WSGI callable, timing the first response (the
+URLconf, views and serializers are only imported then). It also counts
+the loaded modules and reports which dev-only packages were imported.
+
+    python benchmarks/startup.py                      # production vs development
+    python benchmarks/startup.py --runs 10 --path /api/v1/blog/post/
+    python benchmarks/startup.py --json startup.json
+
+The database settings come from the environment (.env), as for the
+server; the default path does not query the database.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+PROFILES = {
+    "production": {"DJANGO_SETTINGS_MODULE": "core.settings.production"},
+    # everything dev-only switched on
+    "development": {
+        "DJANGO_SETTINGS_MODULE": "core.settings.development",
+        "API_DOCS": "True",
+        "SHOW_DEBUGGER_TOOLBAR": "True",
+    },
+}
+# coreapi is also imported by rest_framework.compat whenever it is
+# installed, so it shows up in every profile; the URLconf no longer needs it
+DEV_ONLY_PACKAGES = ["drf_yasg", "debug_toolbar", "coreapi"]
+
+# run in the child interpreter; prints one JSON line
+PROBE = """
+import io, json, sys, time
+from wsgiref.util import setup_testing_defaults
+
+started = time.perf_counter()
+from core.wsgi import application
+imported = time.perf_counter()
+
+environ = {"PATH_INFO": PATH, "HTTP_HOST": "localhost", "wsgi.input": io.BytesIO()}
+setup_testing_defaults(environ)
+status = []
+body = b"".join(application(environ, lambda s, h, e=None: status.append(s)))
+responded = time.perf_counter()
+
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_request_ms": (responded - imported) * 1000,
+    "status": status[0],
+    "modules": len(sys.modules),
+    "dev_only": [name for name in DEV_ONLY if name in sys.modules],
+}))
+"""
+
+
+def probe(profile, path):
+    env = {**os.environ, **PROFILES[profile]}
+    code = f"PATH = {path!r}\nDEV_ONLY = {DEV_ONLY_PACKAGES!r}\n{PROBE}"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(profile, path, runs):
+    results = [probe(profile, path) for _ in range(runs)]
+    return {
+        "import_ms": statistics.median(r["import_ms"] for r in results),
+        "first_request_ms": statistics.median(r["first_request_ms"] for r in results),
+        "status": results[-1]["status"],
+        "modules": results[-1]["modules"],
+        "dev_only": results[-1]["dev_only"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per profile")
+    parser.add_argument(
+        "--path", default="/api/v1/blog/post/get_ok/", help="Path of the first request"
+    )
+    parser.add_argument(
+        "--profile", choices=PROFILES, action="append", help="Default: all"
+    )
+    parser.add_argument("--json", help="Also write the results to this file")
+    options = parser.parse_args()
+
+    results = {
+        profile: measure(profile, options.path, options.runs)
+        for profile in options.profile or PROFILES
+    }
+    print(
+        f"{'profile':<12} {'import ms':>10} {'1st request ms':>15} {'modules':>8}"
+        "  dev-only packages loaded"
+    )
+    for profile, result in results.items():
+        print(
+            f"{profile:<12} {result['import_ms']:>10.1f}"
+            f" {result['first_request_ms']:>15.1f} {result['modules']:>8}"
+            f"  {', '.join(result['dev_only']) or '-'}   ({result['status']})"
+        )
+    if options.json:
+        Path(options.json).write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
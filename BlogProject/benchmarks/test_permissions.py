@@ -0,0 +1,46 @@
+import pytest
+
+from accounts.models import User
+from blog.api.v1.permissions import IsOwnerOrReadonly
+from blog.models import Category, Post
+
+
+@pytest.fixture
+def owned_post(db):
+    owner = User.objects.create_user(email="owner@test.com", password="x")
+    other = User.objects.create_user(email="other@test.com", password="x")
+    post = Post.objects.create(
+        title="Owned",
+        content="Owned post.",
+        author=owner.profile,
+        category=Category.objects.create(name="Bench"),
+    )
+    # what the request carries after (cached) authentication
+    owner = User.objects.select_related("profile").get(pk=owner.pk)
+    other = User.objects.select_related("profile").get(pk=other.pk)
+    return post, owner, other
+
+
+@pytest.mark.parametrize(
+    "method, who, allowed",
+    [
+        ("get", "other", True),
+        ("patch", "owner", True),
+        ("patch", "other", False),
+        ("delete", "anonymous", False),
+    ],
+)
+def test_is_owner_or_readonly(
+    benchmark, owned_post, api_request, django_assert_num_queries, method, who, allowed
+):
+    benchmark.group = "IsOwnerOrReadonly.has_object_permission"
+    post, owner, other = owned_post
+    user = {"owner": owner, "other": other, "anonymous": None}[who]
+    request = api_request(method, f"/api/v1/blog/post/{post.pk}/", user=user)
+    request.user  # authenticate before timing
+    permission = IsOwnerOrReadonly()
+
+    with django_assert_num_queries(0):
+        result = benchmark(permission.has_object_permission, request, None, post)
+
+    assert result is allowed
@@ -0,0 +1,66 @@
+import pytest
+from django.core.cache import cache
+
+from blog.api.v1.paginations import PostPagination
+from blog.api.v1.views import PostViewSet
+
+FILTERS = {
+    "none": {},
+    "category": {"category": "first"},
+    "status": {"status": "true"},
+    "search": {"search": "government"},
+    "ordering": {"ordering": "-published_date"},
+}
+
+
+def post_view(api_request, params):
+    request = api_request("get", "/api/v1/blog/post/", params)
+    return PostViewSet(
+        request=request, action="list", args=(), kwargs={}, format_kwarg=None
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("filter_name", FILTERS)
+def test_filter_pipeline(benchmark, dataset, api_request, filter_name):
+    """
+    The PostViewSet list queryset through its filter backends (django-filter,
+    search, ordering), fetching the first page of rows.
+    """
+    benchmark.group = f"PostViewSet filters: {filter_name}"
+    params = dict(FILTERS[filter_name])
+    if params.get("category") == "first":
+        params["category"] = dataset.categories[0].id
+    view = post_view(api_request, params)
+
+    def first_page():
+        return list(view.filter_queryset(view.get_queryset())[:10])
+
+    assert benchmark(first_page)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("count_cache", ["cold", "warm"])
+@pytest.mark.parametrize("page", ["first", "last"])
+def test_pagination(benchmark, dataset, api_request, page, count_cache):
+    """
+    PostPagination of the list queryset, from counting to the response
+    envelope; a cold count cache adds the COUNT query.
+    """
+    benchmark.group = f"PostPagination: {page} page, {count_cache} count"
+    page_size = PostPagination.max_page_size
+    number = 1 if page == "first" else -(-dataset.size // page_size)
+    view = post_view(api_request, {"page": number, "page_size": page_size})
+    queryset = view.filter_queryset(view.get_queryset())
+
+    def paginate():
+        paginator = PostPagination()
+        rows = paginator.paginate_queryset(queryset, view.request, view=view)
+        return paginator.get_paginated_response(rows)
+
+    if count_cache == "cold":
+        response = benchmark.pedantic(paginate, setup=cache.clear, rounds=50)
+    else:
+        response = benchmark(paginate)
+
+    assert response.data["total_objects"] == dataset.size
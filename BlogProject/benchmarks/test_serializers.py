@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+
+from blog.api.v1.serializer import (
+    CategorySerializer,
+    PostListSerializer,
+    PostSerializer,
+)
+from blog.models import Category, Post
+from blog.seeding import CONTENT_MAX_LENGTH, CONTENT_MEDIAN_LENGTH, generate_posts
+
+
+def context(request, action):
+    return {"request": request, "view": SimpleNamespace(action=action)}
+
+
+@pytest.mark.django_db
+class TestPostSerializers:
+    def test_list_rows(self, benchmark, dataset, api_request):
+        """PostListSerializer over `.values()` rows: what the list view renders."""
+        benchmark.group = "post list rendering"
+        rows = list(Post.objects.list_rows())
+        serializer_context = context(api_request(), "list")
+
+        data = benchmark(
+            lambda: PostListSerializer(rows, many=True, context=serializer_context).data
+        )
+
+        assert len(data) == dataset.size
+
+    def test_list_instances(self, benchmark, dataset, api_request):
+        """PostSerializer over model instances, in the list action."""
+        benchmark.group = "post list rendering"
+        posts = list(Post.objects.for_action("list"))
+        serializer_context = context(api_request(), "list")
+
+        data = benchmark(
+            lambda: PostSerializer(posts, many=True, context=serializer_context).data
+        )
+
+        assert len(data) == dataset.size
+
+    def test_detail(self, benchmark, dataset, api_request):
+        benchmark.group = "post detail rendering"
+        post = Post.objects.for_action("retrieve").first()
+        serializer_context = context(api_request(), "retrieve")
+
+        data = benchmark(lambda: PostSerializer(post, context=serializer_context).data)
+
+        assert data["content"] == post.content
+
+
+@pytest.mark.parametrize(
+    "length", [80, CONTENT_MEDIAN_LENGTH, CONTENT_MAX_LENGTH], ids=lambda n: f"{n}chars"
+)
+def test_first_sentence(benchmark, length):
+    benchmark.group = "Post.first_sentence"
+    content = " ".join(post[1] for post in generate_posts(52, 0, 40))
+    while len(content) < length:
+        content += " " + content
+    post = Post(content=content[:length])
+
+    assert benchmark(post.first_sentence).endswith(" ...")
+
+
+@pytest.mark.django_db
+def test_category_serializer(benchmark, size, api_request):
+    benchmark.group = "CategorySerializer"
+    categories = Category.objects.bulk_create(
+        Category(name=f"Category {i}") for i in range(size)
+    )
+    serializer_context = {"request": api_request()}
+
+    data = benchmark(
+        lambda: CategorySerializer(
+            categories, many=True, context=serializer_context
+        ).data
+    )
+
+    assert len(data) == size
@@ -0,0 +1,62 @@
+from functools import wraps
+
+from django.utils.cache import get_conditional_response
+
+from ...services import get_etag
+
+
+def conditional_response(request, etag, handler, *args, **kwargs):
+    """
+    Answer a GET/HEAD with `304 Not Modified` when the client's
+    If-None-Match still matches `etag`, without calling `handler`;
+    otherwise call it and attach the ETag. There is no Last-Modified (see
+    services.get_etag), so If-Modified-Since alone never gets a 304.
+    """
+    if request.method not in ("GET", "HEAD") or etag is None:
+        return handler(request, *args, **kwargs)
+
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
+    response = handler(request, *args, **kwargs)
+    if response.status_code == 200:
+        response.headers.setdefault("ETag", etag)
+    return response
+
+
+def conditional_get(model, pk_kwarg=None):
+    """
+    Decorator adding conditional GET to a function view, or with
+    method_decorator to an APIView method. Put it below @api_view so
+    authentication and permissions run first.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            pk = kwargs.get(pk_kwarg) if pk_kwarg else None
+            etag = None
+            if request.method in ("GET", "HEAD"):
+                etag = get_etag(model, pk)
+            return conditional_response(request, etag, view_func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET for the list/retrieve actions of generic views and
+    viewsets, using the ETag of the view's queryset model.
+    """
+
+    def list(self, request, *args, **kwargs):
+        etag = get_etag(self.queryset.model)
+        return conditional_response(request, etag, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        etag = get_etag(self.queryset.model, pk)
+        return conditional_response(request, etag, super().retrieve, *args, **kwargs)
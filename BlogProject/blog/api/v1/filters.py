@@ -0,0 +1,33 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F
+from rest_framework.filters import SearchFilter
+
+
+class PostSearchFilter(SearchFilter):
+    """
+    Full-text search over Post.search_vector on PostgreSQL.
+
+    Keeps SearchFilter's `?search=` param; matches are ranked by relevance
+    (title above content) unless `?ordering=` is given. On other databases
+    it falls back to SearchFilter's ILIKE lookups on `search_fields`.
+    """
+
+    search_config = "english"
+
+    def filter_queryset(self, request, queryset, view):
+        if connections[queryset.db].vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        query = SearchQuery(
+            " ".join(search_terms), config=self.search_config, search_type="websearch"
+        )
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-created_date")
+        )
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from ...services import post_response_cache_key
+
+
+class PostResponseCacheMixin:
+    """
+    Cache the data of successful list/retrieve responses of a post viewset.
+
+    Authentication, permissions and throttling still run on every request;
+    only the queries and serialization are skipped on a hit. Entries are
+    invalidated by bumping the posts cache version (see blog.signals), which
+    every server process must see: the default cache has to be shared
+    (see blog.checks).
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        key = post_response_cache_key(request, self.action)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.POST_RESPONSE_CACHE_TIMEOUT)
+        return response
@@ -1,5 +1,32 @@
-from rest_framework.pagination import PageNumberPagination
+from base64 import b64decode, b64encode
+from datetime import datetime
+from urllib import parse
+
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from ...services import count_posts, normalize_post_filters
+
+
+class CountedPaginator(Paginator):
+    """
+    Django paginator whose total comes from a `counter` callable
+    instead of always running `queryset.count()`.
+    """
+
+    def __init__(self, object_list, per_page, counter, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.counter = counter
+
+    @cached_property
+    def count(self):
+        return self.counter(self.object_list)
 
 
 class PostPagination(PageNumberPagination):
@@ -7,6 +34,40 @@ class PostPagination(PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = 10
 
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        self.count_is_exact = True
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, queryset, page_size):
+        return CountedPaginator(queryset, page_size, counter=self.get_count)
+
+    def get_count(self, queryset):
+        """
+        Count through the post count cache, keyed on the filter and
+        search params the view actually applies to the queryset.
+        """
+        filters = normalize_post_filters(
+            self.request.query_params, self.get_count_params()
+        )
+        count, self.count_is_exact = count_posts(queryset, filters)
+        return count
+
+    def get_count_params(self):
+        params = []
+        filterset_fields = getattr(self.view, "filterset_fields", None) or {}
+        if isinstance(filterset_fields, dict):
+            for field, lookups in filterset_fields.items():
+                params += [
+                    field if lookup == "exact" else f"{field}__{lookup}"
+                    for lookup in lookups
+                ]
+        else:
+            params += filterset_fields
+        if getattr(self.view, "search_fields", None):
+            params.append(api_settings.SEARCH_PARAM)
+        return params
+
     def get_paginated_response(self, data):
         return Response(
             {
@@ -16,6 +77,152 @@ class PostPagination(PageNumberPagination):
                 },
                 "total_objects": self.page.paginator.count,
                 "total_pages": self.page.paginator.num_pages,
+                "count_is_exact": self.count_is_exact,
                 "results": data,
             }
         )
+
+
+class PostCursorPagination(BasePagination):
+    """
+    Keyset pagination over (created_date, id), the same order as
+    Post.Meta.ordering with id as a tie-breaker.
+
+    Every page is a single indexed range query: no OFFSET and no COUNT,
+    so deep pages cost the same as the first one. The response keeps the
+    `links`/`results` envelope of PostPagination without the totals.
+
+    Pages are always in that feed order, so `?ordering=` and `?search=`
+    (ranked by relevance) are rejected with a 400 rather than ignored.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = PostPagination.page_size
+    page_size_query_param = PostPagination.page_size_query_param
+    max_page_size = PostPagination.max_page_size
+    invalid_cursor_message = "Invalid cursor"
+    unsupported_params = (api_settings.ORDERING_PARAM, api_settings.SEARCH_PARAM)
+    unsupported_param_message = "Not supported with ?paginate=cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        unsupported = [
+            param
+            for param in self.unsupported_params
+            if request.query_params.get(param)
+        ]
+        if unsupported:
+            raise ValidationError(
+                {param: [self.unsupported_param_message] for param in unsupported}
+            )
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        self.reverse = False
+        queryset = queryset.order_by("-created_date", "-id")
+        if position is not None:
+            created_date, pk, self.reverse = position
+            if self.reverse:
+                queryset = queryset.filter(
+                    Q(created_date__gt=created_date)
+                    | Q(created_date=created_date, id__gt=pk)
+                ).order_by("created_date", "id")
+            else:
+                queryset = queryset.filter(
+                    Q(created_date__lt=created_date)
+                    | Q(created_date=created_date, id__lt=pk)
+                )
+
+        # fetch one extra row to know whether another page exists
+        rows = list(queryset[: page_size + 1])
+        has_more = len(rows) > page_size
+        self.page = rows[:page_size]
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "links": {
+                    "next": self.get_next_link(),
+                    "previous": self.get_previous_link(),
+                },
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "links": {
+                    "type": "object",
+                    "properties": {
+                        "next": {"type": "string", "nullable": True},
+                        "previous": {"type": "string", "nullable": True},
+                    },
+                },
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def decode_cursor(self, request):
+        """
+        Return (created_date, id, reverse) from the cursor query param,
+        or None when the first page is requested.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            created_date = datetime.fromisoformat(tokens["c"][0])
+            pk = int(tokens["i"][0])
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return created_date, pk, reverse
+
+    def encode_cursor(self, row, reverse):
+        # rows are model instances or `.values()` dicts
+        if isinstance(row, dict):
+            created_date, pk = row["created_date"], row["id"]
+        else:
+            created_date, pk = row.created_date, row.id
+        tokens = {"c": created_date.isoformat(), "i": pk}
+        if reverse:
+            tokens["r"] = "1"
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
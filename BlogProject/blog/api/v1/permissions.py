@@ -9,4 +9,7 @@ class IsOwnerOrReadonly(BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
 
-        return obj.author.user == request.user
+        # compare ids: the profile is loaded along with the authenticated
+        # user, so neither obj.author nor its user has to be loaded
+        profile = getattr(request.user, "profile", None)
+        return profile is not None and obj.author_id == profile.id
@@ -1,8 +1,33 @@
+from django.urls import reverse
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
-from accounts.models import Profile
+from core.metrics import TimedListSerializer, TimedSerializerMixin
 
 from ...models import Category, Post
+from ...services import get_category_map
+
+
+class CategorySlugRelatedField(serializers.SlugRelatedField):
+    """
+    SlugRelatedField for categories by name, resolved from the
+    process-level category map instead of a query per write.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.fail("invalid")
+        matches = get_category_map()["by_name"].get(data)
+        if not matches:
+            # not in the map yet (e.g. the cache was flushed): check the
+            # database once before rejecting the name
+            matches = get_category_map(reload=True)["by_name"].get(data)
+        if not matches:
+            self.fail("does_not_exist", slug_name=self.slug_field, value=data)
+        if len(matches) > 1:
+            self.fail("invalid")
+        return matches[0]
+
 
 # Approach 1
 """
@@ -15,9 +40,10 @@ class PostSerializer(serializers.Serializer):
 
 
 # Approach 2
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Post
+        list_serializer_class = TimedListSerializer
         fields = [
             "id",
             "author",
@@ -35,18 +61,27 @@ class PostSerializer(serializers.ModelSerializer):
 
     # category = CategorySerializer()
     # better
-    category = serializers.SlugRelatedField(
+    category = CategorySlugRelatedField(
         many=False, slug_field="name", queryset=Category.objects.all()
     )
 
     author = serializers.SlugRelatedField(read_only=True, slug_field="get_full_name")
 
-    brief_content = serializers.ReadOnlyField(source="first_sentence")
+    brief_content = serializers.ReadOnlyField()
     relative_url = serializers.URLField(source="get_absolute_api_url", read_only=True)
     absolute_url = serializers.SerializerMethodField(
         source="get_absolute_url", read_only=True
     )
 
+    def get_fields(self):
+        fields = super().get_fields()
+        view = self.context.get("view")
+        if getattr(view, "action", None) == "list":
+            # list view shows brief_content, so `content` is never read
+            # (it is deferred by Post.objects.for_action("list"))
+            fields.pop("content", None)
+        return fields
+
     def get_absolute_url(self, obj):
         request = self.context.get("request")
         return request.build_absolute_uri(obj.get_absolute_api_url())
@@ -70,7 +105,7 @@ class PostSerializer(serializers.ModelSerializer):
         """
 
         # Approach 2 (better)
-        if view and view.action == "list":
+        if getattr(view, "action", None) == "list":
             # list view
             rep.pop("content", None)
         else:
@@ -80,22 +115,36 @@ class PostSerializer(serializers.ModelSerializer):
             rep.pop("absolute_url", None)
 
         # separate view and create structure of items by overriding
-        rep["category"] = CategorySerializer(
-            instance=instance.category, context={"request": request}
-        ).data
+        rep["category"] = self.get_category_representation(instance, request)
 
         return rep
 
+    def get_category_representation(self, instance, request):
+        """
+        Serialize each category once per request: posts of a page
+        sharing a category reuse the same representation.
+        """
+        if instance.category_id is None:
+            return CategorySerializer(instance=None, context={"request": request}).data
+
+        # the root is the ListSerializer of a page, or self for one post
+        memo = self.root.__dict__.setdefault("_category_representations", {})
+        if instance.category_id not in memo:
+            memo[instance.category_id] = CategorySerializer(
+                instance=instance.category, context={"request": request}
+            ).data
+        return memo[instance.category_id]
+
     def create(self, validated_data):
-        validated_data["author"] = Profile.objects.get(
-            user=self.context["request"].user
-        )
+        # cached with the user by accounts.authentication
+        validated_data["author"] = self.context["request"].user.profile
         return super(PostSerializer, self).create(validated_data)
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
+        list_serializer_class = TimedListSerializer
         fields = ["id", "name"]
         read_only_fields = ["id"]
 
@@ -109,3 +158,86 @@ class CategorySerializer(serializers.ModelSerializer):
 
         return rep
         """
+
+
+class PostListSerializer(TimedSerializerMixin, serializers.Serializer):
+    """
+    Read-only list representation of posts built from
+    `Post.objects.list_rows()` dicts instead of model instances.
+
+    Renders the same output as PostSerializer in the list action, but only
+    for the fields actually returned, and resolves the detail URL once per
+    serializer instead of once per row. The declared fields document the
+    schema; to_representation does not go through them.
+    """
+
+    class Meta:
+        list_serializer_class = TimedListSerializer
+
+    # stands in for the pk while the detail URL is reversed once
+    PK_PLACEHOLDER = "__pk__"
+
+    id = serializers.IntegerField(read_only=True)
+    author = serializers.CharField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    brief_content = serializers.CharField(read_only=True)
+    image = serializers.ImageField(read_only=True)
+    status = serializers.BooleanField(read_only=True)
+    category = CategorySerializer(read_only=True)
+    relative_url = serializers.URLField(read_only=True)
+    absolute_url = serializers.URLField(read_only=True)
+    published_date = serializers.DateTimeField(read_only=True)
+
+    @cached_property
+    def url_templates(self):
+        relative = reverse(
+            "blog:api-v1:post-detail", kwargs={"pk": self.PK_PLACEHOLDER}
+        )
+        request = self.context.get("request")
+        return relative, request.build_absolute_uri(relative)
+
+    @cached_property
+    def empty_category(self):
+        return CategorySerializer(instance=None).data
+
+    @cached_property
+    def image_storage(self):
+        return Post._meta.get_field("image").storage
+
+    def to_representation(self, row):
+        relative_url, absolute_url = self.url_templates
+        pk = str(row["id"])
+
+        author = None
+        if row["author_id"] is not None:
+            author = f"{row['author__first_name']} {row['author__last_name']}"
+
+        image = None
+        if row["image"]:
+            image = self.image_storage.url(row["image"])
+            request = self.context.get("request")
+            if request is not None:
+                image = request.build_absolute_uri(image)
+
+        category = self.empty_category
+        if row["category_id"] is not None:
+            category = {"id": row["category_id"], "name": row["category__name"]}
+
+        published_date = row["published_date"]
+        if published_date is not None:
+            published_date = self.fields["published_date"].to_representation(
+                published_date
+            )
+
+        return {
+            "id": row["id"],
+            "author": author,
+            "title": row["title"],
+            "brief_content": row["brief_content"],
+            "image": image,
+            "status": row["status"],
+            "category": category,
+            "relative_url": relative_url.replace(self.PK_PLACEHOLDER, pk),
+            "absolute_url": absolute_url.replace(self.PK_PLACEHOLDER, pk),
+            "published_date": published_date,
+        }
@@ -0,0 +1,62 @@
+import time
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+
+from core.metrics import add_serialize_time
+
+
+def wants_stream(request):
+    """
+    Stream only when the response would be rendered as JSON anyway;
+    the browsable API keeps the regular, fully rendered response.
+    """
+    return isinstance(getattr(request, "accepted_renderer", None), JSONRenderer)
+
+
+class StreamingJSONListResponse(StreamingHttpResponse):
+    """
+    Render `queryset` as a JSON array one chunk of rows at a time.
+
+    Rows are read with `.iterator(chunk_size=...)` (a server-side cursor
+    on PostgreSQL) and serialized by a single `serializer` instance, so
+    memory stays flat however many rows the table holds. The bytes are
+    the same as JSONRenderer would produce for the whole list.
+    """
+
+    def __init__(self, queryset, serializer, chunk_size=None, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        self.chunk_size = chunk_size or settings.POST_STREAM_CHUNK_SIZE
+        super().__init__(self.render_rows(queryset, serializer), **kwargs)
+
+    def render_rows(self, queryset, serializer):
+        renderer = JSONRenderer()
+        separator = b""
+        chunk = [b"["]
+        serialize_time = 0.0
+        for row in queryset.iterator(chunk_size=self.chunk_size):
+            started = time.perf_counter()
+            chunk += [separator, renderer.render(serializer.to_representation(row))]
+            serialize_time += time.perf_counter() - started
+            separator = b","
+            if len(chunk) >= 2 * self.chunk_size:
+                add_serialize_time(serialize_time)
+                serialize_time = 0.0
+                yield b"".join(chunk)
+                chunk = []
+        add_serialize_time(serialize_time)
+        chunk.append(b"]")
+        yield b"".join(chunk)
+
+
+class StreamingListMixin:
+    """
+    Stream the unpaginated list action of a generic view as JSON.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if not wants_stream(request):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingJSONListResponse(queryset, self.get_serializer())
@@ -1,22 +1,31 @@
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
-from rest_framework.decorators import action, api_view, permission_classes
-from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.generics import (
-    ListCreateAPIView,
-    RetrieveUpdateDestroyAPIView
+from rest_framework.decorators import (
+    action,
+    api_view,
+    authentication_classes,
+    permission_classes,
 )
-from rest_framework.permissions import IsAuthenticatedOrReadOnly,IsAuthenticated
+from rest_framework.filters import OrderingFilter
+from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
+from accounts.authentication import StatelessAuthentication
+from core.docs import swagger_auto_schema
+
 from ...models import Category, Post
-from .paginations import PostPagination
+from .conditional import ConditionalGetMixin, conditional_get
+from .filters import PostSearchFilter
+from .mixins import PostResponseCacheMixin
+from .paginations import PostCursorPagination, PostPagination
 from .permissions import IsOwnerOrReadonly
-from .serializer import CategorySerializer, PostSerializer
+from .serializer import CategorySerializer, PostListSerializer, PostSerializer
+from .streaming import StreamingJSONListResponse, StreamingListMixin, wants_stream
 
 
 # Function Based Views
@@ -33,14 +42,19 @@ from .serializer import CategorySerializer, PostSerializer
     operation_description="Create a new blog post",
 )
 @api_view(["GET", "POST"])
+@authentication_classes([StatelessAuthentication])
 @permission_classes([IsAuthenticatedOrReadOnly])
+@conditional_get(Post)
 def post_list(request):
     if request.method == "GET":
-        posts = Post.objects.all()
-        post_serializer = PostSerializer(posts, many=True)
+        posts = Post.objects.with_relations()
+        if wants_stream(request):
+            serializer = PostSerializer(context={"request": request})
+            return StreamingJSONListResponse(posts, serializer)
+        post_serializer = PostSerializer(posts, many=True, context={"request": request})
         return Response(post_serializer.data)
     elif request.method == "POST":
-        serializer = PostSerializer(data=request.data)
+        serializer = PostSerializer(data=request.data, context={"request": request})
 
         # Approach 1
         """
@@ -77,9 +91,11 @@ def post_list(request):
     operation_description="Delete a post by its ID",
 )
 @api_view(["GET", "PUT", "DELETE"])
+@authentication_classes([StatelessAuthentication])
 @permission_classes([IsAuthenticatedOrReadOnly])
+@conditional_get(Post, pk_kwarg="id")
 def post_detail(request, id):
-    post = get_object_or_404(Post, id=id)
+    post = get_object_or_404(Post.objects.with_relations(), id=id)
     if request.method == "GET":
 
         # Approach 1
@@ -95,10 +111,12 @@ def post_detail(request, id):
 
         # Approach 2
 
-        post_serializer = PostSerializer(post)
+        post_serializer = PostSerializer(post, context={"request": request})
         return Response(post_serializer.data)
     elif request.method == "PUT":
-        serializer = PostSerializer(post, data=request.data)
+        serializer = PostSerializer(
+            post, data=request.data, context={"request": request}
+        )
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
@@ -116,6 +134,7 @@ class PostListAPIView(APIView):
     List all posts, or create a new post.
     """
 
+    authentication_classes = [StatelessAuthentication]
     permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = PostSerializer
 
@@ -126,15 +145,23 @@ class PostListAPIView(APIView):
         "post": "Create a new post using APIView",
     }
 
+    @method_decorator(conditional_get(Post))
     def get(self, request):
         """Retrieving a list of all posts"""
-        posts = Post.objects.all()
-        post_serializer = self.serializer_class(posts, many=True)
+        posts = Post.objects.with_relations()
+        if wants_stream(request):
+            serializer = self.serializer_class(context={"request": request})
+            return StreamingJSONListResponse(posts, serializer)
+        post_serializer = self.serializer_class(
+            posts, many=True, context={"request": request}
+        )
         return Response(post_serializer.data)
 
     def post(self, request):
         """Creating a new post with provided data"""
-        serializer = self.serializer_class(data=request.data)
+        serializer = self.serializer_class(
+            data=request.data, context={"request": request}
+        )
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
@@ -145,6 +172,7 @@ class PostDetailAPIView(APIView):
     Retrieve, update or delete a post instance.
     """
 
+    authentication_classes = [StatelessAuthentication]
     permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = PostSerializer
 
@@ -160,16 +188,19 @@ class PostDetailAPIView(APIView):
         "delete": "Delete a post using APIView",
     }
 
+    @method_decorator(conditional_get(Post, pk_kwarg="id"))
     def get(self, request, id):
         """Retrieving a post"""
-        post = get_object_or_404(Post, id=id)
-        post_serializer = self.serializer_class(post)
+        post = get_object_or_404(Post.objects.with_relations(), id=id)
+        post_serializer = self.serializer_class(post, context={"request": request})
         return Response(post_serializer.data)
 
     def put(self, request, id):
         """Updating a post"""
-        post = get_object_or_404(Post, id=id)
-        serializer = self.serializer_class(post, data=request.data)
+        post = get_object_or_404(Post.objects.with_relations(), id=id)
+        serializer = self.serializer_class(
+            post, data=request.data, context={"request": request}
+        )
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
@@ -188,11 +219,14 @@ class PostDetailAPIView(APIView):
 
 
 # GenericAPIView,ListModelMixin,CreateModelMixin == ListCreateAPIView
-class PostListGenericAPIView(ListCreateAPIView):
+class PostListGenericAPIView(
+    ConditionalGetMixin, StreamingListMixin, ListCreateAPIView
+):
 
+    authentication_classes = [StatelessAuthentication]
     permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = PostSerializer
-    queryset = Post.objects.all()
+    queryset = Post.objects.with_relations()
     swagger_tags = ["Blog / Posts (ListCreateAPIView)"]
     swagger_summary = {
         "list": "List posts",
@@ -210,11 +244,12 @@ class PostListGenericAPIView(ListCreateAPIView):
 
 # (GenericAPIView,RetrieveModelMixin,UpdateModelMixin,
 # DestroyModelMixin) == RetrieveUpdateDestroyAPIView
-class PostDetailGenericAPIView(RetrieveUpdateDestroyAPIView):
+class PostDetailGenericAPIView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
 
+    authentication_classes = [StatelessAuthentication]
     permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = PostSerializer
-    queryset = Post.objects.all()
+    queryset = Post.objects.with_relations()
     lookup_field = "id"
     swagger_tags = ["Blog / Posts (RetrieveUpdateDestroyAPIView)"]
     swagger_summary = {
@@ -232,11 +267,12 @@ class PostDetailGenericAPIView(RetrieveUpdateDestroyAPIView):
     }
 
 
-class PostViewSet(ModelViewSet):
+class PostViewSet(ConditionalGetMixin, PostResponseCacheMixin, ModelViewSet):
+    authentication_classes = [StatelessAuthentication]
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrReadonly]
     serializer_class = PostSerializer
     queryset = Post.objects.all()
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, PostSearchFilter, OrderingFilter]
     # filterset_fields = ["category","author","status"]
     filterset_fields = {
         "category": ["exact", "in"],
@@ -246,6 +282,8 @@ class PostViewSet(ModelViewSet):
     search_fields = ["title", "content"]
     ordering_fields = ["published_date"]
     pagination_class = PostPagination
+    # alternative paginators selectable per request with ?paginate=<mode>
+    pagination_modes = {"cursor": PostCursorPagination}
 
     swagger_tags = ["Blog / Posts (ModelViewSet)"]
     swagger_summary = {
@@ -258,7 +296,10 @@ class PostViewSet(ModelViewSet):
         "get_ok": "Health check",
     }
     swagger_description = {
-        "list": "Retrieve a list of all blog posts",
+        "list": (
+            "Retrieve a list of all blog posts. With ?paginate=cursor pages "
+            "are in feed order: ?ordering= and ?search= are rejected (400)"
+        ),
         "retrieve": "Retrieve a post by its ID",
         "create": "Create a new blog post",
         "update": "Update a post by its ID",
@@ -267,12 +308,33 @@ class PostViewSet(ModelViewSet):
         "get_ok": "Simple test endpoint",
     }
 
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            request = getattr(self, "request", None)
+            mode = request.query_params.get("paginate") if request else None
+            self._paginator = self.pagination_modes.get(mode, self.pagination_class)()
+        return self._paginator
+
+    def get_queryset(self):
+        if self.action == "list":
+            return Post.objects.list_rows()
+        return Post.objects.for_action(self.action)
+
+    def get_serializer_class(self):
+        # lists render plain rows through the lightweight read-only path;
+        # forms for POST on the list URL (browsable API) need the writable one
+        if self.action == "list" and self.request.method in ("GET", "HEAD"):
+            return PostListSerializer
+        return super().get_serializer_class()
+
     @action(methods=["get"], detail=False)
     def get_ok(self, request):
         return Response({"detail": "ok"})
 
 
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(ConditionalGetMixin, ModelViewSet):
+    authentication_classes = [StatelessAuthentication]
     permission_classes = [IsAuthenticated]
     serializer_class = CategorySerializer
     queryset = Category.objects.all()
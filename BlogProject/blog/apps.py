@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BlogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "blog"
+
+    def ready(self):
+        import blog.checks  # noqa: F401
+        import blog.signals  # noqa: F401
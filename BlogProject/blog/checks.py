@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# backends whose entries only the current process sees
+PROCESS_LOCAL_CACHES = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    The post response cache, the cache versions and the authentication
+    entries are invalidated through the default cache: with a cache per
+    process, the other workers keep serving stale data.
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    if not settings.SHARED_CACHE_REQUIRED or backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Error(
+            f"The default cache ({backend}) is not shared between processes.",
+            hint="Use a shared backend such as RedisCache (REDIS_URL), or set "
+            "SHARED_CACHE_REQUIRED = False for a single process server.",
+            id="blog.E001",
+        )
+    ]
@@ -0,0 +1,175 @@
+"""
+Export and load benchmark datasets (users, profiles, categories, posts).
+
+A dataset is a directory with one gzipped file per table, in the text
+format of PostgreSQL COPY (tab separated, \\N for NULL, backslash
+escapes), and a manifest.json describing it. PostgreSQL loads the files
+with COPY FROM STDIN; other databases go through bulk_create.
+"""
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from accounts.models import Profile, User
+
+from .models import Category, Post
+
+# in dependency order
+DATASET_MODELS = [User, Profile, Category, Post]
+# filled by the database itself (PostgreSQL trigger), never exported
+SKIPPED_FIELDS = {"search_vector"}
+FORMAT_VERSION = 1
+NULL = "\\N"
+ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
+def dataset_fields(model):
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if field.name not in SKIPPED_FIELDS
+    ]
+
+
+def table_path(path, model):
+    return Path(path) / f"{model._meta.db_table}.tsv.gz"
+
+
+def encode(value):
+    if value is None:
+        return NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    value = str(value)
+    for char, escaped in ESCAPES.items():
+        value = value.replace(char, escaped)
+    return value
+
+
+def decode(value):
+    if value == NULL:
+        return None
+    if "\\" not in value:
+        return value
+    chars, escaped = [], False
+    for char in value:
+        if escaped:
+            chars.append(UNESCAPES.get(char, char))
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def export_dataset(path, meta=None, chunk_size=2000):
+    """
+    Write every row of DATASET_MODELS under `path` and return the
+    manifest. `meta` (generator parameters...) is stored in it as is.
+    """
+    Path(path).mkdir(parents=True, exist_ok=True)
+    tables = {}
+    for model in DATASET_MODELS:
+        fields = dataset_fields(model)
+        rows = (
+            model._base_manager.order_by("pk")
+            .values_list(*[field.attname for field in fields])
+            .iterator(chunk_size=chunk_size)
+        )
+        pk_index = fields.index(model._meta.pk)
+        count, ids = 0, [None, None]
+        with gzip.open(table_path(path, model), "wt", encoding="utf-8") as file:
+            for row in rows:
+                file.write("\t".join(encode(value) for value in row) + "\n")
+                count += 1
+                ids = [ids[0] or row[pk_index], row[pk_index]]
+        tables[model._meta.label] = {
+            "table": model._meta.db_table,
+            "columns": [field.column for field in fields],
+            "rows": count,
+            # first and last primary key, for load tests picking rows
+            "ids": ids,
+        }
+
+    manifest = {"version": FORMAT_VERSION, "tables": tables, "meta": meta or {}}
+    (Path(path) / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def read_manifest(path):
+    manifest = json.loads((Path(path) / "manifest.json").read_text())
+    if manifest.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported dataset version {manifest.get('version')}")
+    return manifest
+
+
+def load_dataset(path, batch_size=5000):
+    """
+    Load the dataset under `path` into the (empty) dataset tables, keeping
+    primary keys, and move the id sequences past the loaded rows.
+    """
+    manifest = read_manifest(path)
+    non_empty = [
+        model._meta.label for model in DATASET_MODELS if model._base_manager.exists()
+    ]
+    if non_empty:
+        raise ValueError(f"Tables are not empty: {', '.join(non_empty)}")
+
+    with transaction.atomic():
+        for model in DATASET_MODELS:
+            columns = manifest["tables"][model._meta.label]["columns"]
+            with gzip.open(table_path(path, model), "rt", encoding="utf-8") as file:
+                if connection.vendor == "postgresql":
+                    copy_table(model, columns, file)
+                else:
+                    insert_table(model, columns, file, batch_size)
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), DATASET_MODELS):
+                cursor.execute(sql)
+    return manifest
+
+
+def copy_table(model, columns, file):
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {quote(model._meta.db_table)} "
+            f"({', '.join(quote(column) for column in columns)}) FROM STDIN",
+            file,
+        )
+
+
+def insert_table(model, columns, file, batch_size):
+    by_column = {field.column: field for field in dataset_fields(model)}
+    fields = [by_column[column] for column in columns]
+    batch = []
+    for line in file:
+        values = line.rstrip("\n").split("\t")
+        batch.append(
+            model(
+                **{
+                    field.attname: field.to_python(decode(value))
+                    for field, value in zip(fields, values)
+                }
+            )
+        )
+        if len(batch) == batch_size:
+            insert_raw(model, batch, fields)
+            batch = []
+    if batch:
+        insert_raw(model, batch, fields)
+
+
+def insert_raw(model, objs, fields):
+    # a raw insert, like loaddata's: auto_now fields keep the loaded values
+    # where bulk_create would stamp the current time over them
+    model._base_manager._insert(objs, fields=fields, raw=True)
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = "Compute the stored brief_content of posts that do not have one yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Posts updated per query"
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every post, not only the ones without brief_content",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = Post.objects.only("id", "content").order_by("id")
+        if not options["all"]:
+            queryset = queryset.filter(brief_content="")
+
+        updated = 0
+        last_id = 0
+        while True:
+            # keyset over id, so rows leaving the filter do not shift batches
+            batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            for post in batch:
+                post.brief_content = post.first_sentence()
+            Post.objects.bulk_update(batch, ["brief_content"])
+            updated += len(batch)
+            last_id = batch[-1].id
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated brief_content of {updated} posts.")
+        )
@@ -0,0 +1,94 @@
+import statistics
+import time
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import User
+from blog.api.v1.serializer import PostListSerializer, PostSerializer
+from blog.models import Category, Post
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare list serialization time of PostSerializer (model instances) "
+        "and PostListSerializer (`.values()` rows). Posts are generated inside "
+        "a transaction that is rolled back, so the database is left untouched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--posts", type=int, default=1000, help="Posts to serialize per run"
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per path")
+
+    def handle(self, *args, **options):
+        request = Request(APIRequestFactory().get("/blog/api/v1/post/"))
+        self.context = {"request": request, "view": SimpleNamespace(action="list")}
+
+        try:
+            with transaction.atomic():
+                self.create_posts(options["posts"])
+                self.report(
+                    "PostSerializer",
+                    lambda: list(Post.objects.for_action("list")),
+                    PostSerializer,
+                    options,
+                )
+                self.report(
+                    "PostListSerializer",
+                    lambda: list(Post.objects.list_rows()),
+                    PostListSerializer,
+                    options,
+                )
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def create_posts(self, count):
+        user = User.objects.create_user(
+            email="benchmark@serializers.local", password="Benchmark123!"
+        )
+        profile = user.profile
+        categories = [Category.objects.create(name=f"Bench {i}") for i in range(5)]
+        Post.objects.bulk_create(
+            Post(
+                title=f"Post {i}",
+                content=f"Sentence {i}. Another one!",
+                brief_content=f"Sentence {i}. ...",
+                author=profile,
+                status=True,
+                category=categories[i % len(categories)],
+                published_date=timezone.now(),
+            )
+            for i in range(count)
+        )
+
+    def report(self, label, fetch, serializer_class, options):
+        """
+        Print the median time to fetch the rows and to serialize them,
+        both scaled to 1,000 posts.
+        """
+        fetch_times, serialize_times = [], []
+        for _ in range(options["repeat"]):
+            started = time.perf_counter()
+            rows = fetch()
+            fetched = time.perf_counter()
+            serializer_class(rows, many=True, context=self.context).data
+            serialize_times.append(time.perf_counter() - fetched)
+            fetch_times.append(fetched - started)
+
+        scale = 1000 * 1000 / options["posts"]
+        self.stdout.write(
+            f"{label:<20} fetch {statistics.median(fetch_times) * scale:8.2f} ms"
+            f"  serialize {statistics.median(serialize_times) * scale:8.2f} ms"
+            "  per 1,000 posts"
+        )
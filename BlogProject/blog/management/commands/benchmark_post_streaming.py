@@ -0,0 +1,91 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import User
+from blog.api.v1.serializer import PostSerializer
+from blog.api.v1.streaming import StreamingJSONListResponse
+from blog.models import Category, Post
+
+BATCH_SIZE = 5000
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare peak Python memory of rendering the unpaginated post list "
+        "in one shot and as a stream. Posts are generated inside a "
+        "transaction that is rolled back, so the database is left untouched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--posts", type=int, default=100_000, help="Posts in the list"
+        )
+
+    def handle(self, *args, **options):
+        request = Request(APIRequestFactory().get("/blog/api/v1/post-list/"))
+        self.context = {"request": request}
+
+        try:
+            with transaction.atomic():
+                self.create_posts(options["posts"])
+                self.measure("rendered at once", self.render_at_once)
+                self.measure("streamed", self.render_streamed)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def create_posts(self, count):
+        user = User.objects.create_user(
+            email="benchmark@streaming.local", password="Benchmark123!"
+        )
+        category = Category.objects.create(name="Bench")
+        content = "A sentence of a realistic post body. " * 50
+        for start in range(0, count, BATCH_SIZE):
+            Post.objects.bulk_create(
+                Post(
+                    title=f"Post {i}",
+                    content=content,
+                    brief_content="A sentence of a realistic post body. ...",
+                    author=user.profile,
+                    status=True,
+                    category=category,
+                    published_date=timezone.now(),
+                )
+                for i in range(start, min(start + BATCH_SIZE, count))
+            )
+
+    def render_at_once(self):
+        """What the endpoints did before: serialize and render everything."""
+        posts = Post.objects.with_relations()
+        data = PostSerializer(posts, many=True, context=self.context).data
+        return len(JSONRenderer().render(data))
+
+    def render_streamed(self):
+        """Consume the stream chunk by chunk, as a WSGI server would."""
+        response = StreamingJSONListResponse(
+            Post.objects.with_relations(), PostSerializer(context=self.context)
+        )
+        return sum(len(chunk) for chunk in response.streaming_content)
+
+    def measure(self, label, render):
+        tracemalloc.start()
+        started = time.perf_counter()
+        size = render()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.stdout.write(
+            f"{label:<18} peak {peak / 2**20:8.1f} MiB"
+            f"  time {elapsed:7.2f} s  body {size / 2**20:8.1f} MiB"
+        )
@@ -0,0 +1,113 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from blog.api.v1.filters import PostSearchFilter
+from blog.api.v1.views import PostViewSet
+from blog.models import Post
+
+SEED = 52
+BATCH_SIZE = 5000
+VOCABULARY = (
+    "django python api database index query cache search vector rank "
+    "security docker cloud mobile testing middleware career design "
+    "performance scaling latency throughput backend frontend model view "
+    "serializer permission token session template migration signal"
+).split()
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare post search latency of the ILIKE SearchFilter and the "
+        "full-text PostSearchFilter. Posts are generated inside a transaction "
+        "that is rolled back, so the database is left untouched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[10_000, 100_000, 1_000_000],
+            help="Number of posts to benchmark with (default: 10k 100k 1M)",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Runs per search term"
+        )
+        parser.add_argument(
+            "--terms",
+            nargs="+",
+            default=["django", "latency", "docker security"],
+            help="Search terms to time",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{connection.vendor} has no full-text backend: "
+                    "both filters run the same ILIKE query."
+                )
+            )
+
+        self.random = random.Random(SEED)
+        self.view = PostViewSet()
+        self.factory = APIRequestFactory()
+
+        self.stdout.write(f"{'posts':>10} {'term':<20} {'ilike ms':>10} {'fts ms':>10}")
+        for size in options["sizes"]:
+            try:
+                with transaction.atomic():
+                    self.create_posts(size)
+                    for term in options["terms"]:
+                        ilike = self.time_filter(SearchFilter(), term, options)
+                        fts = self.time_filter(PostSearchFilter(), term, options)
+                        self.stdout.write(
+                            f"{size:>10} {term:<20} {ilike:>10.2f} {fts:>10.2f}"
+                        )
+                    raise _Rollback
+            except _Rollback:
+                pass
+
+    def create_posts(self, size):
+        for start in range(0, size, BATCH_SIZE):
+            Post.objects.bulk_create(
+                [
+                    Post(
+                        title=self.sentence(6),
+                        content=" ".join(self.sentence(15) for _ in range(8)),
+                        status=True,
+                    )
+                    for _ in range(min(BATCH_SIZE, size - start))
+                ]
+            )
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE blog_post")
+
+    def sentence(self, words):
+        return " ".join(self.random.choices(VOCABULARY, k=words)).capitalize() + "."
+
+    def time_filter(self, backend, term, options):
+        """
+        Return the median time, in milliseconds, to fetch the first
+        page of results for `term` through the given filter backend.
+        """
+        request = Request(self.factory.get("/", {"search": term}))
+        timings = []
+        for _ in range(options["repeat"]):
+            queryset = backend.filter_queryset(request, Post.objects.all(), self.view)
+            started = time.perf_counter()
+            list(queryset.values_list("id", flat=True)[:10])
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,88 @@
+from itertools import product
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import Profile
+from blog.api.v1.views import PostViewSet
+from blog.models import Category, Post
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN (ANALYZE on PostgreSQL) for every filter/ordering "
+        "combination PostViewSet allows and report the ones that still "
+        "sequentially scan blog_post. Run it against a realistically sized "
+        "table: on a few rows the planner prefers a sequential scan anyway."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full plan of every query",
+        )
+
+    def handle(self, *args, **options):
+        view = PostViewSet(action="list", format_kwarg=None)
+        factory = APIRequestFactory()
+        page_size = view.pagination_class.page_size
+
+        seq_scans = []
+        for params in self.get_combinations():
+            request = Request(factory.get("/", params))
+            view.request = request
+            queryset = view.filter_queryset(view.get_queryset())
+            plan = self.explain(queryset[:page_size])
+
+            label = "&".join(f"{k}={v}" for k, v in params.items()) or "(none)"
+            if self.is_seq_scan(plan):
+                seq_scans.append(label)
+                self.stdout.write(self.style.WARNING(f"SEQ SCAN  {label}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"index     {label}"))
+            if options["verbose_plans"]:
+                self.stdout.write(plan + "\n")
+
+        self.stdout.write(
+            f"{len(seq_scans)} combination(s) fall back to a sequential scan."
+        )
+
+    def get_combinations(self):
+        """
+        Yield query params for each filterset field (and none), crossed
+        with the default ordering and every allowed `ordering` value.
+        """
+        category = Category.objects.values_list("id", flat=True).first() or 1
+        author = Profile.objects.values_list("id", flat=True).first() or 1
+        filters = [
+            {},
+            {"status": "true"},
+            {"category": category},
+            {"category__in": f"{category},{category + 1}"},
+            {"author": author},
+        ]
+        orderings = [{}]
+        for field in PostViewSet.ordering_fields:
+            orderings += [{"ordering": field}, {"ordering": f"-{field}"}]
+
+        for query_filter, ordering in product(filters, orderings):
+            yield {**query_filter, **ordering}
+
+    def explain(self, queryset):
+        if connection.vendor == "postgresql":
+            return queryset.explain(analyze=True)
+        return queryset.explain()
+
+    def is_seq_scan(self, plan):
+        table = Post._meta.db_table
+        if connection.vendor == "postgresql":
+            return f"Seq Scan on {table}" in plan
+        # SQLite: "SCAN blog_post" without "USING ... INDEX" is a table scan
+        return any(
+            line.split("SCAN ", 1)[1].split()[0] == table and "INDEX" not in line
+            for line in plan.splitlines()
+            if "SCAN " in line
+        )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from blog.dataset import export_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Export users, profiles, categories and posts to a dataset directory "
+        "that load_dataset loads back with COPY (PostgreSQL) or bulk inserts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Dataset directory, created if missing")
+
+    def handle(self, *args, **options):
+        manifest = export_dataset(options["path"])
+        counts = ", ".join(
+            f"{table['rows']} {label}" for label, table in manifest["tables"].items()
+        )
+        self.stdout.write(self.style.SUCCESS(f"Exported {counts}."))
@@ -1,13 +1,37 @@
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
+from functools import partial
 from faker import Faker
-from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from django.utils import timezone
 
 from accounts.models import Profile, User
+from blog.dataset import export_dataset
 from blog.models import Category, Post
+from blog.seeding import PUBLISHED_RATIO, generate_posts, generate_profiles
+from blog.services import invalidate_posts_cache
 
 SEED = 52
 USER_COUNT = 10
+CATEGORY_NAMES = [
+    "Tech",
+    "Programming",
+    "Security",
+    "AI",
+    "WebDev",
+    "Data",
+    "Cloud",
+    "Mobile",
+    "OpenSource",
+    "Career",
+]
+SEED_PASSWORD = "TestPass123!"
 
 class Command(BaseCommand):
     help = "Insert test data (users, profiles, categories, posts) into database"
@@ -17,18 +41,66 @@ class Command(BaseCommand):
         self.fake = Faker()
         self.fake.seed_instance(SEED)  # deterministic per command run
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            help="Seed this many users (seed<i>@example.com) in bulk instead "
+            "of the small sample data set",
+        )
+        parser.add_argument(
+            "--posts",
+            type=int,
+            help="Add this many generated posts, spread over the seeded users",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="Rows per INSERT"
+        )
+        parser.add_argument(
+            "--seed", type=int, default=SEED, help="Seed of the generated data"
+        )
+        parser.add_argument(
+            "--author-skew",
+            type=float,
+            default=1.1,
+            help="Zipf exponent of posts per author (0: uniform)",
+        )
+        parser.add_argument(
+            "--category-skew",
+            type=float,
+            default=1.0,
+            help="Zipf exponent of posts per category (0: uniform)",
+        )
+        parser.add_argument(
+            "--published-ratio",
+            type=float,
+            default=PUBLISHED_RATIO,
+            help="Share of published posts",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Processes generating fake content (0: generate inline)",
+        )
+        parser.add_argument(
+            "--export",
+            metavar="PATH",
+            help="Then export the database as a dataset (see load_dataset)",
+        )
+
     def handle(self, *args, **options):
+        if options["users"] is None and options["posts"] is None:
+            self.insert_sample()
+        else:
+            self.insert_bulk(options)
+
+    def insert_sample(self):
         # =======================
         # Users
         # =======================
 
         user_emails=[self.fake.unique.safe_email() for _ in range(USER_COUNT)]
-        users = []
-        for email in user_emails:
-            user = User.objects.filter(email=email).first()
-            if not user:
-                user = User.objects.create_user(email=email, password="TestPass123!")
-            users.append(user)
 
         # clear Faker unique cache (good practice in long runs)
         self.fake.unique.clear()
@@ -48,35 +120,54 @@ class Command(BaseCommand):
             "Technical writer who simplifies complex engineering topics for developers.",
             "Startup CTO with experience in leading engineering teams and system architecture.",
         ]
+        profile_fields = {
+            email: {
+                "first_name": self.fake.first_name(),
+                "last_name": self.fake.last_name(),
+                "description": desc,
+            }
+            for email, desc in zip(user_emails, descriptions)
+        }
 
+        existing = {
+            user.email: user
+            for user in User.objects.filter(email__in=user_emails).select_related(
+                "profile"
+            )
+        }
+        # seed accounts share one password: hash it once, not once per user
+        password = make_password(SEED_PASSWORD)
+        new_emails = [email for email in user_emails if email not in existing]
+        User.objects.bulk_create_with_profiles(
+            [User(email=email, password=password) for email in new_emails],
+            [profile_fields[email] for email in new_emails],
+        )
 
-        profiles = []
-        for user, desc in zip(users, descriptions):
-            profile, _ = Profile.objects.get_or_create(user=user)
-            profile.first_name = self.fake.first_name()
-            profile.last_name = self.fake.last_name()
-            profile.description = desc
-            profile.save()
-            profiles.append(profile)
+        # bring existing profiles back to the seeded values
+        existing_profiles = []
+        for email, user in existing.items():
+            profile = user.profile
+            for field, value in profile_fields[email].items():
+                setattr(profile, field, value)
+            existing_profiles.append(profile)
+        Profile.objects.bulk_update(
+            existing_profiles, ["first_name", "last_name", "description"]
+        )
+
+        profiles_by_email = {
+            profile.user.email: profile
+            for profile in Profile.objects.filter(
+                user__email__in=user_emails
+            ).select_related("user")
+        }
+        profiles = [profiles_by_email[email] for email in user_emails]
+        users = [profile.user for profile in profiles]
 
         # =======================
         # Categories (<= 20 chars)
         # =======================
-        category_names = [
-            "Tech",
-            "Programming",
-            "Security",
-            "AI",
-            "WebDev",
-            "Data",
-            "Cloud",
-            "Mobile",
-            "OpenSource",
-            "Career",
-        ]
-
         categories = []
-        for name in category_names:
+        for name in CATEGORY_NAMES:
             category, _ = Category.objects.get_or_create(name=name)
             categories.append(category)
 
@@ -174,3 +265,152 @@ class Command(BaseCommand):
             f"Users: {len(users)} | Profiles: {len(profiles)} | "
             f"Categories: {len(categories)} | New posts: {created_count}"
         )
+
+    # =======================
+    # High-volume seeding
+    # =======================
+
+    def insert_bulk(self, options):
+        self.options = options
+        self.batch_size = options["batch_size"]
+        self.workers = workers = options["workers"]
+        executor = None
+        if workers > 0:
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        try:
+            self.executor = executor
+            if options["users"]:
+                self.timed("users", self.seed_users, options["users"])
+            if options["posts"]:
+                self.timed("posts", self.seed_posts, options["posts"])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        # bulk_create sends no signals
+        invalidate_posts_cache()
+        if options["export"]:
+            meta = {
+                key: options[key]
+                for key in (
+                    "users",
+                    "posts",
+                    "seed",
+                    "author_skew",
+                    "category_skew",
+                    "published_ratio",
+                )
+            }
+            export_dataset(options["export"], meta)
+            self.stdout.write(self.style.SUCCESS(f"Exported to {options['export']}"))
+
+    def timed(self, label, seed, count):
+        started = time.perf_counter()
+        created = seed(count)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{created} {label} in {elapsed:.1f} s "
+                f"({created / max(elapsed, 1e-9):,.0f} rows/s)"
+            )
+        )
+
+    def generated_chunks(self, generate, count):
+        """
+        Yield (chunk, rows) for `count` rows in chunks of batch_size,
+        generated in the worker processes. Only a few chunks are in flight,
+        so memory stays flat while the database is the bottleneck.
+        """
+        sizes = [
+            min(self.batch_size, count - start)
+            for start in range(0, count, self.batch_size)
+        ]
+        if self.executor is None:
+            for chunk, size in enumerate(sizes):
+                yield chunk, generate(self.options["seed"], chunk, size)
+            return
+
+        pending = deque()
+        window = 2 * self.workers
+        for chunk, size in enumerate(sizes):
+            future = self.executor.submit(generate, self.options["seed"], chunk, size)
+            pending.append((chunk, future))
+            if len(pending) >= window:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+        for chunk, future in pending:
+            yield chunk, future.result()
+
+    def seed_users(self, count):
+        # one hash shared by every seeded account, not one PBKDF2 per user
+        password = make_password(SEED_PASSWORD)
+        created = 0
+        for chunk, rows in self.generated_chunks(generate_profiles, count):
+            start = chunk * self.batch_size
+            emails = [f"seed{start + i}@example.com" for i in range(len(rows))]
+            existing = set(
+                User.objects.filter(email__in=emails).values_list("email", flat=True)
+            )
+            new = [
+                (email, row)
+                for email, row in zip(emails, rows)
+                if email not in existing
+            ]
+            # verified, so load tests can log in with them
+            User.objects.bulk_create_with_profiles(
+                [
+                    User(email=email, password=password, is_verified=True)
+                    for email, _ in new
+                ],
+                [
+                    {"first_name": first, "last_name": last, "description": text}
+                    for _, (first, last, text) in new
+                ],
+                batch_size=self.batch_size,
+            )
+            created += len(new)
+        return created
+
+    def seed_posts(self, count):
+        author_ids = list(
+            Profile.objects.filter(user__email__startswith="seed")
+            .order_by("id")
+            .values_list("id", flat=True)
+        ) or list(Profile.objects.order_by("id").values_list("id", flat=True))
+        if not author_ids:
+            raise CommandError("No users to write the posts: seed --users first")
+
+        category_ids = []
+        for name in CATEGORY_NAMES:
+            category, _ = Category.objects.get_or_create(name=name)
+            category_ids.append(category.id)
+
+        generate = partial(
+            generate_posts,
+            authors=len(author_ids),
+            categories=len(category_ids),
+            author_skew=self.options["author_skew"],
+            category_skew=self.options["category_skew"],
+            published_ratio=self.options["published_ratio"],
+        )
+        now = timezone.now()
+        created = 0
+        for _, rows in self.generated_chunks(generate, count):
+            posts = []
+            for title, content, status, age, author, category in rows:
+                post = Post(
+                    title=title,
+                    content=content,
+                    status=status,
+                    author_id=author_ids[author],
+                    category_id=category_ids[category],
+                    published_date=now - timedelta(days=age),
+                )
+                # bulk_create does not go through save()
+                post.brief_content = post.first_sentence()
+                posts.append(post)
+            with transaction.atomic():
+                Post.objects.bulk_create(posts, batch_size=self.batch_size)
+            created += len(posts)
+        return created
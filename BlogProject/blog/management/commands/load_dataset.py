@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.dataset import load_dataset
+from blog.services import invalidate_category_map, invalidate_posts_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a dataset written by export_dataset (or insert_data --export) "
+        "into empty tables, keeping its primary keys"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Dataset directory")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows per INSERT when the database has no COPY",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            manifest = load_dataset(options["path"], options["batch_size"])
+        except (OSError, ValueError) as exc:
+            raise CommandError(exc)
+        # rows were loaded without signals
+        invalidate_posts_cache()
+        invalidate_category_map()
+
+        counts = ", ".join(
+            f"{table['rows']} {label}" for label, table in manifest["tables"].items()
+        )
+        self.stdout.write(self.style.SUCCESS(f"Loaded {counts}."))
@@ -0,0 +1,62 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import migrations
+
+# title matches rank above content matches
+CREATE_TRIGGER = """
+CREATE FUNCTION blog_post_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER blog_post_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, content ON blog_post
+FOR EACH ROW EXECUTE FUNCTION blog_post_search_vector_update();
+
+UPDATE blog_post SET search_vector =
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(content, '')), 'B');
+
+CREATE INDEX blog_post_search_vector_gin
+ON blog_post USING gin (search_vector);
+"""
+
+DROP_TRIGGER = """
+DROP INDEX IF EXISTS blog_post_search_vector_gin;
+DROP TRIGGER IF EXISTS blog_post_search_vector_trigger ON blog_post;
+DROP FUNCTION IF EXISTS blog_post_search_vector_update();
+"""
+
+
+def postgres_only(sql):
+    """
+    Run raw SQL on PostgreSQL only; other databases (SQLite test runs)
+    keep the plain column and search through the ILIKE fallback.
+    """
+
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0002_alter_post_author"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            postgres_only(CREATE_TRIGGER), postgres_only(DROP_TRIGGER)
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_user_is_verified"),
+        ("blog", "0003_post_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["-created_date", "-id"], name="blog_post_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["status", "-created_date"], name="blog_post_status_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["category", "-created_date"],
+                name="blog_post_category_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["author", "-created_date"], name="blog_post_author_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["published_date"], name="blog_post_published_idx"
+            ),
+        ),
+    ]
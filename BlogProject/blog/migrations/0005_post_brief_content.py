@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0004_post_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="brief_content",
+            field=models.CharField(blank=True, editable=False, max_length=260),
+        ),
+    ]
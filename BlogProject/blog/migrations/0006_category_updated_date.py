@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0005_post_brief_content"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="updated_date",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -1,5 +1,6 @@
 import re
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
 
@@ -11,14 +12,83 @@ from accounts.models import Profile
 
 class Category(models.Model):
     name = models.CharField(max_length=20)
+    updated_date = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
 
 
+class PostQuerySet(models.QuerySet):
+    """
+    Relation-aware querysets for posts, shared by every API view that
+    renders PostSerializer so author/category never cost a query per row.
+    """
+
+    def with_relations(self):
+        return self.select_related("author", "category").defer(
+            *Post.UNSERIALIZED_FIELDS
+        )
+
+    def list_rows(self):
+        """
+        Return plain dict rows holding just what the list representation
+        shows (see PostListSerializer), with author/category joined in.
+        """
+        return self.values(*Post.LIST_VALUES)
+
+    def for_action(self, action=None):
+        """
+        Return the queryset a view needs for the given DRF action.
+        List actions do not render `content`, so it can be deferred there.
+        """
+        queryset = self.with_relations()
+        if action == "list":
+            queryset = queryset.defer(*Post.LIST_DEFERRED_FIELDS)
+        return queryset
+
+
 class Post(models.Model):
     class Meta:
         ordering = ["-created_date"]
+        # one index per filter the API exposes, each carrying the default
+        # ordering so a filtered page is read in index order
+        indexes = [
+            models.Index(fields=["-created_date", "-id"], name="blog_post_created_idx"),
+            models.Index(
+                fields=["status", "-created_date"], name="blog_post_status_created_idx"
+            ),
+            models.Index(
+                fields=["category", "-created_date"],
+                name="blog_post_category_created_idx",
+            ),
+            models.Index(
+                fields=["author", "-created_date"], name="blog_post_author_created_idx"
+            ),
+            models.Index(fields=["published_date"], name="blog_post_published_idx"),
+        ]
+
+    # columns the list representation never reads
+    # (it shows the stored `brief_content` instead of `content`)
+    LIST_DEFERRED_FIELDS = ("updated_date", "content")
+    # columns read by the dict-based list representation
+    LIST_VALUES = (
+        "id",
+        "author_id",
+        "author__first_name",
+        "author__last_name",
+        "title",
+        "brief_content",
+        "image",
+        "status",
+        "category_id",
+        "category__name",
+        "published_date",
+        "created_date",
+    )
+    # columns no representation reads at all
+    UNSERIALIZED_FIELDS = ("search_vector",)
+
+    objects = PostQuerySet.as_manager()
 
     author = models.ForeignKey(
         Profile,
@@ -41,12 +111,37 @@ class Post(models.Model):
     created_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
 
+    # weighted title/content tsvector, kept up to date by a database
+    # trigger on PostgreSQL (see migration 0003); unused elsewhere
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # first sentence of `content`, refreshed by save()
+    brief_content = models.CharField(max_length=260, blank=True, editable=False)
+
+    # the first sentence is looked for in this many leading characters only
+    BRIEF_SCAN_LIMIT = 255
+    # sentence ends: . ! or ؟ followed by whitespace
+    SENTENCE_END = re.compile(r"[.!؟]\s")
+
     def first_sentence(self):
         if not self.content:
             return ""
-        # Finding the first sentence based on . or ! or ?
-        match = re.split(r"(?<=[.!؟])\s+", self.content.strip())
-        return f"{match[0]} ..." if match else ""
+        # Finding the first sentence based on . or ! or ? within the
+        # leading characters only, instead of splitting the whole body
+        text = self.content[: 2 * self.BRIEF_SCAN_LIMIT].lstrip()
+        text = text[: self.BRIEF_SCAN_LIMIT + 1]
+        match = self.SENTENCE_END.search(text)
+        sentence = text[: match.start() + 1] if match else text.rstrip()
+        return f"{sentence[: self.BRIEF_SCAN_LIMIT]} ..."
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        content_loaded = "content" not in self.get_deferred_fields()
+        if content_loaded and (update_fields is None or "content" in update_fields):
+            self.brief_content = self.first_sentence()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "brief_content"}
+        super().save(*args, **kwargs)
 
     def get_absolute_api_url(self):
         return reverse("blog:api-v1:post-detail", kwargs={"pk": self.pk})
@@ -0,0 +1,100 @@
+"""
+Fake data for seeding large databases (see the insert_data command).
+
+The generators only use Faker, not Django, so they can run in worker
+processes. Each chunk is generated from its own seed, which makes the
+output the same whatever the number of workers.
+"""
+
+from itertools import accumulate
+
+from faker import Faker
+
+# share of generated posts that are published
+PUBLISHED_RATIO = 0.9
+# published dates spread over this many days back from now
+MAX_AGE_DAYS = 730
+# post body length in characters: log-normal around the median, so most
+# posts are a few paragraphs and a long tail reaches the maximum
+CONTENT_MEDIAN_LENGTH = 1500
+CONTENT_LENGTH_SIGMA = 1.2
+CONTENT_MIN_LENGTH = 80
+CONTENT_MAX_LENGTH = 50_000
+
+
+def chunk_faker(seed, chunk):
+    fake = Faker()
+    fake.seed_instance(seed * 1_000_003 + chunk)
+    return fake
+
+
+def generate_profiles(seed, chunk, count):
+    """Return `count` (first_name, last_name, description) tuples."""
+    fake = chunk_faker(seed, chunk)
+    return [
+        (fake.first_name(), fake.last_name(), fake.sentence(nb_words=12))
+        for _ in range(count)
+    ]
+
+
+def zipf_cum_weights(count, skew):
+    """
+    Cumulative weights of ranks 1..count under Zipf's law with exponent
+    `skew`: rank k is drawn in proportion to 1 / k**skew (0 is uniform).
+    """
+    return list(accumulate(1 / rank**skew for rank in range(1, count + 1)))
+
+
+def generate_posts(
+    seed,
+    chunk,
+    count,
+    authors=1,
+    categories=1,
+    author_skew=0.0,
+    category_skew=0.0,
+    published_ratio=PUBLISHED_RATIO,
+):
+    """
+    Return `count` (title, content, status, age_in_days, author, category)
+    tuples. `author` and `category` are indexes below `authors` and
+    `categories`, drawn from Zipf distributions: with a skew around 1 a
+    few authors write most posts and a few categories are hot.
+    """
+    fake = chunk_faker(seed, chunk)
+    rng = fake.random
+    # Faker text is slow: draw the posts from a per-chunk pool of sentences
+    sentences = [fake.sentence(nb_words=rng.randint(6, 18)) for _ in range(512)]
+    titles = [fake.sentence(nb_words=6).rstrip(".") for _ in range(512)]
+
+    def paragraph():
+        return " ".join(rng.choices(sentences, k=rng.randint(3, 7)))
+
+    def content():
+        length = rng.lognormvariate(0, CONTENT_LENGTH_SIGMA) * CONTENT_MEDIAN_LENGTH
+        length = min(max(int(length), CONTENT_MIN_LENGTH), CONTENT_MAX_LENGTH)
+        paragraphs, size = [], 0
+        while size < length:
+            paragraphs.append(paragraph())
+            size += len(paragraphs[-1]) + 2
+        return "\n\n".join(paragraphs)[:length]
+
+    author_indexes = rng.choices(
+        range(authors), cum_weights=zipf_cum_weights(authors, author_skew), k=count
+    )
+    category_indexes = rng.choices(
+        range(categories),
+        cum_weights=zipf_cum_weights(categories, category_skew),
+        k=count,
+    )
+    return [
+        (
+            rng.choice(titles),
+            content(),
+            rng.random() < published_ratio,
+            rng.randint(0, MAX_AGE_DAYS),
+            author,
+            category,
+        )
+        for author, category in zip(author_indexes, category_indexes)
+    ]
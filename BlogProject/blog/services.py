@@ -0,0 +1,204 @@
+import hashlib
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count, Max
+from django.utils.cache import quote_etag
+from django.utils.http import urlencode
+
+from .models import Category
+
+POSTS_CACHE_VERSION_KEY = "blog:posts:version"
+CATEGORIES_VERSION_KEY = "blog:categories:version"
+
+# process-level map of every category, replaced as a whole when the
+# shared categories version moves (see get_category_map)
+_category_map = {"version": None}
+
+
+def new_cache_version():
+    # random rather than a counter, so a flushed cache never brings
+    # back a version that older entries were stored under
+    return uuid4().hex[:12]
+
+
+def get_posts_cache_version():
+    """
+    Return the current generation of cached post data (counts, responses).
+    Every cache key built from post data embeds it.
+    """
+    return cache.get_or_set(POSTS_CACHE_VERSION_KEY, new_cache_version, timeout=None)
+
+
+def invalidate_posts_cache():
+    """
+    Drop every cached post count and response at once by moving to a new
+    generation; stale entries are never read again and expire with their TTL.
+    """
+    cache.set(POSTS_CACHE_VERSION_KEY, new_cache_version(), timeout=None)
+
+
+def get_category_map(reload=False):
+    """
+    Return {"by_id": {id: category}, "by_name": {name: [categories]}} for
+    all categories, kept in process memory. Categories are few and rarely
+    written, so the map is reloaded only after a Category write in any
+    process has bumped the categories version in the shared cache, or
+    when `reload` is set.
+    """
+    global _category_map
+
+    version = cache.get_or_set(CATEGORIES_VERSION_KEY, new_cache_version, timeout=None)
+    if reload or _category_map["version"] != version:
+        by_id, by_name = {}, {}
+        for category in Category.objects.order_by("id"):
+            by_id[category.id] = category
+            by_name.setdefault(category.name, []).append(category)
+        _category_map = {"version": version, "by_id": by_id, "by_name": by_name}
+    return _category_map
+
+
+def invalidate_category_map():
+    """Force every process to reload its category map on next use."""
+    global _category_map
+
+    _category_map = {"version": None}
+    cache.set(CATEGORIES_VERSION_KEY, new_cache_version(), timeout=None)
+
+
+def cache_key_digest(value):
+    """
+    Return a fixed-length digest of free-form key parts (URLs, search
+    terms), keeping keys short and safe for backends such as memcached.
+    """
+    return hashlib.md5(value.encode(), usedforsecurity=False).hexdigest()
+
+
+def normalize_post_filters(query_params, keys):
+    """
+    Return a stable, hashable form of the filters that change a count,
+    so `?author=1&status=true` and `?status=true&author=1` share an entry.
+    """
+    normalized = []
+    for key in sorted(keys):
+        values = []
+        for value in query_params.getlist(key):
+            # `__in` lookups take comma separated values in any order
+            values.extend(sorted(v.strip() for v in value.split(",")))
+        if values:
+            normalized.append(f"{key}={','.join(values)}")
+    return "&".join(normalized)
+
+
+def estimate_post_count(queryset):
+    """
+    Return the PostgreSQL planner's row estimate for the queryset,
+    or None when the database cannot provide one.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_posts(queryset, filters=""):
+    """
+    Return (count, exact) for a filtered post queryset.
+
+    Counts are cached per normalized filter set for POST_COUNT_CACHE_TIMEOUT
+    seconds. When POST_COUNT_ESTIMATE_THRESHOLD is set and the planner
+    expects more rows than that, its estimate is returned instead of
+    running an exact COUNT.
+    """
+    key = f"blog:post-count:{get_posts_cache_version()}:{cache_key_digest(filters)}"
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    count, exact = None, True
+    threshold = settings.POST_COUNT_ESTIMATE_THRESHOLD
+    if threshold:
+        estimate = estimate_post_count(queryset)
+        if estimate is not None and estimate > threshold:
+            count, exact = estimate, False
+    if count is None:
+        count = queryset.count()
+
+    cache.set(key, (count, exact), settings.POST_COUNT_CACHE_TIMEOUT)
+    return count, exact
+
+
+def post_response_cache_key(request, action):
+    """
+    Return the cache key of a post read response.
+
+    The key covers the absolute URL with sorted query params (responses
+    embed absolute links), the negotiated format and whether the client is
+    authenticated; it must not depend on which user is logged in.
+    """
+    params = sorted(
+        (key, value) for key, values in request.query_params.lists() for value in values
+    )
+    audience = "auth" if request.user.is_authenticated else "anon"
+    url = f"{request.build_absolute_uri(request.path)}?{urlencode(params)}"
+    return ":".join(
+        [
+            "blog:post-response",
+            str(get_posts_cache_version()),
+            action,
+            audience,
+            str(request.accepted_renderer.format),
+            cache_key_digest(url),
+        ]
+    )
+
+
+def get_etag(model, pk=None):
+    """
+    Return the ETag describing the current state of a `model` list
+    (pk=None) or of one row, or None when the row does not exist.
+
+    Lists use max(updated_date) and the row count, details the row's
+    updated_date; the posts cache version is mixed in so writes to related
+    models (a renamed category, an author's profile) and deletes count too.
+    No Last-Modified is derived: updated_date misses those writes and has
+    a one second resolution, so If-Modified-Since alone could get a 304
+    for stale data. The ETag is cached for the current version, so only
+    the first request after a write pays for the query.
+    """
+    version = get_posts_cache_version()
+    key = f"blog:etag:{version}:{model._meta.label_lower}:{pk or ''}"
+    etag = cache.get(key)
+    if etag is not None:
+        return etag or None
+
+    if pk is None:
+        state = model.objects.order_by().aggregate(
+            last_modified=Max("updated_date"), count=Count("pk")
+        )
+        parts = [state["count"], state["last_modified"]]
+    else:
+        try:
+            last_modified = (
+                model.objects.filter(pk=pk)
+                .values_list("updated_date", flat=True)
+                .first()
+            )
+        except (TypeError, ValueError):
+            # malformed pk: let the view answer with its usual 404
+            last_modified = None
+        parts = [pk, last_modified]
+
+    if pk is not None and parts[-1] is None:
+        etag = ""
+    else:
+        digest = cache_key_digest(":".join(str(part) for part in [version, *parts]))
+        etag = quote_etag(digest)
+    cache.set(key, etag, settings.POST_RESPONSE_CACHE_TIMEOUT)
+    return etag or None
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import Profile
+
+from .models import Category, Post
+from .services import invalidate_category_map, invalidate_posts_cache
+
+
+# every model rendered in a post representation invalidates cached posts
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_cached_posts(sender, **kwargs):
+    invalidate_posts_cache()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_cached_categories(sender, **kwargs):
+    invalidate_category_map()
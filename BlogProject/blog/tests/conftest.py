@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.test import APIClient
 
@@ -16,6 +17,12 @@ def api_client():
     return APIClient()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache (cached post counts etc.)."""
+    cache.clear()
+
+
 @pytest.fixture
 def user(db):
     """Create a regular user."""
@@ -76,3 +83,31 @@ def post(db, profile, category):
         category=category,
         published_date=timezone.now(),
     )
+
+
+@pytest.fixture
+def make_posts(profile, other_profile):
+    """
+    Return a factory creating `count` posts spread over
+    two authors and two categories.
+    """
+
+    def _make_posts(count):
+        categories = [
+            Category.objects.create(name="Cat A"),
+            Category.objects.create(name="Cat B"),
+        ]
+        authors = [profile, other_profile]
+        return [
+            Post.objects.create(
+                title=f"Post {i}",
+                content=f"Sentence {i}. Another one!",
+                author=authors[i % 2],
+                status=True,
+                category=categories[i % 2],
+                published_date=timezone.now(),
+            )
+            for i in range(count)
+        ]
+
+    return _make_posts
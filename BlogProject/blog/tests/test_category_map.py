@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from blog.api.v1.serializer import CategorySerializer
+from blog.models import Category
+
+# ============================================================
+# Category Map / Representation Memo Tests
+# ============================================================
+
+
+@pytest.mark.django_db
+class TestCategoryRepresentation:
+    """
+    Tests for category handling inside PostSerializer.
+    """
+
+    url = reverse("blog:api-v1:post-list")
+
+    def test_each_category_is_serialized_once_per_page(
+        self, api_client, make_posts, monkeypatch
+    ):
+        """A streamed list in two categories builds two representations."""
+        calls = []
+        to_representation = CategorySerializer.to_representation
+
+        def counting(serializer, instance):
+            calls.append(instance.id)
+            return to_representation(serializer, instance)
+
+        monkeypatch.setattr(CategorySerializer, "to_representation", counting)
+        make_posts(6)
+
+        response = api_client.get(reverse("blog:api-v1:post_list_fbv"))
+
+        assert len(json.loads(b"".join(response.streaming_content))) == 6
+        assert len(calls) == len(set(calls)) == 2
+
+    def test_write_resolves_category_without_query(
+        self, api_client, user, category, django_assert_num_queries
+    ):
+        """Once the category map is loaded, writes do not look categories up."""
+        api_client.force_authenticate(user=user)
+        data = {
+            "title": "New post",
+            "content": "Hello.",
+            "category": category.name,
+            "published_date": timezone.now(),
+        }
+        api_client.post(self.url, data, format="json")
+
+        # only the INSERT: the author's profile comes with the user
+        with django_assert_num_queries(1):
+            response = api_client.post(self.url, data, format="json")
+
+        assert response.status_code == 201
+
+    def test_category_map_follows_category_writes(self, api_client, user, category):
+        """A renamed category is resolvable by its new name right away."""
+        api_client.force_authenticate(user=user)
+        api_client.post(self.url, {"title": "a", "content": "b.", "category": "x"})
+
+        category.name = "Renamed"
+        category.save()
+        response = api_client.post(
+            self.url,
+            {"title": "New", "content": "Body.", "category": "Renamed"},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert response.data["category"]["id"] == category.id
+
+    def test_category_missing_from_map_is_reloaded(self, api_client, user, category):
+        """
+        A category this process has not heard of (written by another one
+        before the version change arrived) is looked up before a 400.
+        """
+        api_client.force_authenticate(user=user)
+        api_client.post(self.url, {"title": "a", "content": "b.", "category": "x"})
+        # bulk_create sends no signal, so the map version stays the same
+        (created,) = Category.objects.bulk_create([Category(name="Elsewhere")])
+
+        response = api_client.post(
+            self.url,
+            {"title": "New", "content": "Body.", "category": "Elsewhere"},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert response.data["category"]["id"] == created.id
+
+    def test_ambiguous_category_name_returns_400(self, api_client, user, category):
+        """Two categories with the same name are rejected, not a server error."""
+        api_client.force_authenticate(user=user)
+        Category.objects.create(name=category.name)
+
+        response = api_client.post(
+            self.url,
+            {"title": "New", "content": "Body.", "category": category.name},
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert "category" in response.data
@@ -0,0 +1,123 @@
+import pytest
+from django.urls import reverse
+
+# ============================================================
+# Conditional GET Tests (ETag)
+# ============================================================
+
+POST_LIST_URLS = [
+    "post-list",
+    "post_list_fbv",
+    "post_list_api_view",
+    "post_list_gen_api_view",
+]
+POST_DETAIL_URLS = [
+    ("post-detail", "pk"),
+    ("post_detail_fbv", "id"),
+    ("post_detail_api_view", "id"),
+    ("post_detail_gen_api_view", "id"),
+]
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """
+    Tests for the ETag validators on the blog read endpoints.
+    """
+
+    @pytest.mark.parametrize("url_name", POST_LIST_URLS)
+    def test_post_lists_answer_304_for_matching_etag(
+        self, api_client, post, url_name, django_assert_num_queries
+    ):
+        """A list polled with its ETag is not re-sent."""
+        url = reverse(f"blog:api-v1:{url_name}")
+        first = api_client.get(url)
+        assert first.status_code == 200
+
+        # ETags are cached, so the 304 runs no query at all
+        with django_assert_num_queries(0):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=first.headers["ETag"])
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @pytest.mark.parametrize("url_name,kwarg", POST_DETAIL_URLS)
+    def test_post_details_answer_304_for_matching_etag(
+        self, api_client, post, url_name, kwarg
+    ):
+        """A detail polled with its ETag is not re-sent."""
+        url = reverse(f"blog:api-v1:{url_name}", kwargs={kwarg: post.id})
+        etag = api_client.get(url).headers["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    @pytest.mark.parametrize("url_name", ["post-list", "post-detail"])
+    def test_if_modified_since_alone_gets_full_payload(
+        self, api_client, post, url_name
+    ):
+        """
+        No Last-Modified is sent: updated_date misses deletes and related
+        writes, so a client sending only If-Modified-Since gets a 200.
+        """
+        kwargs = {"pk": post.id} if url_name == "post-detail" else {}
+        url = reverse(f"blog:api-v1:{url_name}", kwargs=kwargs)
+        assert "Last-Modified" not in api_client.get(url).headers
+
+        response = api_client.get(
+            url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+        )
+
+        assert response.status_code == 200
+
+    def test_post_write_changes_etag(self, api_client, post):
+        """After a write the old ETag gets the full payload again."""
+        url = reverse("blog:api-v1:post-list")
+        etag = api_client.get(url).headers["ETag"]
+
+        post.title = "Changed"
+        post.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_category_rename_changes_post_etag(self, api_client, post):
+        """Related writes that do not touch the post still invalidate it."""
+        url = reverse("blog:api-v1:post-detail", kwargs={"pk": post.id})
+        etag = api_client.get(url).headers["ETag"]
+
+        post.category.name = "Renamed"
+        post.category.save()
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_category_endpoints_answer_304(self, api_client, user, category):
+        """CategoryViewSet list and detail emit ETags as well."""
+        api_client.force_authenticate(user=user)
+        for url in [
+            reverse("blog:api-v1:category-list"),
+            reverse("blog:api-v1:category-detail", kwargs={"pk": category.id}),
+        ]:
+            etag = api_client.get(url).headers["ETag"]
+
+            assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    def test_permissions_run_before_304(self, api_client, user, category):
+        """An anonymous client cannot probe categories through ETags."""
+        api_client.force_authenticate(user=user)
+        url = reverse("blog:api-v1:category-list")
+        etag = api_client.get(url).headers["ETag"]
+        api_client.force_authenticate(user=None)
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 401
+
+    def test_missing_post_is_still_404(self, api_client, post):
+        """No ETag exists for a missing row; the view answers 404."""
+        url = reverse("blog:api-v1:post-detail", kwargs={"pk": post.id + 100})
+
+        response = api_client.get(url)
+
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
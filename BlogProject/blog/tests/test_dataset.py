@@ -0,0 +1,97 @@
+import json
+from collections import Counter
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from accounts.models import Profile, User
+from blog.dataset import decode, encode
+from blog.models import Category, Post
+from blog.seeding import CONTENT_MAX_LENGTH, CONTENT_MIN_LENGTH, generate_posts
+
+
+def snapshot():
+    return {
+        model: list(model.objects.order_by("pk").values())
+        for model in (User, Profile, Category, Post)
+    }
+
+
+def clear_tables():
+    Post.objects.all().delete()
+    Category.objects.all().delete()
+    User.objects.all().delete()
+
+
+class TestGeneratedPosts:
+    def test_same_seed_same_posts(self):
+        assert generate_posts(3, 0, 50, 5, 5) == generate_posts(3, 0, 50, 5, 5)
+        assert generate_posts(3, 0, 50) != generate_posts(4, 0, 50)
+
+    def test_skewed_authors_and_categories(self):
+        posts = generate_posts(1, 0, 2000, 50, 10, 1.1, 1.0, published_ratio=0.7)
+
+        authors = Counter(post[4] for post in posts)
+        categories = Counter(post[5] for post in posts)
+        assert authors.most_common(1)[0][0] == 0
+        # the top 10% of authors write most of the posts
+        assert sum(authors[i] for i in range(5)) > len(posts) / 2
+        assert categories[0] > 2 * categories[9]
+        assert 0.65 < sum(post[2] for post in posts) / len(posts) < 0.75
+
+    def test_content_lengths_are_spread(self):
+        lengths = [len(post[1]) for post in generate_posts(1, 0, 2000)]
+
+        assert min(lengths) >= CONTENT_MIN_LENGTH
+        assert max(lengths) <= CONTENT_MAX_LENGTH
+        assert max(lengths) > 10 * sorted(lengths)[len(lengths) // 2]
+
+
+class TestCopyFormat:
+    @pytest.mark.parametrize("value", ["plain", "tab\there", "a\\N", "x\r\ny\\", ""])
+    def test_round_trip(self, value):
+        assert decode(encode(value)) == value
+
+    def test_null(self):
+        assert encode(None) == "\\N"
+        assert decode("\\N") is None
+
+
+@pytest.mark.django_db
+class TestDatasetExport:
+    def test_export_and_load_round_trip(self, tmp_path):
+        call_command(
+            "insert_data",
+            users=4,
+            posts=30,
+            workers=0,
+            export=tmp_path,
+            stdout=StringIO(),
+        )
+        before = snapshot()
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["meta"]["posts"] == 30
+        assert manifest["tables"]["blog.Post"]["rows"] == 30
+        assert manifest["tables"]["blog.Post"]["ids"] == [
+            before[Post][0]["id"],
+            before[Post][-1]["id"],
+        ]
+
+        clear_tables()
+        out = StringIO()
+        call_command("load_dataset", tmp_path, batch_size=7, stdout=out)
+
+        assert "30 blog.Post" in out.getvalue()
+        assert snapshot() == before
+        # sequences moved past the loaded ids
+        new = User.objects.create_user(email="new@test.com", password="x")
+        assert new.id > before[User][-1]["id"]
+
+    def test_refuses_non_empty_tables(self, tmp_path):
+        User.objects.create_user(email="a@test.com", password="x")
+        call_command("export_dataset", tmp_path, stdout=StringIO())
+
+        with pytest.raises(CommandError, match="not empty"):
+            call_command("load_dataset", tmp_path, stdout=StringIO())
@@ -0,0 +1,68 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count
+
+from accounts.models import Profile, User
+from blog.models import Post
+from blog.seeding import generate_posts
+
+
+def insert_data(**options):
+    out = StringIO()
+    call_command("insert_data", stdout=out, **options)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+class TestInsertDataBulk:
+    def test_seeds_users_with_profiles_and_posts(self):
+        output = insert_data(users=7, posts=23, batch_size=5, workers=0)
+
+        assert "7 users" in output and "23 posts" in output
+        assert "rows/s" in output
+        assert User.objects.filter(email__startswith="seed").count() == 7
+        assert Profile.objects.exclude(first_name="").count() == 7
+        assert Post.objects.count() == 23
+        assert not Post.objects.filter(brief_content="").exists()
+        # Zipf: the first seeded author writes the most posts
+        top_author = (
+            Post.objects.values("author")
+            .annotate(posts=Count("id"))
+            .order_by("-posts", "author")
+            .first()["author"]
+        )
+        assert top_author == Profile.objects.order_by("id").first().id
+
+    def test_users_share_one_usable_password(self):
+        insert_data(users=2, batch_size=5, workers=0)
+
+        first, second = User.objects.order_by("id")
+        assert first.password == second.password
+        assert first.check_password("TestPass123!")
+
+    def test_seeding_users_again_skips_existing(self):
+        insert_data(users=3, workers=0)
+        output = insert_data(users=5, workers=0)
+
+        assert "2 users" in output
+        assert User.objects.count() == 5
+
+    def test_posts_need_users(self):
+        with pytest.raises(Exception, match="seed --users first"):
+            insert_data(posts=3, workers=0)
+
+    def test_content_does_not_depend_on_workers(self):
+        insert_data(users=1, posts=12, batch_size=5, workers=1, seed=7)
+
+        expected = [
+            row[0]
+            for chunk, size in enumerate([5, 5, 2])
+            for row in generate_posts(
+                7, chunk, size, 1, 10, 1.1, 1.0, published_ratio=0.9
+            )
+        ]
+        assert list(Post.objects.order_by("id").values_list("title", flat=True)) == (
+            expected
+        )
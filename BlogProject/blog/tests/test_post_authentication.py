@@ -0,0 +1,52 @@
+import base64
+
+import pytest
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from accounts.models import User
+
+
+@pytest.mark.django_db
+class TestPostApiAuthentication:
+    """The blog API authenticates with Token or JWT headers only."""
+
+    url = reverse("blog:api-v1:post-list")
+    data = {"title": "New", "content": "Body.", "status": True}
+
+    def test_token_header_authenticates(self, api_client, user, category):
+        token = Token.objects.create(user=user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        response = api_client.post(
+            self.url, {**self.data, "category": category.name}, format="json"
+        )
+
+        assert response.status_code == 201
+
+    def test_basic_header_never_hashes_a_password(
+        self, api_client, user, category, monkeypatch
+    ):
+        def fail(self, raw_password):
+            raise AssertionError("password hashed")
+
+        monkeypatch.setattr(User, "check_password", fail)
+        credentials = base64.b64encode(b"u1@test.com:pass12345/").decode()
+        api_client.credentials(HTTP_AUTHORIZATION=f"Basic {credentials}")
+
+        response = api_client.post(
+            self.url, {**self.data, "category": category.name}, format="json"
+        )
+
+        assert response.status_code == 401
+
+    def test_session_is_ignored(self, client, user, category):
+        client.force_login(user)
+
+        response = client.post(
+            self.url,
+            {**self.data, "category": category.name},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 401
@@ -0,0 +1,58 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from blog.models import Post
+
+# ============================================================
+# brief_content Tests
+# ============================================================
+
+
+@pytest.mark.django_db
+class TestPostBriefContent:
+    """
+    Tests for the stored first-sentence excerpt of a post.
+    """
+
+    def test_brief_content_is_computed_on_save(self, post):
+        """The excerpt is stored when the post is written."""
+        post.content = "  First one! Second one. Third?"
+        post.save()
+        post.refresh_from_db()
+
+        assert post.brief_content == "First one! ..."
+
+    def test_brief_content_follows_update_fields(self, post):
+        """Saving `content` through update_fields also stores the excerpt."""
+        post.content = "Changed. Later."
+        post.save(update_fields=["content"])
+        post.refresh_from_db()
+
+        assert post.brief_content == "Changed. ..."
+
+    def test_first_sentence_scan_is_bounded(self):
+        """A body without sentence ends yields a bounded excerpt."""
+        post = Post(content="word " * 10_000)
+
+        assert len(post.first_sentence()) == Post.BRIEF_SCAN_LIMIT + len(" ...")
+
+    def test_list_endpoint_does_not_load_content(self, api_client, post):
+        """The list representation reads brief_content, never content."""
+        response = api_client.get(reverse("blog:api-v1:post-list"))
+
+        assert response.data["results"][0]["brief_content"] == post.brief_content
+        assert "content" in Post.objects.for_action("list").get().get_deferred_fields()
+
+    def test_backfill_command_fills_missing_excerpts(self, post):
+        """backfill_brief_content computes rows written without save()."""
+        Post.objects.filter(pk=post.pk).update(brief_content="")
+        out = StringIO()
+
+        call_command("backfill_brief_content", stdout=out)
+        post.refresh_from_db()
+
+        assert post.brief_content == post.first_sentence()
+        assert "1 posts" in out.getvalue()
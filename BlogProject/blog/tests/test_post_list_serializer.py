@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pytest
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from blog.api.v1.serializer import PostListSerializer, PostSerializer
+from blog.api.v1.views import PostViewSet
+from blog.models import Post
+
+# ============================================================
+# List Serializer Tests
+# ============================================================
+
+
+@pytest.mark.django_db
+class TestPostListSerializer:
+    """
+    PostListSerializer must render exactly what PostSerializer renders
+    for the list action, from `.values()` rows.
+    """
+
+    def render_both(self):
+        request = Request(APIRequestFactory().get("/blog/api/v1/post/"))
+        context = {"request": request, "view": SimpleNamespace(action="list")}
+        instances = Post.objects.for_action("list").order_by("id")
+        rows = Post.objects.list_rows().order_by("id")
+        return (
+            PostSerializer(instances, many=True, context=context).data,
+            PostListSerializer(rows, many=True, context=context).data,
+        )
+
+    def test_matches_post_serializer_list_output(self, make_posts):
+        """Same keys, same order, same values."""
+        make_posts(4)
+
+        expected, rendered = self.render_both()
+
+        assert [list(item) for item in rendered] == [list(item) for item in expected]
+        assert rendered == expected
+
+    def test_matches_for_missing_relations_and_image(self, post):
+        """Posts without author/category and with an image render the same."""
+        Post.objects.create(
+            title="Orphan",
+            content="No author. No category.",
+            image="blog/cover.png",
+            published_date=timezone.now(),
+        )
+
+        expected, rendered = self.render_both()
+
+        assert rendered == expected
+        assert rendered[1]["author"] is None
+        assert rendered[1]["image"].endswith("/media/blog/cover.png")
+
+
+class TestPostViewSetSerializerClass:
+    """The list serializer is read-only: only list reads select it."""
+
+    def get_serializer_class(self, method):
+        request = Request(getattr(APIRequestFactory(), method)("/blog/api/v1/post/"))
+        return PostViewSet(action="list", request=request).get_serializer_class()
+
+    def test_list_reads_use_the_list_serializer(self):
+        assert self.get_serializer_class("get") is PostListSerializer
+        assert self.get_serializer_class("head") is PostListSerializer
+
+    def test_other_methods_on_the_list_url_use_the_post_serializer(self):
+        """e.g. the browsable API forms, rendered with the list action."""
+        assert self.get_serializer_class("post") is PostSerializer
+        assert self.get_serializer_class("options") is PostSerializer
@@ -0,0 +1,201 @@
+import pytest
+from django.urls import reverse
+
+# ============================================================
+# Pagination Tests
+# ============================================================
+
+
+@pytest.mark.django_db
+class TestPostCursorPagination:
+    """
+    Tests for the keyset (cursor) pagination mode of PostViewSet,
+    selected with ?paginate=cursor.
+    """
+
+    url = reverse("blog:api-v1:post-list")
+
+    def test_default_mode_keeps_page_number_envelope(self, api_client, make_posts):
+        """Without ?paginate the page-number envelope (with totals) is used."""
+        make_posts(3)
+
+        response = api_client.get(self.url)
+
+        assert response.status_code == 200
+        assert response.data["total_objects"] == 3
+        assert set(response.data["links"]) == {"next", "previous"}
+
+    def test_cursor_mode_envelope_has_no_totals(self, api_client, make_posts):
+        """Cursor mode keeps links/results but does not report totals."""
+        make_posts(3)
+
+        response = api_client.get(self.url, {"paginate": "cursor"})
+
+        assert response.status_code == 200
+        assert set(response.data) == {"links", "results"}
+        assert response.data["links"]["previous"] is None
+        assert response.data["links"]["next"]
+
+    def test_cursor_mode_walks_all_posts_in_feed_order(self, api_client, make_posts):
+        """Following `next` links returns every post once, newest first."""
+        posts = make_posts(5)
+        expected = [post.id for post in reversed(posts)]
+
+        seen = []
+        response = api_client.get(self.url, {"paginate": "cursor"})
+        while True:
+            seen += [item["id"] for item in response.data["results"]]
+            next_link = response.data["links"]["next"]
+            if not next_link:
+                break
+            response = api_client.get(next_link)
+
+        assert seen == expected
+
+    def test_cursor_mode_previous_link_returns_previous_page(
+        self, api_client, make_posts
+    ):
+        """Following `previous` from page 2 returns page 1 again."""
+        make_posts(5)
+        first = api_client.get(self.url, {"paginate": "cursor"})
+        second = api_client.get(first.data["links"]["next"])
+
+        back = api_client.get(second.data["links"]["previous"])
+
+        assert [i["id"] for i in back.data["results"]] == [
+            i["id"] for i in first.data["results"]
+        ]
+        assert back.data["links"]["previous"] is None
+
+    def test_cursor_mode_issues_no_count_query(
+        self, api_client, make_posts, django_assert_num_queries
+    ):
+        """A cursor page is a single query, even deep into the feed."""
+        make_posts(5)
+        first = api_client.get(self.url, {"paginate": "cursor"})
+
+        with django_assert_num_queries(1):
+            response = api_client.get(first.data["links"]["next"])
+
+        assert response.status_code == 200
+
+    def test_invalid_cursor_returns_404(self, api_client, make_posts):
+        """A malformed cursor is reported as 404 like DRF's CursorPagination."""
+        make_posts(1)
+
+        response = api_client.get(self.url, {"paginate": "cursor", "cursor": "bad"})
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"ordering": "published_date"},
+            {"search": "post"},
+            {"ordering": "-published_date", "search": "post"},
+        ],
+    )
+    def test_ordering_and_search_are_rejected(self, api_client, make_posts, params):
+        """Cursor pages are in feed order only: other orders are a 400."""
+        make_posts(1)
+
+        response = api_client.get(self.url, {"paginate": "cursor", **params})
+
+        assert response.status_code == 400
+        assert set(response.data) == set(params)
+
+    def test_empty_ordering_and_search_are_accepted(self, api_client, make_posts):
+        """Blank params (e.g. an empty search box) change nothing."""
+        make_posts(1)
+
+        response = api_client.get(
+            self.url, {"paginate": "cursor", "ordering": "", "search": ""}
+        )
+
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db
+class TestPostCountCache:
+    """
+    Tests for the cached / estimated totals of the page-number mode.
+    """
+
+    url = reverse("blog:api-v1:post-list")
+
+    def test_repeated_request_reuses_cached_count(
+        self, api_client, make_posts, django_assert_num_queries
+    ):
+        """A request with the same filters skips the COUNT query."""
+        make_posts(3)
+        api_client.get(self.url)
+
+        # `page` is not a filter: a new response, but the same count
+        with django_assert_num_queries(1):
+            response = api_client.get(self.url, {"page": 1})
+
+        assert response.data["total_objects"] == 3
+        assert response.data["count_is_exact"] is True
+
+    def test_filter_order_is_normalized(
+        self, api_client, make_posts, profile, django_assert_num_queries
+    ):
+        """Same filters in a different order share one cache entry."""
+        make_posts(4)
+        api_client.get(self.url, {"author": profile.id, "status": "true"})
+
+        # the author filter validates its choice with one query of its own
+        with django_assert_num_queries(2) as captured:
+            response = api_client.get(
+                f"{self.url}?status=true&author={profile.id}&page=1"
+            )
+
+        assert response.data["total_objects"] == 2
+        assert not any("COUNT(" in q["sql"] for q in captured.captured_queries)
+
+    def test_counts_are_cached_per_filter_set(self, api_client, make_posts, profile):
+        """A different filter set gets its own count."""
+        make_posts(4)
+
+        everything = api_client.get(self.url)
+        filtered = api_client.get(self.url, {"author": profile.id})
+
+        assert everything.data["total_objects"] == 4
+        assert filtered.data["total_objects"] == 2
+
+    def test_post_save_and_delete_invalidate_count(self, api_client, make_posts):
+        """Writing a post drops the cached totals."""
+        posts = make_posts(3)
+        api_client.get(self.url)
+
+        posts[0].delete()
+        assert api_client.get(self.url).data["total_objects"] == 2
+
+        make_posts(1)
+        assert api_client.get(self.url).data["total_objects"] == 3
+
+    def test_estimate_used_above_threshold(
+        self, api_client, make_posts, settings, monkeypatch
+    ):
+        """Above the threshold the planner estimate is returned as inexact."""
+        make_posts(1)
+        settings.POST_COUNT_ESTIMATE_THRESHOLD = 1000
+        monkeypatch.setattr("blog.services.estimate_post_count", lambda qs: 5000)
+
+        response = api_client.get(self.url)
+
+        assert response.data["total_objects"] == 5000
+        assert response.data["count_is_exact"] is False
+
+    def test_exact_count_below_threshold(
+        self, api_client, make_posts, settings, monkeypatch
+    ):
+        """Below the threshold the exact COUNT is still used."""
+        make_posts(2)
+        settings.POST_COUNT_ESTIMATE_THRESHOLD = 1000
+        monkeypatch.setattr("blog.services.estimate_post_count", lambda qs: 10)
+
+        response = api_client.get(self.url)
+
+        assert response.data["total_objects"] == 2
+        assert response.data["count_is_exact"] is True
@@ -0,0 +1,95 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+# ============================================================
+# Query count tests (N+1 regressions)
+# ============================================================
+
+
+@pytest.mark.django_db
+class TestPostQueryCounts:
+    """
+    Pin the number of SQL queries per read endpoint.
+
+    The counts must not depend on how many posts are rendered,
+    otherwise a serializer is resolving relations per row. Each count
+    includes the ETag lookup, which runs once after a write.
+    """
+
+    @pytest.mark.parametrize("count", [1, 5])
+    def test_viewset_list(
+        self, api_client, make_posts, count, django_assert_num_queries
+    ):
+        """ModelViewSet list: ETag + one COUNT for pagination + one SELECT."""
+        make_posts(count)
+        url = reverse("blog:api-v1:post-list") + "?page_size=10"
+
+        with django_assert_num_queries(3):
+            response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert len(response.data["results"]) == count
+
+    def test_viewset_retrieve(self, api_client, make_posts, django_assert_num_queries):
+        """ModelViewSet retrieve: ETag + a SELECT with joined relations."""
+        post = make_posts(1)[0]
+        url = reverse("blog:api-v1:post-detail", kwargs={"pk": post.id})
+
+        with django_assert_num_queries(2):
+            response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert response.data["category"]["name"] == post.category.name
+
+    @pytest.mark.parametrize(
+        "url_name",
+        ["post_list_fbv", "post_list_api_view", "post_list_gen_api_view"],
+    )
+    @pytest.mark.parametrize("count", [1, 5])
+    def test_unpaginated_lists(
+        self, api_client, make_posts, url_name, count, django_assert_num_queries
+    ):
+        """FBV / APIView / generic list endpoints: ETag + one SELECT."""
+        make_posts(count)
+        url = reverse(f"blog:api-v1:{url_name}")
+
+        # the list is streamed: rows are only read while the body is consumed
+        with django_assert_num_queries(2):
+            response = api_client.get(url)
+            data = json.loads(b"".join(response.streaming_content))
+
+        assert response.status_code == 200
+        assert len(data) == count
+
+    @pytest.mark.parametrize(
+        "url_name",
+        ["post_detail_fbv", "post_detail_api_view", "post_detail_gen_api_view"],
+    )
+    def test_details(self, api_client, make_posts, url_name, django_assert_num_queries):
+        """FBV / APIView / generic detail endpoints: ETag + one SELECT."""
+        post = make_posts(1)[0]
+        url = reverse(f"blog:api-v1:{url_name}", kwargs={"id": post.id})
+
+        with django_assert_num_queries(2):
+            response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert response.data["id"] == post.id
+
+
+@pytest.mark.django_db
+def test_explain_post_queries_reports_every_combination(make_posts):
+    """The index report covers each filter x ordering combination."""
+    make_posts(2)
+    out = StringIO()
+
+    call_command("explain_post_queries", stdout=out)
+
+    lines = out.getvalue().splitlines()
+    # 5 filter sets x (default + 2 published_date orderings), plus the summary
+    assert len(lines) == 16
+    assert lines[-1].endswith("fall back to a sequential scan.")
@@ -0,0 +1,131 @@
+import pytest
+from django.urls import reverse
+
+from blog.checks import check_shared_cache
+
+# ============================================================
+# Response Cache Tests
+# ============================================================
+
+
+@pytest.mark.django_db
+class TestPostResponseCache:
+    """
+    Tests for the cached list/retrieve responses of PostViewSet.
+    """
+
+    list_url = reverse("blog:api-v1:post-list")
+
+    def detail_url(self, post):
+        return reverse("blog:api-v1:post-detail", kwargs={"pk": post.id})
+
+    def test_repeated_list_is_served_from_cache(
+        self, api_client, make_posts, django_assert_num_queries
+    ):
+        """An identical list request runs no query at all."""
+        make_posts(3)
+        first = api_client.get(self.list_url)
+
+        with django_assert_num_queries(0):
+            second = api_client.get(self.list_url)
+
+        assert second.status_code == 200
+        assert second.data == first.data
+
+    def test_repeated_retrieve_is_served_from_cache(
+        self, api_client, post, django_assert_num_queries
+    ):
+        """An identical detail request runs no query at all."""
+        api_client.get(self.detail_url(post))
+
+        with django_assert_num_queries(0):
+            response = api_client.get(self.detail_url(post))
+
+        assert response.data["id"] == post.id
+
+    def test_query_param_order_is_normalized(
+        self, api_client, make_posts, django_assert_num_queries
+    ):
+        """Same params in another order hit the same entry."""
+        make_posts(3)
+        api_client.get(f"{self.list_url}?status=true&page_size=5")
+
+        with django_assert_num_queries(0):
+            api_client.get(f"{self.list_url}?page_size=5&status=true")
+
+    def test_anonymous_and_authenticated_are_cached_apart(
+        self, api_client, user, make_posts, django_assert_num_queries
+    ):
+        """An anonymous entry is not served to an authenticated client."""
+        make_posts(2)
+        api_client.get(self.list_url)
+        api_client.force_authenticate(user=user)
+
+        # the page is queried again; only the cached count is shared
+        with django_assert_num_queries(1):
+            response = api_client.get(self.list_url)
+
+        assert response.status_code == 200
+
+    def test_post_write_invalidates(self, api_client, post):
+        """Saving a post is visible on the next read."""
+        api_client.get(self.detail_url(post))
+
+        post.title = "Updated title"
+        post.save()
+
+        assert api_client.get(self.detail_url(post)).data["title"] == "Updated title"
+
+    def test_post_delete_invalidates(self, api_client, make_posts):
+        """Deleting a post drops it from the cached list."""
+        posts = make_posts(2)
+        api_client.get(self.list_url)
+
+        posts[0].delete()
+
+        assert api_client.get(self.list_url).data["total_objects"] == 1
+
+    def test_category_write_invalidates(self, api_client, post):
+        """Renaming a category is visible in cached post responses."""
+        api_client.get(self.detail_url(post))
+
+        post.category.name = "Renamed"
+        post.category.save()
+
+        response = api_client.get(self.detail_url(post))
+        assert response.data["category"]["name"] == "Renamed"
+
+    def test_errors_are_not_cached(self, api_client, post):
+        """A 404 for a missing post does not stick once it exists."""
+        missing = reverse("blog:api-v1:post-detail", kwargs={"pk": post.id + 1})
+        assert api_client.get(missing).status_code == 404
+
+        new_post = type(post).objects.create(title="New", content="Body.")
+
+        assert new_post.id == post.id + 1
+        assert api_client.get(missing).status_code == 200
+
+
+class TestSharedCacheCheck:
+    """The versioned caches need a default cache shared by every process."""
+
+    def test_process_local_cache_fails(self, settings):
+        settings.SHARED_CACHE_REQUIRED = True
+
+        assert [error.id for error in check_shared_cache(None)] == ["blog.E001"]
+
+    def test_shared_cache_passes(self, settings):
+        settings.SHARED_CACHE_REQUIRED = True
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379/1",
+            }
+        }
+
+        assert check_shared_cache(None) == []
+
+    def test_single_process_profiles_may_opt_out(self, settings):
+        settings.SHARED_CACHE_REQUIRED = False
+
+        assert check_shared_cache(None) == []
@@ -0,0 +1,79 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+
+from blog.models import Post
+
+# ============================================================
+# Search Tests
+# ============================================================
+
+postgres_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="full-text search needs PostgreSQL"
+)
+
+
+@pytest.fixture
+def search_posts(profile, category):
+    """One post matching `docker` in its title, one only in its content."""
+
+    def _create(title, content):
+        return Post.objects.create(
+            title=title,
+            content=content,
+            author=profile,
+            status=True,
+            category=category,
+            published_date=timezone.now(),
+        )
+
+    in_title = _create("Docker for Django", "Containers everywhere.")
+    in_content = _create("Deploying", "We ship the app with docker compose.")
+    _create("Unrelated", "Nothing to see here.")
+    return in_title, in_content
+
+
+@pytest.mark.django_db
+class TestPostSearch:
+    """
+    Tests for PostSearchFilter on the PostViewSet list endpoint.
+    """
+
+    url = reverse("blog:api-v1:post-list")
+
+    def test_search_matches_title_and_content(self, api_client, search_posts):
+        """Both title and content matches are returned, others are not."""
+        response = api_client.get(self.url, {"search": "docker", "page_size": 10})
+
+        assert response.status_code == 200
+        assert {item["id"] for item in response.data["results"]} == {
+            post.id for post in search_posts
+        }
+
+    def test_search_vector_is_not_loaded(self, search_posts):
+        """Read querysets never select the tsvector column."""
+        post = Post.objects.for_action("list").get(pk=search_posts[0].pk)
+
+        assert "search_vector" in post.get_deferred_fields()
+
+    @postgres_only
+    def test_title_matches_rank_first(self, api_client, search_posts):
+        """A title match outranks a content-only match."""
+        in_title, in_content = search_posts
+
+        response = api_client.get(self.url, {"search": "docker", "page_size": 10})
+
+        assert [item["id"] for item in response.data["results"]] == [
+            in_title.id,
+            in_content.id,
+        ]
+
+    @postgres_only
+    def test_search_vector_maintained_by_trigger(self, search_posts):
+        """Inserted and updated rows get a search vector without app code."""
+        post = search_posts[0]
+        post.title = "Kubernetes"
+        post.save()
+
+        assert Post.objects.filter(search_vector="kubernetes", pk=post.pk).exists()
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from blog.api.v1.serializer import PostSerializer
+from blog.models import Post
+
+# ============================================================
+# Streaming List Tests
+# ============================================================
+
+STREAMED_URLS = ["post_list_fbv", "post_list_api_view", "post_list_gen_api_view"]
+
+
+@pytest.mark.django_db
+class TestPostListStreaming:
+    """
+    Tests for the streamed JSON output of the unpaginated post lists.
+    """
+
+    @pytest.mark.parametrize("url_name", STREAMED_URLS)
+    def test_json_lists_are_streamed(self, api_client, make_posts, url_name):
+        """JSON clients get a streaming response holding a JSON array."""
+        make_posts(3)
+
+        response = api_client.get(reverse(f"blog:api-v1:{url_name}"))
+
+        assert response.streaming
+        assert response["Content-Type"] == "application/json"
+        assert len(json.loads(b"".join(response.streaming_content))) == 3
+
+    @pytest.mark.parametrize("url_name", STREAMED_URLS)
+    def test_streamed_bytes_match_rendered_list(
+        self, api_client, make_posts, settings, url_name
+    ):
+        """Across chunk boundaries the body equals the fully rendered list."""
+        settings.POST_STREAM_CHUNK_SIZE = 2
+        make_posts(5)
+        request = Request(APIRequestFactory().get("/"))
+        expected = JSONRenderer().render(
+            PostSerializer(
+                Post.objects.with_relations(), many=True, context={"request": request}
+            ).data
+        )
+
+        response = api_client.get(reverse(f"blog:api-v1:{url_name}"))
+
+        assert b"".join(response.streaming_content) == expected
+
+    def test_empty_table_streams_empty_array(self, api_client, db):
+        """No rows still produce valid JSON."""
+        response = api_client.get(reverse("blog:api-v1:post_list_fbv"))
+
+        assert b"".join(response.streaming_content) == b"[]"
+
+    def test_browsable_api_is_not_streamed(self, api_client, make_posts):
+        """The HTML renderer keeps the regular response."""
+        make_posts(2)
+
+        response = api_client.get(
+            reverse("blog:api-v1:post_list_api_view"), {"format": "api"}
+        )
+
+        assert not response.streaming
+        assert len(response.data) == 2
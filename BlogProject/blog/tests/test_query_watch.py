@@ -0,0 +1,137 @@
+import logging
+
+import pytest
+from django.db import connection, transaction
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from blog.models import Post
+from core.querywatch import (
+    QueryWatchError,
+    QueryWatchMiddleware,
+    fingerprint,
+    watch_queries,
+)
+
+# ============================================================
+# N+1 / Slow Query Detection Tests
+# ============================================================
+
+
+def author_names():
+    # the classic N+1: one profile query per post
+    return [post.author.get_full_name for post in Post.objects.all()]
+
+
+def view(request):
+    author_names()
+    return HttpResponse("ok")
+
+
+def streaming_view(request):
+    # the N+1 runs while the body is sent
+    return StreamingHttpResponse(
+        post.author.get_full_name.encode() for post in Post.objects.all().iterator()
+    )
+
+
+def eager_streaming_view(request):
+    # the N+1 runs in the view, before the body is sent
+    return StreamingHttpResponse(name.encode() for name in author_names())
+
+
+class TestFingerprint:
+    def test_values_are_normalized(self):
+        assert fingerprint(
+            "SELECT * FROM t WHERE a = %s AND b IN (%s, %s) AND c = 'it''s' LIMIT 21"
+        ) == fingerprint(
+            "SELECT *  FROM t WHERE a = 7 AND b IN (1) AND c = 'x' LIMIT 1"
+        )
+
+    def test_identifiers_are_kept(self):
+        assert fingerprint('SELECT "t1"."id" FROM "t1"') != fingerprint(
+            'SELECT "t2"."id" FROM "t2"'
+        )
+
+
+@pytest.mark.django_db
+class TestQueryWatch:
+    def test_repeated_queries_raise_with_their_origin(self, make_posts):
+        make_posts(4)
+
+        with pytest.raises(QueryWatchError) as error:
+            with watch_queries("authors", mode="raise"):
+                author_names()
+
+        message = str(error.value)
+        assert "authors: query repeated 4 times" in message
+        assert "test_query_watch.py" in message and "in author_names" in message
+
+    def test_prefetched_queries_pass(self, make_posts):
+        make_posts(4)
+
+        with watch_queries("authors", mode="raise") as watcher:
+            [p.author.get_full_name for p in Post.objects.select_related("author")]
+
+        assert watcher.reports == []
+
+    def test_transaction_savepoints_are_ignored(self):
+        with watch_queries("savepoints", mode="raise"):
+            for _ in range(4):
+                with transaction.atomic():
+                    pass
+
+    def test_slow_queries(self, settings, post):
+        settings.QUERY_WATCH_SLOW_QUERY_MS = 1e-6
+
+        with pytest.raises(QueryWatchError, match="slow query"):
+            with watch_queries("slow", mode="raise"):
+                Post.objects.count()
+
+
+@pytest.mark.django_db
+class TestQueryWatchMiddleware:
+    def test_raises_on_n_plus_one(self, make_posts):
+        make_posts(3)
+
+        with pytest.raises(QueryWatchError, match="GET /posts/"):
+            QueryWatchMiddleware(view)(RequestFactory().get("/posts/"))
+
+    def test_streamed_queries_are_watched(self, make_posts):
+        make_posts(3)
+        response = QueryWatchMiddleware(streaming_view)(RequestFactory().get("/"))
+
+        with pytest.raises(QueryWatchError):
+            b"".join(response.streaming_content)
+        assert connection.execute_wrappers == []
+
+    def test_unread_streams_do_not_leak(self, make_posts):
+        make_posts(3)
+
+        for _ in range(3):
+            QueryWatchMiddleware(streaming_view)(RequestFactory().get("/"))
+
+        assert connection.execute_wrappers == []
+
+    def test_view_queries_of_unread_streams_are_reported(self, make_posts):
+        make_posts(3)
+
+        with pytest.raises(QueryWatchError):
+            QueryWatchMiddleware(eager_streaming_view)(RequestFactory().get("/"))
+        assert connection.execute_wrappers == []
+
+    def test_logs_a_sample_in_production(self, make_posts, settings, caplog):
+        make_posts(3)
+        settings.QUERY_WATCH = "log"
+        middleware = QueryWatchMiddleware(view)
+
+        settings.QUERY_WATCH_SAMPLE_RATE = 0
+        with caplog.at_level(logging.WARNING, logger="core.querywatch"):
+            middleware(RequestFactory().get("/posts/"))
+        assert not caplog.records
+
+        settings.QUERY_WATCH_SAMPLE_RATE = 1
+        with caplog.at_level(logging.WARNING, logger="core.querywatch"):
+            response = middleware(RequestFactory().get("/posts/"))
+        assert response.status_code == 200
+        assert "query repeated 3 times" in caplog.records[0].getMessage()
@@ -0,0 +1,122 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import User
+from core.metrics import registry
+
+# ============================================================
+# Request Metrics Tests
+# ============================================================
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    registry.reset()
+
+
+def series(view, method="GET"):
+    return next(
+        item
+        for item in registry.snapshot()["series"]
+        if item["view"] == view and item["method"] == method
+    )
+
+
+@pytest.mark.django_db
+class TestPerformanceMiddleware:
+    url = reverse("blog:api-v1:post-list")
+
+    def test_server_timing_header(self, api_client, make_posts, settings):
+        settings.PERFORMANCE_SERVER_TIMING = True
+        make_posts(3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(self.url)
+
+        timings = dict(
+            part.strip().split(";", 1) for part in response["Server-Timing"].split(",")
+        )
+        assert set(timings) == {"total", "db", "serialize"}
+        assert f'desc="{len(queries)} queries"' in timings["db"]
+
+    def test_histograms_per_url_name(self, api_client, make_posts):
+        make_posts(3)
+
+        first = api_client.get(self.url)
+        api_client.get(self.url)
+
+        stats = series("blog:api-v1:post-list")
+        assert stats["request_duration_seconds"]["count"] == 2
+        assert stats["serialize_duration_seconds"]["sum"] > 0
+        assert stats["db_queries"]["buckets"]["+Inf"] == 2
+        assert stats["response_size_bytes"]["sum"] >= 2 * len(first.content)
+
+    def test_streamed_responses_are_recorded_once_sent(self, api_client, make_posts):
+        make_posts(3)
+
+        response = api_client.get(reverse("blog:api-v1:post_list_fbv"))
+        assert not registry.snapshot()["series"]
+        body = b"".join(response.streaming_content)
+
+        stats = series("blog:api-v1:post_list_fbv")
+        assert stats["response_size_bytes"]["sum"] == len(body)
+        assert stats["db_queries"]["sum"] >= 1
+
+    def test_unread_streams_leave_no_query_wrapper(self, api_client, make_posts):
+        make_posts(3)
+
+        for _ in range(3):
+            response = api_client.get(reverse("blog:api-v1:post_list_fbv"))
+        assert connection.execute_wrappers == []
+
+        # the server closes the response even when the client went away
+        response.close()
+        assert series("blog:api-v1:post_list_fbv")["response_size_bytes"]["sum"] == 0
+
+    def test_unknown_methods_share_one_series(self, api_client):
+        for method in ("FOO", "BAR"):
+            api_client.generic(method, self.url)
+
+        snapshot = registry.snapshot()["series"]
+        assert {item["method"] for item in snapshot} == {"OTHER"}
+        assert series("blog:api-v1:post-list", "OTHER")["db_queries"]["count"] == 2
+
+    def test_unresolved_urls(self, api_client):
+        api_client.get("/no-such-page/")
+
+        assert series("<unresolved>")["request_duration_seconds"]["count"] == 1
+
+    def test_can_be_disabled(self, api_client, settings):
+        settings.PERFORMANCE_METRICS = False
+
+        response = api_client.get(self.url)
+
+        assert "Server-Timing" not in response
+        assert not registry.snapshot()["series"]
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    url = reverse("metrics")
+
+    def test_admins_only(self, api_client, user):
+        assert api_client.get(self.url).status_code in (401, 403)
+        api_client.force_authenticate(user)
+        assert api_client.get(self.url).status_code == 403
+
+    def test_json_and_prometheus(self, api_client):
+        admin = User.objects.create_superuser(email="a@test.com", password="x")
+        api_client.force_authenticate(admin)
+        api_client.get(reverse("blog:api-v1:post-list"))
+
+        data = api_client.get(self.url).json()
+        text = api_client.get(self.url, {"format": "prometheus"})
+
+        assert [item["view"] for item in data["series"]] == ["blog:api-v1:post-list"]
+        assert text["Content-Type"].startswith("text/plain")
+        assert (
+            'django_request_duration_seconds_bucket{view="blog:api-v1:post-list",'
+            'method="GET",le="+Inf"} 1'
+        ) in text.content.decode()
@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fail_on_repeated_queries(settings):
+    """
+    Make requests repeating a query (N+1) fail (see core.querywatch);
+    test data is a handful of rows, so three repeats already count.
+    Slow queries are not checked: their timing depends on the machine.
+    """
+    settings.QUERY_WATCH = "raise"
+    settings.QUERY_WATCH_REPEAT_THRESHOLD = 3
+    settings.QUERY_WATCH_SLOW_QUERY_MS = 0
@@ -11,6 +11,11 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.production")
 
 application = get_asgi_application()
+
+# deliver the email outbox from this server process (accounts.outbox)
+from accounts.outbox import delivery_pool  # noqa: E402
+
+delivery_pool.start()
@@ -0,0 +1,101 @@
+"""
+API documentation (drf-yasg), only imported when settings.API_DOCS is on
+(see core.settings.development), so production never loads drf-yasg.
+"""
+
+from django.conf import settings
+from django.urls import include, path
+
+
+def swagger_auto_schema(**kwargs):
+    """
+    drf-yasg's swagger_auto_schema when the docs are on; otherwise the
+    view is returned as is.
+    """
+    if not settings.API_DOCS:
+        return lambda view: view
+
+    from drf_yasg.utils import swagger_auto_schema
+
+    return swagger_auto_schema(**kwargs)
+
+
+def docs_urlpatterns():
+    """Return the Swagger/ReDoc URLs, split by API version."""
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+
+    # -----------------------------
+    # OpenAPI Infos
+    # -----------------------------
+    info_v1 = openapi.Info(
+        title="Blog Project API (v1)",
+        default_version="v1",
+        description="Public API v1 (blog + custom endpoints)",
+        contact=openapi.Contact(email="mohammad.sabeti2000@gmail.com"),
+        license=openapi.License(name="MIT License"),
+    )
+
+    info_v2 = openapi.Info(
+        title="Blog Project API (v2)",
+        default_version="v2",
+        description="Auth API v2 (Djoser + JWT)",
+        contact=openapi.Contact(email="mohammad.sabeti2000@gmail.com"),
+        license=openapi.License(name="MIT License"),
+    )
+    # -----------------------------
+    # Swagger schema views (split)
+    # -----------------------------
+    schema_view_v1 = get_schema_view(
+        info_v1,
+        public=True,
+        permission_classes=[permissions.AllowAny],
+        patterns=[
+            path("api/v1/accounts/", include("accounts.urls")),
+            path("api/v1/blog/", include("blog.urls")),
+        ],
+    )
+
+    schema_view_v2 = get_schema_view(
+        info_v2,
+        public=True,
+        permission_classes=[permissions.AllowAny],
+        patterns=[
+            path("api/v2/", include("djoser.urls")),
+            path("api/v2/", include("djoser.urls.jwt")),
+        ],
+    )
+
+    return [
+        path(
+            "swagger/v1.json",
+            schema_view_v1.without_ui(cache_timeout=0),
+            name="schema-v1-json",
+        ),
+        path(
+            "swagger/v1/",
+            schema_view_v1.with_ui("swagger", cache_timeout=0),
+            name="schema-v1-swagger-ui",
+        ),
+        path(
+            "redoc/v1/",
+            schema_view_v1.with_ui("redoc", cache_timeout=0),
+            name="schema-v1-redoc",
+        ),
+        path(
+            "swagger/v2.json",
+            schema_view_v2.without_ui(cache_timeout=0),
+            name="schema-v2-json",
+        ),
+        path(
+            "swagger/v2/",
+            schema_view_v2.with_ui("swagger", cache_timeout=0),
+            name="schema-v2-swagger-ui",
+        ),
+        path(
+            "redoc/v2/",
+            schema_view_v2.with_ui("redoc", cache_timeout=0),
+            name="schema-v2-redoc",
+        ),
+    ]
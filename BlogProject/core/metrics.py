@@ -0,0 +1,268 @@
+"""
+Lightweight per-request performance metrics.
+
+PerformanceMiddleware measures each request: wall time, number and time
+of database queries (through `connection.execute_wrapper`), time spent in
+serializers (see TimedSerializerMixin) and response size. It reports them
+in a `Server-Timing` header and adds them to histograms kept per resolved
+URL name (e.g. `blog:api-v1:post-list`) and method, which MetricsView
+serves as JSON or in the Prometheus text format.
+
+The histograms live in process memory: each server process (worker)
+exposes its own, like a Prometheus target per worker.
+"""
+
+import os
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework import serializers
+
+# upper bounds of the histogram buckets, as in Prometheus (le="...")
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+# name: (help, buckets)
+HISTOGRAMS = {
+    "request_duration_seconds": ("Wall time of requests", DURATION_BUCKETS),
+    "db_duration_seconds": ("Time spent in database queries", DURATION_BUCKETS),
+    "db_queries": ("Database queries per request", QUERY_BUCKETS),
+    "serialize_duration_seconds": ("Time spent in serializers", DURATION_BUCKETS),
+    "response_size_bytes": ("Size of response bodies", SIZE_BUCKETS),
+}
+UNRESOLVED = "<unresolved>"
+# series are kept per method: any other (client supplied) method is
+# recorded as OTHER, so the registry cannot grow without bound
+KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE"}
+
+# metrics of the request being handled, if it is measured
+_current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    __slots__ = ("started", "queries", "db_time", "serialize_time", "serializing")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        # nesting depth, so nested serializers are timed once
+        self.serializing = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper hook
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries += 1
+
+    def server_timing(self, total):
+        return ", ".join(
+            [
+                f"total;dur={total * 1000:.1f}",
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"',
+                f"serialize;dur={self.serialize_time * 1000:.1f}",
+            ]
+        )
+
+
+def add_serialize_time(seconds):
+    """Count serialization done outside serializer `.data` (streaming)."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.serialize_time += seconds
+
+
+class TimedSerializerMixin:
+    """
+    Count the time spent building `.data` as serialization time of the
+    request. Set `Meta.list_serializer_class = TimedListSerializer` for
+    `many=True` to be timed too.
+    """
+
+    @property
+    def data(self):
+        metrics = _current.get()
+        if metrics is None or metrics.serializing:
+            return super().data
+        metrics.serializing += 1
+        started = time.perf_counter()
+        try:
+            return super().data
+        finally:
+            metrics.serialize_time += time.perf_counter() - started
+            metrics.serializing -= 1
+
+
+class TimedListSerializer(TimedSerializerMixin, serializers.ListSerializer):
+    pass
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # one count per bucket plus +Inf, not cumulative
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        index = 0
+        while index < len(self.buckets) and value > self.buckets[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        cumulative, buckets = 0, {}
+        for bound, count in zip([*self.buckets, "+Inf"], self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class MetricsRegistry:
+    """Histograms of every measured request, per (URL name, method)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.series = {}
+
+    def observe(self, view, method, values):
+        with self.lock:
+            histograms = self.series.get((view, method))
+            if histograms is None:
+                histograms = self.series[(view, method)] = {
+                    name: Histogram(buckets)
+                    for name, (_, buckets) in HISTOGRAMS.items()
+                }
+            for name, value in values.items():
+                histograms[name].observe(value)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "pid": os.getpid(),
+                "series": [
+                    {
+                        "view": view,
+                        "method": method,
+                        **{
+                            name: histogram.snapshot()
+                            for name, histogram in histograms.items()
+                        },
+                    }
+                    for (view, method), histograms in sorted(self.series.items())
+                ],
+            }
+
+    def reset(self):
+        with self.lock:
+            self.series = {}
+
+
+registry = MetricsRegistry()
+
+
+def prometheus_text(snapshot, prefix="django_"):
+    """Render a registry snapshot in the Prometheus text exposition format."""
+    lines = []
+    for name, (help_text, _) in HISTOGRAMS.items():
+        metric = f"{prefix}{name}"
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+        for series in snapshot["series"]:
+            labels = (
+                f'view="{escape_label(series["view"])}",method="{series["method"]}"'
+            )
+            histogram = series[name]
+            for bound, count in histogram["buckets"].items():
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{metric}_sum{{{labels}}} {histogram['sum']}")
+            lines.append(f"{metric}_count{{{labels}}} {histogram['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PerformanceMiddleware:
+    """
+    Measure every request (see the module docstring). Put it first in
+    MIDDLEWARE so the time of the other middleware is included.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PERFORMANCE_METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        with self.measuring(metrics):
+            response = self.get_response(request)
+        if not response.streaming:
+            self.record(request, response, metrics, len(response.content))
+            return response
+
+        # queries and serialization go on while the body is sent; recorded
+        # when the server closes the response, even if the body is not read
+        sent = [0]
+        response.streaming_content = self.measure_stream(
+            response.streaming_content, metrics, sent
+        )
+        response._resource_closers.append(
+            lambda: self.record(request, response, metrics, sent[0])
+        )
+        return response
+
+    @contextmanager
+    def measuring(self, metrics):
+        token = _current.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics))
+                yield
+        finally:
+            _current.reset(token)
+
+    def measure_stream(self, content, metrics, sent):
+        # measured chunk by chunk: nothing stays installed on the
+        # connections between chunks, or if the body is never read
+        chunks = iter(content)
+        while True:
+            with self.measuring(metrics):
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            sent[0] += len(chunk)
+            yield chunk
+
+    def record(self, request, response, metrics, size):
+        total = time.perf_counter() - metrics.started
+        if not response.streaming and settings.PERFORMANCE_SERVER_TIMING:
+            response["Server-Timing"] = metrics.server_timing(total)
+        match = request.resolver_match
+        registry.observe(
+            match.view_name if match else UNRESOLVED,
+            request.method if request.method in KNOWN_METHODS else "OTHER",
+            {
+                "request_duration_seconds": total,
+                "db_duration_seconds": metrics.db_time,
+                "db_queries": metrics.queries,
+                "serialize_duration_seconds": metrics.serialize_time,
+                "response_size_bytes": size,
+            },
+        )
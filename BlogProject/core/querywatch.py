@@ -0,0 +1,199 @@
+"""
+Detection of N+1 queries and slow queries.
+
+Within a request every query is reduced to a fingerprint: its SQL with
+literals, parameter placeholders and IN lists normalized. A fingerprint
+seen QUERY_WATCH_REPEAT_THRESHOLD times in the same request is reported
+along with the project code (stack frames under BASE_DIR) that issued
+it, as is any query slower than QUERY_WATCH_SLOW_QUERY_MS.
+
+QUERY_WATCH picks what happens to the reports:
+  - "off": queries are not watched
+  - "log": a sample of requests (QUERY_WATCH_SAMPLE_RATE) is watched and
+    the reports are logged as warnings, the production mode
+  - "raise": every request is watched and the first report raises
+    QueryWatchError, so tests fail on new N+1 queries
+"""
+
+import logging
+import random
+import re
+import time
+import traceback
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# transaction control repeats legitimately (one savepoint per atomic block)
+IGNORED = re.compile(r"^\s*(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b", re.I)
+NORMALIZE = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),  # string literals
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),  # numbers
+    (re.compile(r"%s|\?|:\w+"), "?"),  # placeholders of every paramstyle
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),  # IN lists, VALUES rows
+    (re.compile(r"\s+"), " "),
+]
+SITE_PACKAGES = ("site-packages", "dist-packages")
+
+
+class QueryWatchError(Exception):
+    pass
+
+
+def fingerprint(sql):
+    """Return `sql` with every value replaced, the same for N+1 repeats."""
+    for pattern, replacement in NORMALIZE:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+def project_stack():
+    """Return the calling project frames, innermost last."""
+    base_dir = str(Path(settings.BASE_DIR).resolve())
+    return [
+        f"{frame.filename}:{frame.lineno} in {frame.name}"
+        for frame in traceback.extract_stack()[:-2]
+        if frame.filename.startswith(base_dir)
+        and not any(part in frame.filename for part in SITE_PACKAGES)
+        and frame.filename != __file__
+    ]
+
+
+class QueryWatcher:
+    """connection.execute_wrapper counting query fingerprints."""
+
+    def __init__(self, repeat_threshold=None, slow_query_ms=None):
+        self.repeat_threshold = (
+            repeat_threshold or settings.QUERY_WATCH_REPEAT_THRESHOLD
+        )
+        self.slow_query_ms = (
+            settings.QUERY_WATCH_SLOW_QUERY_MS
+            if slow_query_ms is None
+            else slow_query_ms
+        )
+        self.counts = {}
+        self.reports = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.observe(sql, (time.perf_counter() - started) * 1000)
+
+    def observe(self, sql, elapsed_ms):
+        if IGNORED.match(sql):
+            return
+        key = fingerprint(sql)
+        count = self.counts[key] = self.counts.get(key, 0) + 1
+        # the stack is only captured when a report is made
+        if count == self.repeat_threshold:
+            self.reports.append(
+                {
+                    "kind": "repeated",
+                    "fingerprint": key,
+                    "count": count,
+                    "stack": project_stack(),
+                }
+            )
+        if self.slow_query_ms and elapsed_ms >= self.slow_query_ms:
+            self.reports.append(
+                {
+                    "kind": "slow",
+                    "fingerprint": key,
+                    "duration_ms": round(elapsed_ms, 1),
+                    "stack": project_stack(),
+                }
+            )
+
+    def install(self):
+        """Wrap the queries of every connection; close the result to stop."""
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self))
+        return stack
+
+    def report(self, label, mode):
+        """Log the reports made so far, or raise them in "raise" mode."""
+        if not self.reports:
+            return
+        messages = []
+        for report in self.reports:
+            if report["kind"] == "repeated":
+                report["count"] = self.counts[report["fingerprint"]]
+            messages.append(describe(report, label))
+        self.reports = []
+        if mode == "raise":
+            raise QueryWatchError("\n".join(messages))
+        for message in messages:
+            logger.warning(message)
+
+
+def describe(report, label):
+    if report["kind"] == "repeated":
+        headline = f"{label}: query repeated {report['count']} times (N+1?)"
+    else:
+        headline = f"{label}: slow query ({report['duration_ms']} ms)"
+    frames = "\n".join(f"    {frame}" for frame in report["stack"]) or "    ?"
+    return f"{headline}\n  {report['fingerprint']}\n  issued from:\n{frames}"
+
+
+@contextmanager
+def watch_queries(label="queries", mode=None):
+    """
+    Watch the queries of the block, e.g. in a test or a command, then
+    log or raise the reports according to `mode` (default: QUERY_WATCH).
+    """
+    mode = mode or settings.QUERY_WATCH
+    if mode == "off":
+        yield None
+        return
+    watcher = QueryWatcher()
+    with watcher.install():
+        yield watcher
+    watcher.report(label, mode)
+
+
+class QueryWatchMiddleware:
+    """Watch the queries of requests (see the module docstring)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = settings.QUERY_WATCH
+        if mode == "off" or (
+            mode == "log" and random.random() >= settings.QUERY_WATCH_SAMPLE_RATE
+        ):
+            return self.get_response(request)
+
+        watcher = QueryWatcher()
+        label = f"{request.method} {request.path}"
+        with watcher.install():
+            response = self.get_response(request)
+        # the view's own queries are reported now, even if the body of a
+        # streaming response is never read
+        watcher.report(label, mode)
+        if response.streaming:
+            response.streaming_content = self.watch_stream(
+                response.streaming_content, watcher, label, mode
+            )
+            # a body read in part: closers cannot raise, so log instead
+            response._resource_closers.append(lambda: watcher.report(label, "log"))
+        return response
+
+    def watch_stream(self, content, watcher, label, mode):
+        # watched chunk by chunk: nothing stays installed on the
+        # connections between chunks, or if the body is never read
+        chunks = iter(content)
+        while True:
+            with watcher.install():
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+        watcher.report(label, mode)
@@ -0,0 +1,8 @@
+"""
+Settings profiles, picked with DJANGO_SETTINGS_MODULE:
+
+  - core.settings.production: the shared settings of base.py only, the
+    default of the WSGI/ASGI entry points
+  - core.settings.development: adds the API docs and the debug toolbar,
+    the default of manage.py and the test suite
+"""
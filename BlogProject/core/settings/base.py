@@ -0,0 +1,269 @@
+"""
+Django settings for core project, shared by every profile: production
+uses them as they are, development (core.settings.development) adds the
+API docs and the debug toolbar.
+
+Generated by 'django-admin startproject' using Django 5.2.8.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.2/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/5.2/ref/settings/
+"""
+
+from datetime import timedelta
+from pathlib import Path
+
+from decouple import config
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = config("SECRET_KEY")
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = config("DEBUG", cast=bool)
+
+ALLOWED_HOSTS = config(
+    "ALLOWED_HOSTS", cast=lambda v: [s.strip() for s in v.split(",")]
+)
+
+DATABASES = {
+    "default": {
+        "ENGINE": config("DB_ENGINE"),
+        "NAME": config("DB_NAME"),
+        "USER": config("DB_USER"),
+        "PASSWORD": config("DB_PASSWORD"),
+        "HOST": config("DB_HOST"),
+        "PORT": config("DB_PORT", cast=int),
+    }
+}
+
+# shared by every server process: cache versions (post responses, the
+# category map) and authentication entries must be seen by all workers
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config("REDIS_URL", default="redis://redis:6379/1"),
+    }
+}
+# a per-process default cache fails the blog.E001 system check
+SHARED_CACHE_REQUIRED = True
+
+# Application definition
+
+INSTALLED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "django.contrib.postgres",
+    "rest_framework",
+    "rest_framework.authtoken",
+    "rest_framework_simplejwt",
+    "accounts.apps.AccountsConfig",
+    "blog.apps.BlogConfig",
+    "djoser",
+    "mail_templated",
+    "django_filters",
+    "django.contrib.humanize",
+    "corsheaders",
+]
+
+MIDDLEWARE = [
+    # first, so the time of the other middleware is measured too
+    "core.metrics.PerformanceMiddleware",
+    "core.querywatch.QueryWatchMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+ROOT_URLCONF = "core.urls"
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [BASE_DIR / "templates"],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = "core.wsgi.application"
+
+# dev-only tooling, switched on by core.settings.development: the
+# drf-yasg API docs (core.docs) and django-debug-toolbar
+API_DOCS = False
+DEBUG_TOOLBAR = False
+
+# Database
+# https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+
+
+# Password validation
+# https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
+
+# PBKDF2 cost of new (and re-hashed) passwords; older hashes are updated
+# transparently at the next successful login
+PASSWORD_HASH_ITERATIONS = config(
+    "PASSWORD_HASH_ITERATIONS", cast=int, default=1_000_000
+)
+PASSWORD_HASHERS = [
+    "accounts.hashers.ConfigurablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+AUTHENTICATION_BACKENDS = ["accounts.backends.PooledModelBackend"]
+# password checks of logins: hashing processes per server process (0 runs
+# them inline), checks allowed to wait for one before answering 429, and
+# seconds a check may take before it is given up (429 too)
+LOGIN_HASH_WORKERS = config("LOGIN_HASH_WORKERS", cast=int, default=2)
+LOGIN_HASH_QUEUE_DEPTH = config("LOGIN_HASH_QUEUE_DEPTH", cast=int, default=8)
+LOGIN_HASH_TIMEOUT = config("LOGIN_HASH_TIMEOUT", cast=float, default=10)
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
+    },
+]
+
+# Internationalization
+# https://docs.djangoproject.com/en/5.2/topics/i18n/
+
+LANGUAGE_CODE = "en-us"
+
+TIME_ZONE = "UTC"
+
+USE_I18N = True
+
+USE_TZ = True
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/5.2/howto/static-files/
+
+STATIC_URL = "static/"
+STATIC_ROOT = BASE_DIR / "static"
+
+MEDIA_URL = "/media/"
+MEDIA_ROOT = BASE_DIR / "media"
+
+STATICFILES_DIRS = [
+    BASE_DIR / "staticfiles",
+]
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+AUTH_USER_MODEL = "accounts.User"
+
+# Rest framework settings
+REST_FRAMEWORK = {
+    # session, Basic, Token or JWT, chosen by the Authorization scheme
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "accounts.authentication.HeaderAuthentication",
+    ],
+    "DEFAULT_PERMISSION_CLASSES": [
+        "rest_framework.permissions.AllowAny",
+    ],
+    # 'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.coreapi.AutoSchema',
+}
+# post list totals: cache lifetime in seconds, and the planner row estimate
+# above which an estimated total is returned instead of an exact COUNT
+# (0 disables estimates; only used on PostgreSQL)
+POST_COUNT_CACHE_TIMEOUT = config("POST_COUNT_CACHE_TIMEOUT", cast=int, default=60)
+POST_COUNT_ESTIMATE_THRESHOLD = config(
+    "POST_COUNT_ESTIMATE_THRESHOLD", cast=int, default=0
+)
+# rows fetched (and flushed) per chunk by the streaming post list endpoints
+POST_STREAM_CHUNK_SIZE = config("POST_STREAM_CHUNK_SIZE", cast=int, default=500)
+# lifetime in seconds of cached PostViewSet list/retrieve responses
+POST_RESPONSE_CACHE_TIMEOUT = config(
+    "POST_RESPONSE_CACHE_TIMEOUT", cast=int, default=60
+)
+# lifetime in seconds of the token -> user id and user id -> is_active
+# entries cached by accounts.authentication
+AUTH_CACHE_TIMEOUT = config("AUTH_CACHE_TIMEOUT", cast=int, default=300)
+# per-request timing and query metrics (core.metrics), and whether they
+# are sent back to clients in a Server-Timing header (it reveals database
+# time and query counts to anyone, so only by default with DEBUG)
+PERFORMANCE_METRICS = config("PERFORMANCE_METRICS", cast=bool, default=True)
+PERFORMANCE_SERVER_TIMING = config(
+    "PERFORMANCE_SERVER_TIMING", cast=bool, default=DEBUG
+)
+# N+1 and slow query detection (core.querywatch): "off", "log" for a
+# sample of requests (QUERY_WATCH_SAMPLE_RATE) or "raise" (tests); a
+# query fingerprint repeated this many times in a request is reported,
+# as is any query slower than QUERY_WATCH_SLOW_QUERY_MS (0 disables)
+QUERY_WATCH = config("QUERY_WATCH", default="log")
+QUERY_WATCH_SAMPLE_RATE = config("QUERY_WATCH_SAMPLE_RATE", cast=float, default=0.01)
+QUERY_WATCH_REPEAT_THRESHOLD = config(
+    "QUERY_WATCH_REPEAT_THRESHOLD", cast=int, default=5
+)
+QUERY_WATCH_SLOW_QUERY_MS = config("QUERY_WATCH_SLOW_QUERY_MS", cast=int, default=500)
+# email configurations
+# EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+DEFAULT_FROM_EMAIL = "noreply@blogproject.local"
+EMAIL_USE_TLS = False
+EMAIL_HOST = "smtp4dev"
+EMAIL_HOST_USER = ""
+EMAIL_HOST_PASSWORD = ""
+EMAIL_PORT = 25
+
+# email outbox (accounts.outbox): delivery threads per server process,
+# started with the WSGI/ASGI application (0 leaves delivery to the
+# `send_outbox_emails` command on a schedule), queued ids per process
+# before new mail waits for the next sweep, emails per connection,
+# attempts before an email is marked failed, base retry delay and idle
+# sweep interval in seconds
+EMAIL_OUTBOX_WORKERS = config("EMAIL_OUTBOX_WORKERS", cast=int, default=2)
+EMAIL_OUTBOX_QUEUE_SIZE = config("EMAIL_OUTBOX_QUEUE_SIZE", cast=int, default=1000)
+EMAIL_OUTBOX_BATCH_SIZE = config("EMAIL_OUTBOX_BATCH_SIZE", cast=int, default=50)
+EMAIL_OUTBOX_MAX_ATTEMPTS = config("EMAIL_OUTBOX_MAX_ATTEMPTS", cast=int, default=5)
+EMAIL_OUTBOX_RETRY_BACKOFF = config("EMAIL_OUTBOX_RETRY_BACKOFF", cast=int, default=30)
+EMAIL_OUTBOX_POLL_INTERVAL = config("EMAIL_OUTBOX_POLL_INTERVAL", cast=int, default=30)
+
+SIMPLE_JWT = {
+    "ACTIVATION_TOKEN_LIFETIME": timedelta(hours=24),  # custom key
+}
+
+
+#  settings to access the API from outside
+
+# CORS_ALLOW_ALL_ORIGINS=True
+CORS_ALLOWED_ORIGINS = [
+    "http://localhost:8052",
+    "http://127.0.0.1:8052",
+]
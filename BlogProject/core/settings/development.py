@@ -0,0 +1,31 @@
+"""
+Development profile: the shared settings plus the drf-yasg API docs and,
+with SHOW_DEBUGGER_TOOLBAR, django-debug-toolbar. runserver and the
+tests are a single process, so the cache is local memory unless
+DEV_SHARED_CACHE asks for the Redis one of base.py.
+"""
+
+from decouple import config
+
+from .base import *  # noqa: F401,F403
+from .base import INSTALLED_APPS, MIDDLEWARE
+
+API_DOCS = config("API_DOCS", cast=bool, default=True)
+DEBUG_TOOLBAR = config("SHOW_DEBUGGER_TOOLBAR", cast=bool, default=False)
+
+if not config("DEV_SHARED_CACHE", cast=bool, default=False):
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    SHARED_CACHE_REQUIRED = False
+
+if API_DOCS:
+    INSTALLED_APPS = [*INSTALLED_APPS, "drf_yasg"]
+    SWAGGER_SETTINGS = {
+        "DEFAULT_AUTO_SCHEMA_CLASS": "core.swagger_custom_tag.CustomAutoSchema",
+        "TAGS_SORTER": "alpha",
+        "OPERATIONS_SORTER": "alpha",
+    }
+
+if DEBUG_TOOLBAR:
+    INSTALLED_APPS = [*INSTALLED_APPS, "debug_toolbar"]
+    MIDDLEWARE = [*MIDDLEWARE, "debug_toolbar.middleware.DebugToolbarMiddleware"]
+    INTERNAL_IPS = ["127.0.0.1"]
@@ -0,0 +1,6 @@
+"""
+Production profile: the shared settings, without dev-only apps,
+middleware or URLs (drf-yasg and the debug toolbar are never imported).
+"""
+
+from .base import *  # noqa: F401,F403
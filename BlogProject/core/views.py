@@ -0,0 +1,32 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .metrics import prometheus_text, registry
+
+
+class PrometheusRenderer(BaseRenderer):
+    media_type = "text/plain"
+    format = "prometheus"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get("response")
+        if response is not None and response.exception:
+            # errors (403...) keep a readable body
+            return str(data.get("detail", "")).encode()
+        return prometheus_text(data).encode()
+
+
+class MetricsView(APIView):
+    """
+    Request metrics of this server process (see core.metrics), as JSON
+    or, with ?format=prometheus or `Accept: text/plain`, for Prometheus.
+    """
+
+    permission_classes = [IsAdminUser]
+    renderer_classes = [JSONRenderer, PrometheusRenderer]
+
+    def get(self, request):
+        return Response(registry.snapshot())
@@ -0,0 +1,134 @@
+"""
+Pass/fail logic of the load tests, kept apart from locust so it can be
+tested on its own.
+
+A run is summarised as a report: response time percentiles and failure
+ratio per endpoint name, then checked against the SLO file (absolute
+limits) and, when given, a baseline report from an earlier run
+(relative regressions). The run fails if any check fails.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+PERCENTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+REPORT_VERSION = 1
+# fewer samples than this make percentiles noise: such endpoints are
+# reported but not checked
+MIN_REQUESTS = 20
+# regressions smaller than this (ms) are ignored whatever the ratio, so
+# a 2 ms endpoint going to 3 ms does not fail a run
+MIN_REGRESSION_MS = 10
+
+
+def endpoint_stats(entries):
+    """
+    Return {name: stats} from locust StatsEntry objects. Request names
+    carry the method ("GET /posts"), so they are unique on their own.
+    """
+    endpoints = {}
+    for entry in entries:
+        if not entry.num_requests:
+            continue
+        endpoints[entry.name] = entry_stats(entry)
+    return endpoints
+
+
+def entry_stats(entry):
+    stats = {
+        "requests": entry.num_requests,
+        "failures": entry.num_failures,
+        "failure_ratio": round(entry.num_failures / max(entry.num_requests, 1), 4),
+        "rps": round(entry.total_rps, 2),
+        "max": round(entry.max_response_time or 0, 1),
+    }
+    for label, fraction in PERCENTILES.items():
+        stats[label] = entry.get_response_time_percentile(fraction)
+    return stats
+
+
+def load_slos(path):
+    """
+    Read the SLO file: {"defaults": limits, "endpoints": {name: limits}}
+    where limits map p50/p95/p99 (ms) and failure_ratio to maxima.
+    """
+    slos = json.loads(Path(path).read_text())
+    unknown = {
+        key
+        for limits in [slos.get("defaults", {}), *slos.get("endpoints", {}).values()]
+        for key in limits
+    } - {*PERCENTILES, "failure_ratio"}
+    if unknown:
+        raise ValueError(f"Unknown SLO keys: {', '.join(sorted(unknown))}")
+    return slos
+
+
+def check(endpoint, metric, value, limit, kind):
+    return {
+        "endpoint": endpoint,
+        "metric": metric,
+        "value": value,
+        "limit": limit,
+        "kind": kind,
+        "passed": value <= limit,
+    }
+
+
+def check_slos(endpoints, slos):
+    """
+    Check every endpoint that ran against its limits, or the defaults
+    (endpoints of scenarios left out of the run are not checked).
+    """
+    defaults = slos.get("defaults", {})
+    configured = slos.get("endpoints", {})
+    checks = []
+    for name, stats in sorted(endpoints.items()):
+        limits = {**defaults, **configured.get(name, {})}
+        for metric, limit in limits.items():
+            if metric in PERCENTILES and stats["requests"] < MIN_REQUESTS:
+                continue
+            checks.append(check(name, metric, stats[metric], limit, "slo"))
+    return checks
+
+
+def check_baseline(endpoints, baseline, tolerance):
+    """
+    Fail percentiles more than `tolerance` (0.2: 20%) above the baseline
+    report's, for endpoints present in both runs.
+    """
+    checks = []
+    for name, stats in sorted(endpoints.items()):
+        previous = baseline["endpoints"].get(name)
+        if not previous or min(stats["requests"], previous["requests"]) < MIN_REQUESTS:
+            continue
+        for metric in PERCENTILES:
+            limit = max(
+                previous[metric] * (1 + tolerance), previous[metric] + MIN_REGRESSION_MS
+            )
+            checks.append(check(name, metric, stats[metric], limit, "baseline"))
+    return checks
+
+
+def build_report(endpoints, total, checks, run=None):
+    return {
+        "version": REPORT_VERSION,
+        "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "run": run or {},
+        "passed": all(item["passed"] for item in checks),
+        "total": total,
+        "endpoints": endpoints,
+        "checks": checks,
+    }
+
+
+def read_report(path):
+    report = json.loads(Path(path).read_text())
+    if report.get("version") != REPORT_VERSION:
+        raise ValueError(f"Unsupported report version {report.get('version')}")
+    return report
+
+
+def write_report(path, report):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(report, indent=2) + "\n")
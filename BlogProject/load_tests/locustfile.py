@@ -1,131 +1,423 @@
-from locust import HttpUser, task, between
+"""
+Load test scenarios for the blog API.
+
+Seed the data first, so every machine runs against the same dataset:
+
+    python manage.py insert_data --users 1000 --posts 100000 --export dataset/
+    python manage.py load_dataset dataset/      # or reuse a dataset elsewhere
+
+then run headless with the settings of locust.conf:
+
+    locust -f load_tests/locustfile.py --config load_tests/locust.conf
+
+Pass user class names (e.g. AnonymousReader) to run a single scenario.
+At the end of the run the per-endpoint percentiles are checked against
+slo.json and, with --baseline, against an earlier report; the JSON
+report is written to --report and the process exits 1 on any failure.
+"""
+
+import json
+import logging
 import random
 import uuid
+from pathlib import Path
+
+import harness
+from faker.providers.lorem.en_US import Provider as LoremProvider
+from locust import HttpUser, between, events, task
 
 API_PREFIX = "/api/v1"
+HERE = Path(__file__).parent
+# accounts created by `insert_data --users`
+SEED_EMAIL = "seed{}@example.com"
+SEED_PASSWORD = "TestPass123!"
+# the posts' vocabulary (see blog.seeding)
+SEARCH_WORDS = LoremProvider.word_list
+PAGE_SIZE = 10
 
+logger = logging.getLogger(__name__)
 
-class TestUser(HttpUser):
-    wait_time = between(0.5, 2.0)  # think time شبیه انسان
 
-    def on_start(self):
-        self.token = None
-        self.post_ids = []
-        self.category_names = []
+@events.init_command_line_parser.add_listener
+def add_arguments(parser):
+    parser.add_argument(
+        "--dataset",
+        help="Dataset directory (see load_dataset): its manifest gives the "
+        "post ids and seeded accounts to use",
+    )
+    parser.add_argument(
+        "--seed-users",
+        type=int,
+        default=10,
+        help="Seeded accounts to log in with when no --dataset is given",
+    )
+    parser.add_argument(
+        "--slo-file", default=str(HERE / "slo.json"), help="Per-endpoint limits"
+    )
+    parser.add_argument("--baseline", help="Report of an earlier run to compare with")
+    parser.add_argument(
+        "--regression-tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed percentile increase over the baseline (0.2: 20%%)",
+    )
+    parser.add_argument("--report", help="Write the JSON run report here")
 
-        user_info = {
-            "email": "mohammadi.tik@gmail.com",
-            "password": "1523612mA!"
-        }
 
-        # Login and set token
+class Dataset:
+    """What the scenarios know about the data under test."""
 
-        # Approach 1
-        with self.client.post(
-                f"{API_PREFIX}/accounts/auth/jwt/create/", json=user_info,
-                name="AUTH /jwt/create", catch_response=True, ) as resp:
+    post_ids = None
+    # the categories insert_data creates
+    category_ids = (1, 10)
+    users = 0
 
-            if resp.status_code != 200:
-                resp.failure(f"Login failed: {resp.status_code} - {resp.text[:200]}")
-                return
+    @classmethod
+    def load(cls, options):
+        cls.users = options.seed_users
+        if not options.dataset:
+            return
+        manifest = json.loads((Path(options.dataset) / "manifest.json").read_text())
+        tables = manifest["tables"]
+        if tables["blog.Post"]["rows"]:
+            cls.post_ids = tuple(tables["blog.Post"]["ids"])
+        if tables["blog.Category"]["rows"]:
+            cls.category_ids = tuple(tables["blog.Category"]["ids"])
+        cls.users = manifest["meta"].get("users") or cls.users
 
-            data = resp.json()
-            token = data.get("access")
-            if not token:
-                resp.failure("Login response missing 'access' token")
-                return
+    @classmethod
+    def random_post_id(cls):
+        return random.randint(*cls.post_ids) if cls.post_ids else None
 
-            self.token = token
-            resp.success()
+    @classmethod
+    def random_category_id(cls):
+        return random.randint(*cls.category_ids)
 
-        # Approach 2
-        '''
-        response=self.client.post(f'{API_PREFIX}/accounts/auth/jwt/create/',json=data, name="POST /jwt/create")
-        response.raise_for_status()
-        token = response.json().get("access",None)
-        self.client.headers.update({'Authorization': f'Bearer {token}'})
-        '''
+    @classmethod
+    def random_credentials(cls):
+        email = SEED_EMAIL.format(random.randrange(max(cls.users, 1)))
+        return {"email": email, "password": SEED_PASSWORD}
 
-        # 2) Warm up: fetch categories + initial post list
-        self._load_categories()
-        self._load_post_ids()
 
-    def _auth_headers(self):
-        # If token missing, requests will likely fail; we keep it explicit.
-        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+@events.init.add_listener
+def on_init(environment, **kwargs):
+    if environment.parsed_options:
+        Dataset.load(environment.parsed_options)
 
-    def _load_categories(self):
-        with self.client.get(
-                f"{API_PREFIX}/blog/category/",
-                headers=self._auth_headers(),
-                name="GET /categories (warmup)",
-                catch_response=True,
-        ) as resp:
-            if resp.status_code != 200:
-                resp.failure(f"Category fetch failed: {resp.status_code}")
-                return
 
-            data = resp.json()
-            self.category_names = [c["name"] for c in data if "name" in c]
-            resp.success()
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    options = environment.parsed_options
+    if options is None:
+        return
+    stats = environment.stats
+    endpoints = harness.endpoint_stats(stats.entries.values())
+    checks = harness.check_slos(endpoints, harness.load_slos(options.slo_file))
+    if options.baseline:
+        checks += harness.check_baseline(
+            endpoints,
+            harness.read_report(options.baseline),
+            options.regression_tolerance,
+        )
+    report = harness.build_report(
+        endpoints,
+        harness.entry_stats(stats.total),
+        checks,
+        run={
+            "host": environment.host,
+            "users": options.num_users,
+            "run_time": options.run_time,
+            "user_classes": [cls.__name__ for cls in environment.user_classes],
+        },
+    )
+    if options.report:
+        harness.write_report(options.report, report)
 
-    def _load_post_ids(self):
-        with self.client.get(
-                f"{API_PREFIX}/blog/post/?page=1",
-                headers=self._auth_headers(),
-                name="GET /posts (warmup)",
-                catch_response=True,
-        ) as resp:
-            if resp.status_code != 200:
-                resp.failure(f"Post list warmup failed: {resp.status_code}")
-                return
+    for item in checks:
+        if not item["passed"]:
+            logger.error(
+                "%s failed: %s %s = %s > %s",
+                item["kind"].upper(),
+                item["endpoint"],
+                item["metric"],
+                item["value"],
+                item["limit"],
+            )
+    if not report["passed"]:
+        environment.process_exit_code = 1
+
+
+class BlogUser(HttpUser):
+    abstract = True
+    wait_time = between(0.5, 2.0)  # human-like think time
+
+    def on_start(self):
+        if Dataset.post_ids is None:
+            self.discover_posts()
 
-            data = resp.json()
-            results = data.get("results", [])
-            self.post_ids = [p["id"] for p in results if "id" in p]
+    def discover_posts(self):
+        # without a dataset manifest, read posts among the newest ones
+        resp = self.expect(
+            "GET",
+            f"{API_PREFIX}/blog/post/",
+            "GET /posts (warmup)",
+            params={"page_size": PAGE_SIZE},
+        )
+        ids = [post["id"] for post in resp.json()["results"]] if resp else []
+        if ids:
+            Dataset.post_ids = (min(ids), max(ids))
+
+    def expect(self, method, url, name, statuses=(200,), **kwargs):
+        """
+        Send a request, marking it failed unless it answers one of
+        `statuses`; return the response, or None on failure.
+        """
+        with self.client.request(
+            method, url, name=name, catch_response=True, **kwargs
+        ) as resp:
+            if resp.status_code not in statuses:
+                resp.failure(f"{resp.status_code} - {resp.text[:200]}")
+                return None
             resp.success()
+            return resp
 
-    @task(6)
-    def get_post_list(self):
-        self.client.get(f"{API_PREFIX}/blog/post/", headers=self._auth_headers(), name="GET /posts")
+    def get_post(self, name="GET /posts/:id", **kwargs):
+        post_id = Dataset.random_post_id()
+        if post_id is None:
+            return
+        # gaps in the ids (deleted posts) are expected
+        self.expect(
+            "GET",
+            f"{API_PREFIX}/blog/post/{post_id}/",
+            name,
+            statuses=(200, 404),
+            **kwargs,
+        )
 
-    @task(2)
-    def post_detail(self):
-        if self.post_ids:
-            post_id = random.choice(self.post_ids)
-        else:
-            post_id = random.randint(41, 50)
-        self.client.get(f"{API_PREFIX}/blog/post/{post_id}/", headers=self._auth_headers(), name="GET /posts/:id")
+
+class AuthenticatedUser(BlogUser):
+    abstract = True
+
+    def on_start(self):
+        super().on_start()
+        self.token = None
+        resp = self.expect(
+            "POST",
+            f"{API_PREFIX}/accounts/auth/jwt/create/",
+            "POST /jwt/create",
+            json=Dataset.random_credentials(),
+        )
+        if resp is not None:
+            self.token = resp.json()["access"]
+
+    def auth_headers(self):
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+
+class AnonymousReader(BlogUser):
+    """Browses the post list and reads posts without logging in."""
+
+    weight = 10
+
+    @task(5)
+    def list_posts(self):
+        self.expect("GET", f"{API_PREFIX}/blog/post/", "GET /posts")
+
+    @task(4)
+    def read_post(self):
+        self.get_post()
 
     @task(1)
+    def filter_by_category(self):
+        self.expect(
+            "GET",
+            f"{API_PREFIX}/blog/post/",
+            "GET /posts?category",
+            params={"category": Dataset.random_category_id()},
+        )
+
+
+class AuthenticatedWriter(AuthenticatedUser):
+    """Logged-in author reading, writing and editing their own posts."""
+
+    weight = 2
+
+    def on_start(self):
+        super().on_start()
+        self.category_names = []
+        self.own_post_ids = []
+        resp = self.expect(
+            "GET",
+            f"{API_PREFIX}/blog/category/",
+            "GET /categories",
+            headers=self.auth_headers(),
+        )
+        if resp is not None:
+            self.category_names = [c["name"] for c in resp.json()]
+
+    @task(4)
+    def list_posts(self):
+        self.expect(
+            "GET", f"{API_PREFIX}/blog/post/", "GET /posts", headers=self.auth_headers()
+        )
+
+    @task(3)
+    def read_post(self):
+        self.get_post(headers=self.auth_headers())
+
+    @task(2)
     def create_post(self):
-        category_name = random.choice(self.category_names) if self.category_names else None
         payload = {
             "title": f"Load test post {uuid.uuid4().hex[:8]}",
-            "content": "Hello from locust",
-            "status": random.choice([True,False]),
-            "category": category_name,
+            "content": " ".join(random.choices(SEARCH_WORDS, k=200)),
+            "status": random.random() < 0.9,
+            "category": random.choice(self.category_names or [None]),
             "published_date": "2026-02-10T16:50:42.630Z",
         }
+        resp = self.expect(
+            "POST",
+            f"{API_PREFIX}/blog/post/",
+            "POST /posts",
+            statuses=(201,),
+            json=payload,
+            headers=self.auth_headers(),
+        )
+        if resp is not None:
+            self.own_post_ids.append(resp.json()["id"])
+
+    @task(1)
+    def edit_post(self):
+        if not self.own_post_ids:
+            return
+        self.expect(
+            "PATCH",
+            f"{API_PREFIX}/blog/post/{random.choice(self.own_post_ids)}/",
+            "PATCH /posts/:id",
+            json={"title": f"Edited {uuid.uuid4().hex[:8]}"},
+            headers=self.auth_headers(),
+        )
 
-        with self.client.post(
-                f"{API_PREFIX}/blog/post/",
-                json=payload,
-                headers=self._auth_headers(),
-                name="POST /posts",
-                catch_response=True,
-        ) as resp:
-            # If a permission / validation error occurs, it should be noted in the report
-            if resp.status_code not in (200, 201):
-                resp.failure(f"Create failed: {resp.status_code} - {resp.text[:200]}")
-                return
-            resp.success()
 
+class SearchUser(BlogUser):
+    """Runs full-text searches, sometimes narrowed to a category."""
+
+    weight = 3
+
+    @task(3)
+    def search(self):
+        terms = " ".join(random.sample(SEARCH_WORDS, random.randint(1, 2)))
+        self.expect(
+            "GET",
+            f"{API_PREFIX}/blog/post/",
+            "GET /posts?search",
+            params={"search": terms},
+        )
+
+    @task(1)
+    def search_in_category(self):
+        self.expect(
+            "GET",
+            f"{API_PREFIX}/blog/post/",
+            "GET /posts?search&category",
+            params={
+                "search": random.choice(SEARCH_WORDS),
+                "category": Dataset.random_category_id(),
+            },
+        )
+
+
+class DeepPaginationCrawler(BlogUser):
+    """
+    Crawls far into the post list, the way scrapers and "load more"
+    clients do: jumps to deep page numbers and walks cursor pages.
+    """
+
+    weight = 1
+    wait_time = between(0.1, 0.5)
+    # cursor pages walked before starting over from the first page
+    max_cursor_pages = 50
+
+    def on_start(self):
+        super().on_start()
+        self.cursor_url = None
+        self.cursor_pages = 0
+        self.pages = 1
+        resp = self.expect(
+            "GET",
+            f"{API_PREFIX}/blog/post/",
+            "GET /posts?page=N",
+            params={"page_size": PAGE_SIZE},
+        )
+        if resp is not None:
+            self.pages = resp.json()["total_pages"]
+
+    @task(1)
+    def deep_page(self):
+        # the far end of the list, where OFFSET costs the most
+        page = random.randint((self.pages + 1) // 2, self.pages)
+        self.expect(
+            "GET",
+            f"{API_PREFIX}/blog/post/",
+            "GET /posts?page=N",
+            params={"page": page, "page_size": PAGE_SIZE},
+        )
+
+    @task(3)
+    def next_cursor_page(self):
+        if self.cursor_url is None or self.cursor_pages >= self.max_cursor_pages:
+            self.cursor_url = (
+                f"{API_PREFIX}/blog/post/?paginate=cursor&page_size={PAGE_SIZE}"
+            )
+            self.cursor_pages = 0
+        resp = self.expect("GET", self.cursor_url, "GET /posts?paginate=cursor")
+        self.cursor_url = resp.json()["links"]["next"] if resp is not None else None
+        self.cursor_pages += 1
+
+
+class AuthChurnUser(BlogUser):
+    """
+    Short sessions: logs in with JWT and with a token, refreshes, then
+    logs out, stressing password hashing and token storage.
+    """
+
+    weight = 1
+    wait_time = between(1.0, 3.0)
 
     @task(2)
-    def get_post_category_list(self):
-        self.client.get(
-            f"{API_PREFIX}/blog/category/",
-            headers=self._auth_headers(),
-            name="GET /categories",
+    def jwt_session(self):
+        resp = self.expect(
+            "POST",
+            f"{API_PREFIX}/accounts/auth/jwt/create/",
+            "POST /jwt/create",
+            json=Dataset.random_credentials(),
+        )
+        if resp is None:
+            return
+        tokens = resp.json()
+        self.expect(
+            "POST",
+            f"{API_PREFIX}/accounts/auth/jwt/refresh/",
+            "POST /jwt/refresh",
+            json={"refresh": tokens["refresh"]},
+        )
+        self.get_post(headers={"Authorization": f"Bearer {tokens['access']}"})
+
+    @task(1)
+    def token_session(self):
+        resp = self.expect(
+            "POST",
+            f"{API_PREFIX}/accounts/auth/login/",
+            "POST /token/login",
+            json=Dataset.random_credentials(),
+        )
+        if resp is None:
+            return
+        headers = {"Authorization": f"Token {resp.json()['token']}"}
+        self.get_post(headers=headers)
+        self.expect(
+            "POST",
+            f"{API_PREFIX}/accounts/auth/logout/",
+            "POST /token/logout",
+            statuses=(204,),
+            headers=headers,
         )
@@ -0,0 +1,100 @@
+import json
+from types import SimpleNamespace
+
+import harness
+import pytest
+
+
+def stats(requests=100, failures=0, p50=10, p95=50, p99=90):
+    return {
+        "requests": requests,
+        "failures": failures,
+        "failure_ratio": failures / requests,
+        "p50": p50,
+        "p95": p95,
+        "p99": p99,
+    }
+
+
+def failed(checks):
+    return [(item["endpoint"], item["metric"]) for item in checks if not item["passed"]]
+
+
+class TestSlos:
+    slos = {
+        "defaults": {"p95": 100, "failure_ratio": 0.01},
+        "endpoints": {"GET /posts": {"p95": 40}},
+    }
+
+    def test_endpoint_limits_override_defaults(self):
+        checks = harness.check_slos(
+            {"GET /posts": stats(p95=50), "GET /posts/:id": stats(p95=50)}, self.slos
+        )
+
+        assert failed(checks) == [("GET /posts", "p95")]
+
+    def test_failure_ratio(self):
+        checks = harness.check_slos({"GET /posts/:id": stats(failures=2)}, self.slos)
+
+        assert failed(checks) == [("GET /posts/:id", "failure_ratio")]
+
+    def test_few_requests_skip_percentiles_only(self):
+        checks = harness.check_slos(
+            {"GET /posts": stats(requests=5, failures=1, p95=900)}, self.slos
+        )
+
+        assert failed(checks) == [("GET /posts", "failure_ratio")]
+
+    def test_unknown_keys_are_rejected(self, tmp_path):
+        path = tmp_path / "slo.json"
+        path.write_text(json.dumps({"defaults": {"p90": 10}}))
+
+        with pytest.raises(ValueError, match="p90"):
+            harness.load_slos(path)
+
+
+class TestBaseline:
+    def test_regression_beyond_tolerance_fails(self):
+        baseline = {"endpoints": {"GET /posts": stats(p50=100, p95=200, p99=300)}}
+        current = {"GET /posts": stats(p50=119, p95=250, p99=300)}
+
+        checks = harness.check_baseline(current, baseline, tolerance=0.2)
+
+        assert failed(checks) == [("GET /posts", "p95")]
+
+    def test_small_absolute_changes_pass(self):
+        baseline = {"endpoints": {"GET /posts": stats(p50=2, p95=4, p99=5)}}
+
+        checks = harness.check_baseline(
+            {"GET /posts": stats(p50=6, p95=12, p99=14)}, baseline, tolerance=0.2
+        )
+
+        assert checks and not failed(checks)
+
+    def test_new_endpoints_are_not_compared(self):
+        checks = harness.check_baseline(
+            {"GET /posts": stats()}, {"endpoints": {}}, tolerance=0.2
+        )
+
+        assert checks == []
+
+
+def test_report_round_trip(tmp_path):
+    entry = SimpleNamespace(
+        name="GET /posts",
+        num_requests=40,
+        num_failures=1,
+        total_rps=4.0,
+        max_response_time=120.0,
+        get_response_time_percentile=lambda fraction: int(fraction * 100),
+    )
+    endpoints = harness.endpoint_stats([entry])
+    checks = harness.check_slos(endpoints, {"defaults": {"p99": 50}})
+    path = tmp_path / "reports" / "run.json"
+
+    harness.write_report(path, harness.build_report(endpoints, {}, checks))
+    report = harness.read_report(path)
+
+    assert endpoints["GET /posts"]["p95"] == 95
+    assert report["passed"] is False
+    assert report["endpoints"] == endpoints